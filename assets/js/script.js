@@ -5,6 +5,20 @@ const CONFIG = {
     HINT_DISPLAY_DURATION: 1200,
     MEANING_DISPLAY_DURATION: 1500,
     ERROR_FLASH_DURATION: 300,
+    DATA_DIR: "data/",
+    ASSET_MANIFEST_URL: "data/assets.json",
+    SERVICE_WORKER_URL: "sw.js",
+    DICTIONARY_URL: "data/dictionary.json",
+    COMPACT_DICTIONARY_URL: "data/dictionary.compact.json",
+    SHARD_DIR: "data/shards/",
+    PREFIX_INDEX_URL: "data/dictionary.index.json",
+    VARIANTS_URL: "data/dictionary.variants.json",
+    HISTORY_DB_NAME: "kannadaCoach",
+    HISTORY_STORE: "history",
+    LEGACY_HISTORY_KEY: "kannadaCoachHistory",
+    LEGACY_HISTORY_LIMIT: 100, // Records kept by the localStorage fallback
+    LEGACY_HISTORY_SAVE_DELAY: 2000, // Batch fallback writes (ms)
+    PAINT_LATENCY_SAMPLES: 200,
 };
 
 // Global state variables
@@ -14,8 +28,19 @@ let currentCharIndex = 0;
 let typedSegments = [];
 let skippedSegments = [];
 let incorrectAttempts = [];
-let completedWords = [];
+let completedWords = []; // Oldest first
+let historyIndex = new Map(); // Kannada word -> history record
+let historyDB = null;
+let historyLoaded = null; // Promise settled once stored history is loaded
+let historySaveTimer = null; // Pending batched localStorage write
+let segmentElements = []; // Display nodes of the current word's segments
+let displayedWord = null;
+let displayedCharIndex = 0;
+let paintLatencies = [];
 let historyModal = null;
+let prefixIndex = null;
+let assetManifest = null; // Promise of the content-hashed asset manifest
+let acceptedVariants = new Map();
 
 // Cached DOM elements
 const elements = {
@@ -70,6 +95,256 @@ function addEventListeners() {
     });
 }
 
+/**
+ * Expand the compact interned dictionary format into word objects
+ * Segments are stored once in a flat [kn, tr, kn, tr, ...] table and
+ * entries are [kn, tr, en, segmentIndex, ...] rows
+ * @param {Object} data - Parsed compact dictionary
+ * @returns {Array<Object>} Word objects with kn, tr, en and segments
+ */
+function decodeCompactDictionary(data) {
+    const table = data.segments;
+    const segments = new Array(table.length / 2);
+    for (let i = 0; i < segments.length; i++) {
+        segments[i] = { kn: table[2 * i], tr: table[2 * i + 1] };
+    }
+
+    return data.entries.map((row) => {
+        const wordSegments = new Array(row.length - 3);
+        for (let i = 3; i < row.length; i++) {
+            wordSegments[i - 3] = segments[row[i]];
+        }
+        return { kn: row[0], tr: row[1], en: row[2], segments: wordSegments };
+    });
+}
+
+/**
+ * Load the manifest mapping data files to their content-hashed copies
+ * Always revalidated so a new build is picked up on the next load
+ * @async
+ * @returns {Promise<Object>} Manifest, empty if unavailable
+ */
+function loadAssetManifest() {
+    if (!assetManifest) {
+        assetManifest = fetch(CONFIG.ASSET_MANIFEST_URL, {
+            cache: "no-cache",
+        })
+            .then((response) => (response.ok ? response.json() : {}))
+            .catch((error) => {
+                console.warn("Asset manifest unavailable:", error);
+                return {};
+            });
+    }
+    return assetManifest;
+}
+
+/**
+ * Resolve a data URL to its content-hashed copy when one is listed
+ * @async
+ * @param {string} url - Plain URL below CONFIG.DATA_DIR
+ * @returns {Promise<string>} Hashed URL, or the plain URL
+ */
+async function resolveAssetURL(url) {
+    if (!url.startsWith(CONFIG.DATA_DIR)) return url;
+    const manifest = await loadAssetManifest();
+    const hashed =
+        manifest.assets && manifest.assets[url.slice(CONFIG.DATA_DIR.length)];
+    return hashed ? CONFIG.DATA_DIR + hashed : url;
+}
+
+/**
+ * Fetch and parse a JSON file
+ * Data files are fetched under their content-hashed names when available
+ * @async
+ * @param {string} url - URL of the JSON file
+ * @returns {Promise<*>} Parsed JSON data
+ */
+async function fetchJSON(url) {
+    const response = await fetch(await resolveAssetURL(url));
+    if (!response.ok) {
+        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+    }
+    return response.json();
+}
+
+/**
+ * Fetch the dictionary, preferring the compact format
+ * Falls back to the plain JSON dictionary if the compact file is unavailable
+ * @async
+ * @returns {Promise<Array<Object>>} Word objects
+ */
+async function fetchDictionary() {
+    try {
+        const data = await fetchJSON(CONFIG.COMPACT_DICTIONARY_URL);
+        return decodeCompactDictionary(data);
+    } catch (error) {
+        console.warn("Compact dictionary unavailable, using JSON:", error);
+        return fetchJSON(CONFIG.DICTIONARY_URL);
+    }
+}
+
+/**
+ * Pick a shard at random, weighted by its entry count
+ * Keeps the first word uniformly random across the whole dictionary
+ * @param {Array<Object>} shards - Shard records from the shard manifest
+ * @returns {number} Index of the chosen shard
+ */
+function pickRandomShard(shards) {
+    const total = shards.reduce((sum, shard) => sum + shard.count, 0);
+    let target = Math.random() * total;
+    for (let i = 0; i < shards.length; i++) {
+        target -= shards[i].count;
+        if (target < 0) return i;
+    }
+    return shards.length - 1;
+}
+
+/**
+ * Fetch and decode a single dictionary shard
+ * @async
+ * @param {Object} shard - Shard record from the shard manifest
+ * @returns {Promise<Array<Object>>} Word objects in the shard
+ */
+async function fetchShard(shard) {
+    const data = await fetchJSON(CONFIG.SHARD_DIR + shard.file);
+    return decodeCompactDictionary(data);
+}
+
+/**
+ * Fetch the remaining shards one after another in the background
+ * Words are appended to the dictionary as each shard arrives
+ * @async
+ * @param {Array<Object>} shards - Shard records still to be loaded
+ */
+async function prefetchShards(shards) {
+    for (const shard of shards) {
+        try {
+            const shardWords = await fetchShard(shard);
+            for (const word of shardWords) {
+                words.push(word);
+            }
+        } catch (error) {
+            console.error(`Error loading shard ${shard.file}:`, error);
+        }
+    }
+}
+
+/**
+ * Fetch the shard manifest and one random shard
+ * The other shards are prefetched in the background afterwards
+ * @async
+ * @returns {Promise<Array<Object>>} Word objects of the first shard
+ */
+async function fetchFirstShard() {
+    const manifest = await fetchJSON(CONFIG.SHARD_DIR + "manifest.json");
+    const shards = manifest.shards.filter((shard) => shard.count > 0);
+    if (shards.length === 0) {
+        throw new Error("Shard manifest is empty");
+    }
+
+    const firstIndex = pickRandomShard(shards);
+    const firstWords = await fetchShard(shards[firstIndex]);
+    const remaining = shards.filter((_, i) => i !== firstIndex);
+    // Start after the first word is shown so it is not delayed
+    setTimeout(() => prefetchShards(remaining), 0);
+    return firstWords;
+}
+
+/**
+ * Load the transliteration prefix index on first use
+ * @async
+ * @returns {Promise<Object>} Index with sorted keys, entry ids and entries
+ */
+async function loadPrefixIndex() {
+    if (!prefixIndex) {
+        prefixIndex = await fetchJSON(CONFIG.PREFIX_INDEX_URL);
+    }
+    return prefixIndex;
+}
+
+/**
+ * Find the first position in a sorted array whose key is >= target
+ * @param {Array<string>} keys - Sorted keys
+ * @param {string} target - Key to search for
+ * @returns {number} Insertion position of target
+ */
+function lowerBound(keys, target) {
+    let low = 0;
+    let high = keys.length;
+    while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (keys[mid] < target) {
+            low = mid + 1;
+        } else {
+            high = mid;
+        }
+    }
+    return low;
+}
+
+/**
+ * Search the dictionary by transliteration prefix (e.g. "nam" -> ನಮಸ್ಕಾರ)
+ * Uses binary search over the prebuilt prefix index
+ * @async
+ * @param {string} query - Latin transliteration prefix
+ * @param {number} [limit=10] - Maximum number of results
+ * @returns {Promise<Array<Object>>} Matching entries with kn, tr and en
+ */
+async function searchDictionary(query, limit = 10) {
+    const prefix = query.trim().toLowerCase();
+    if (!prefix) return [];
+
+    const index = await loadPrefixIndex();
+    const results = [];
+    const seen = new Set();
+    for (
+        let i = lowerBound(index.keys, prefix);
+        i < index.keys.length &&
+        results.length < limit &&
+        index.keys[i].startsWith(prefix);
+        i++
+    ) {
+        const id = index.ids[i];
+        if (!seen.has(id)) {
+            seen.add(id);
+            const [kn, tr, en] = index.entries[id];
+            results.push({ kn, tr, en });
+        }
+    }
+    return results;
+}
+
+/**
+ * Load the precomputed accepted transliteration variants
+ * Each list becomes a Set once here so answer checks are a single lookup
+ * @async
+ */
+async function loadAcceptedVariants() {
+    try {
+        const data = await fetchJSON(CONFIG.VARIANTS_URL);
+        const variants = new Map();
+        for (const [tr, accepted] of Object.entries(data.variants)) {
+            variants.set(tr, new Set(accepted));
+        }
+        acceptedVariants = variants;
+    } catch (error) {
+        // Fall back to exact matching
+        console.warn("Accepted variants unavailable:", error);
+    }
+}
+
+/**
+ * Check whether typed input is an accepted spelling of a segment
+ * @param {string} input - Transliteration typed by the user
+ * @param {string} expected - Canonical segment transliteration
+ * @returns {boolean} True for the canonical spelling or an accepted variant
+ */
+function isAcceptedTransliteration(input, expected) {
+    if (input === expected) return true;
+    const variants = acceptedVariants.get(expected);
+    return variants !== undefined && variants.has(input);
+}
+
 /**
  * Load dictionary from JSON file with error handling and loading states
  * Shows loading indicator while fetching and handles success/error cases
@@ -80,12 +355,14 @@ async function loadDictionary() {
         // Show loading indicator
         elements.loadingIndicator.style.display = "flex";
         elements.loadingIndicator.classList.remove("hidden");
+        loadAcceptedVariants();
 
-        const response = await fetch("data/dictionary.json");
-        if (!response.ok) {
-            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+        try {
+            words = await fetchFirstShard();
+        } catch (error) {
+            console.warn("Dictionary shards unavailable:", error);
+            words = await fetchDictionary();
         }
-        words = await response.json();
         if (!words || words.length === 0) {
             throw new Error("Dictionary is empty or invalid");
         }
@@ -146,7 +423,7 @@ function showMeaning() {
 
     // Add completed word to history
     addToHistory({
-        kannada: currentWord.segments.map((seg) => seg.ka).join(""),
+        kannada: currentWord.kn,
         transliteration: currentWord.segments.map((seg) => seg.tr).join(""),
         meaning: currentWord.en,
     });
@@ -206,6 +483,10 @@ function moveToNextChar() {
  * @param {KeyboardEvent} event - The keyboard event object
  */
 function handleKey(event) {
+    if (event.key === " " || event.key === "Enter") {
+        measurePaintLatency(event.timeStamp);
+    }
+
     if (event.key === " ") {
         event.preventDefault();
         // Space only validates and moves to next character
@@ -234,7 +515,7 @@ function validateCurrentInput() {
     const expectedSegment = currentWord.segments[currentCharIndex].tr;
     if (!expectedSegment) return; // Safety check for segment
 
-    if (currentSegment === expectedSegment) {
+    if (isAcceptedTransliteration(currentSegment, expectedSegment)) {
         // Correct input - flash character green
         flashCurrentCharacter("correct");
         typedSegments[currentCharIndex] = currentSegment;
@@ -264,46 +545,120 @@ function validateCurrentInput() {
     }
 }
 
+/**
+ * Build the display nodes for the current word
+ * Called once per word; later steps only update the affected segments
+ */
+function buildKannadaDisplay() {
+    const fragment = document.createDocumentFragment();
+    segmentElements = currentWord.segments.map((segment) => {
+        const container = document.createElement("div");
+        container.className = "kannada-char-container";
+        const char = document.createElement("span");
+        char.textContent = segment.kn;
+        container.appendChild(char);
+        fragment.appendChild(container);
+        return { container, char, transliteration: null };
+    });
+    elements.kannadaWord.replaceChildren(fragment);
+    displayedWord = currentWord;
+}
+
+/**
+ * Show the state of one segment: typed, skipped, current or pending
+ * @param {number} i - Segment index
+ */
+function renderSegment(i) {
+    const nodes = segmentElements[i];
+    const segment = currentWord.segments[i];
+
+    if (i < currentCharIndex) {
+        // Character was skipped after 4 wrong attempts or typed correctly
+        nodes.char.className = skippedSegments[i]
+            ? "kannada-skipped-char"
+            : "kannada-typed-correct";
+        if (!nodes.transliteration) {
+            nodes.transliteration = document.createElement("span");
+            nodes.transliteration.className = "transliteration";
+            nodes.container.appendChild(nodes.transliteration);
+        }
+        nodes.transliteration.textContent = skippedSegments[i]
+            ? segment.tr
+            : typedSegments[i] || segment.tr;
+    } else if (i === currentCharIndex) {
+        nodes.char.className = "kannada-current-char";
+    } else {
+        nodes.char.className = "kannada-pending-char";
+    }
+}
+
 /**
  * Update the Kannada word display with current progress
- * Shows typed, current, and pending characters with appropriate styling
+ * Shows typed, current, and pending characters with appropriate styling.
+ * A new word builds its nodes once; after that only the segments whose
+ * state changed since the last update are touched.
  */
 function updateKannadaDisplay() {
-    let kannadaHTML = "";
-
-    for (let i = 0; i < currentWord.segments.length; i++) {
-        const segment = currentWord.segments[i];
-
-        if (i < currentCharIndex) {
-            if (skippedSegments[i]) {
-                // Character was skipped after 4 wrong attempts
-                kannadaHTML += `<div class='kannada-char-container'>
-                    <span class='kannada-skipped-char'>${segment.kn}</span>
-                    <span class='transliteration'>${segment.tr}</span>
-                </div>`;
-            } else {
-                // Character has been typed correctly
-                kannadaHTML += `<div class='kannada-char-container'>
-                    <span class='kannada-typed-correct'>${segment.kn}</span>
-                    <span class='transliteration'>${
-                        typedSegments[i] || segment.tr
-                    }</span>
-                </div>`;
-            }
-        } else if (i === currentCharIndex) {
-            // Current character position
-            kannadaHTML += `<div class='kannada-char-container'>
-                <span class='kannada-current-char'>${segment.kn}</span>
-            </div>`;
-        } else {
-            // Not yet typed
-            kannadaHTML += `<div class='kannada-char-container'>
-                <span class='kannada-pending-char'>${segment.kn}</span>
-            </div>`;
+    if (
+        displayedWord !== currentWord ||
+        currentCharIndex < displayedCharIndex
+    ) {
+        buildKannadaDisplay();
+        for (let i = 0; i < segmentElements.length; i++) {
+            renderSegment(i);
+        }
+    } else {
+        const last = Math.min(currentCharIndex, segmentElements.length - 1);
+        for (let i = displayedCharIndex; i <= last; i++) {
+            renderSegment(i);
         }
     }
+    displayedCharIndex = currentCharIndex;
+}
+
+/**
+ * Record the time from a keystroke until the next frame is painted
+ * The timeout queued from requestAnimationFrame runs after that frame's
+ * paint. Samples are also added as performance measures for DevTools.
+ * @param {number} keystrokeTime - Event timestamp of the keystroke
+ */
+function measurePaintLatency(keystrokeTime) {
+    requestAnimationFrame(() => {
+        setTimeout(() => {
+            const latency = performance.now() - keystrokeTime;
+            paintLatencies.push(latency);
+            if (paintLatencies.length > CONFIG.PAINT_LATENCY_SAMPLES) {
+                paintLatencies.shift();
+            }
+            if (performance.measure) {
+                performance.measure("keystroke-to-paint", {
+                    start: keystrokeTime,
+                    duration: latency,
+                });
+            }
+        }, 0);
+    });
+}
 
-    elements.kannadaWord.innerHTML = kannadaHTML;
+/**
+ * Summarize recent keystroke-to-paint latencies
+ * Call from the browser console, e.g. getPaintLatencyStats()
+ * @returns {Object} Sample count and median, p95 and max in milliseconds
+ */
+function getPaintLatencyStats() {
+    const sorted = paintLatencies.slice().sort((a, b) => a - b);
+    if (sorted.length === 0) {
+        return { samples: 0, median: 0, p95: 0, max: 0 };
+    }
+    const last = sorted.length - 1;
+    const percentile = (fraction) =>
+        sorted[Math.min(last, Math.floor(fraction * sorted.length))];
+    return {
+        samples: sorted.length,
+        median: percentile(0.5),
+        p95: percentile(0.95),
+        max: percentile(1),
+    };
 }
 
 /**
@@ -406,10 +761,25 @@ function initializeTheme() {
     updateThemeButton(theme);
 }
 
+/**
+ * Register the service worker that caches the app for offline use
+ */
+function registerServiceWorker() {
+    if (typeof navigator === "undefined" || !("serviceWorker" in navigator)) {
+        return;
+    }
+    navigator.serviceWorker
+        .register(CONFIG.SERVICE_WORKER_URL)
+        .catch((error) => {
+            console.warn("Service worker registration failed:", error);
+        });
+}
+
 // Initialize app
 initializeDOMElements();
 initializeTheme();
 loadDictionary();
+registerServiceWorker();
 
 /**
  * Flash the current character with visual feedback
@@ -417,16 +787,15 @@ loadDictionary();
  * @param {string} type - Type of flash ("correct" or "incorrect")
  */
 function flashCurrentCharacter(type) {
-    const currentChar = document.querySelector(".kannada-current-char");
-    if (currentChar) {
-        const originalClass = currentChar.className;
-        if (type === "correct") {
-            currentChar.classList.add("flash-correct");
-        } else {
-            currentChar.classList.add("flash-incorrect");
-        }
+    const nodes = segmentElements[currentCharIndex];
+    if (nodes) {
+        // Removing only the flash class keeps any state set meanwhile
+        const currentChar = nodes.char;
+        const flashClass =
+            type === "correct" ? "flash-correct" : "flash-incorrect";
+        currentChar.classList.add(flashClass);
         setTimeout(() => {
-            currentChar.className = originalClass;
+            currentChar.classList.remove(flashClass);
         }, CONFIG.FLASH_DURATION);
     }
 }
@@ -436,65 +805,228 @@ function flashCurrentCharacter(type) {
  */
 function initializeHistory() {
     historyModal = elements.historyModal;
-    loadHistoryFromStorage();
+    historyLoaded = loadHistoryFromStorage();
+}
+
+/**
+ * Wrap an IndexedDB request in a promise
+ * @param {IDBRequest} request - Pending request
+ * @returns {Promise<*>} Request result
+ */
+function requestToPromise(request) {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+/**
+ * Open the history database, creating the store on first use
+ * Records are keyed by Kannada word and indexed by completion time
+ * @async
+ * @returns {Promise<IDBDatabase|null>} Database, or null without IndexedDB
+ */
+async function openHistoryDatabase() {
+    if (typeof indexedDB === "undefined") return null;
+
+    const request = indexedDB.open(CONFIG.HISTORY_DB_NAME, 1);
+    request.onupgradeneeded = () => {
+        const store = request.result.createObjectStore(CONFIG.HISTORY_STORE, {
+            keyPath: "kannada",
+        });
+        store.createIndex("completedAt", "completedAt");
+    };
+    return requestToPromise(request);
 }
 
 /**
- * Load history from localStorage
+ * Read the history list kept in localStorage
+ * A corrupt list is dropped so it cannot break loading again
+ * @returns {Array<Object>|null} Records oldest first, or null if none
  */
-function loadHistoryFromStorage() {
+function readLegacyHistory() {
+    const savedHistory = localStorage.getItem(CONFIG.LEGACY_HISTORY_KEY);
+    if (!savedHistory) return null;
+
+    let legacy = null;
     try {
-        const savedHistory = localStorage.getItem("kannadaCoachHistory");
-        if (savedHistory) {
-            completedWords = JSON.parse(savedHistory);
+        legacy = JSON.parse(savedHistory);
+    } catch (error) {
+        legacy = null;
+    }
+    // The legacy list is most recent first
+    if (Array.isArray(legacy)) return legacy.reverse();
+
+    console.warn("Dropping unreadable saved history");
+    localStorage.removeItem(CONFIG.LEGACY_HISTORY_KEY);
+    return null;
+}
+
+/**
+ * Move history saved by older versions from localStorage into IndexedDB
+ * @async
+ */
+async function migrateLegacyHistory() {
+    const legacy = readLegacyHistory();
+    if (!legacy) return;
+
+    const transaction = historyDB.transaction(
+        CONFIG.HISTORY_STORE,
+        "readwrite"
+    );
+    const store = transaction.objectStore(CONFIG.HISTORY_STORE);
+    legacy.forEach((item, index) => {
+        store.put({ ...item, completedAt: index });
+    });
+    await new Promise((resolve, reject) => {
+        transaction.oncomplete = resolve;
+        transaction.onerror = () => reject(transaction.error);
+    });
+    localStorage.removeItem(CONFIG.LEGACY_HISTORY_KEY);
+}
+
+/**
+ * Replace the in-memory history with loaded records
+ * Words completed while loading are kept after the loaded ones
+ * @param {Array<Object>} records - History records, oldest first
+ */
+function setHistory(records) {
+    const pending = completedWords;
+    completedWords = [];
+    historyIndex = new Map();
+    for (const record of records.concat(pending)) {
+        if (!historyIndex.has(record.kannada)) {
+            historyIndex.set(record.kannada, record);
+            completedWords.push(record);
+        }
+    }
+}
+
+/**
+ * Load history from IndexedDB, falling back to localStorage
+ * @async
+ */
+async function loadHistoryFromStorage() {
+    try {
+        historyDB = await openHistoryDatabase();
+    } catch (error) {
+        console.warn("History database unavailable:", error);
+        historyDB = null;
+    }
+
+    try {
+        if (historyDB) {
+            await migrateLegacyHistory();
+            const records = await requestToPromise(
+                historyDB
+                    .transaction(CONFIG.HISTORY_STORE, "readonly")
+                    .objectStore(CONFIG.HISTORY_STORE)
+                    .index("completedAt")
+                    .getAll()
+            );
+            setHistory(records);
+        } else {
+            const legacy = readLegacyHistory();
+            if (legacy) {
+                setHistory(legacy);
+            }
         }
     } catch (error) {
         console.error("Error loading history:", error);
-        completedWords = [];
     }
 }
 
 /**
- * Save history to localStorage
+ * Save history to localStorage when IndexedDB is unavailable
+ * Only the most recent LEGACY_HISTORY_LIMIT records are kept
  */
 function saveHistoryToStorage() {
+    clearTimeout(historySaveTimer);
+    historySaveTimer = null;
     try {
         localStorage.setItem(
-            "kannadaCoachHistory",
-            JSON.stringify(completedWords)
+            CONFIG.LEGACY_HISTORY_KEY,
+            JSON.stringify(
+                completedWords.slice(-CONFIG.LEGACY_HISTORY_LIMIT).reverse()
+            )
         );
     } catch (error) {
         console.error("Error saving history:", error);
     }
 }
 
+/**
+ * Save history to localStorage once per batch of completed words
+ * Pending words are saved when the page is hidden
+ */
+function scheduleHistorySave() {
+    if (historySaveTimer === null) {
+        historySaveTimer = setTimeout(
+            saveHistoryToStorage,
+            CONFIG.LEGACY_HISTORY_SAVE_DELAY
+        );
+    }
+}
+
+/**
+ * Write a pending batched save before the page is hidden or closed
+ */
+function flushHistorySave() {
+    if (historySaveTimer !== null) {
+        saveHistoryToStorage();
+    }
+}
+
+/**
+ * Persist one new history record
+ * With IndexedDB only the new record is written, off the main thread
+ * @param {Object} record - History record to store
+ */
+function saveHistoryRecord(record) {
+    // Words completed while history is loading are written afterwards
+    if (historyLoaded) {
+        historyLoaded.then(() => writeHistoryRecord(record));
+    } else {
+        writeHistoryRecord(record);
+    }
+}
+
+/**
+ * Write one history record to the active store
+ * @param {Object} record - History record to store
+ */
+function writeHistoryRecord(record) {
+    if (!historyDB) {
+        scheduleHistorySave();
+        return;
+    }
+
+    const request = historyDB
+        .transaction(CONFIG.HISTORY_STORE, "readwrite")
+        .objectStore(CONFIG.HISTORY_STORE)
+        .put(record);
+    request.onerror = () => {
+        console.error("Error saving history:", request.error);
+    };
+}
+
 /**
  * Add a completed word to history
  * @param {Object} wordData - The completed word data
  */
 function addToHistory(wordData) {
+    // Words already in history are not added again
+    if (historyIndex.has(wordData.kannada)) return;
+
     const historyItem = {
         kannada: wordData.kannada,
         transliteration: wordData.transliteration,
         meaning: wordData.meaning,
+        completedAt: Date.now(),
     };
-
-    // Check if this word is already in history to avoid duplicates
-    const existingIndex = completedWords.findIndex(
-        (item) => item.kannada === historyItem.kannada
-    );
-
-    if (existingIndex === -1) {
-        // Add to beginning of array (most recent first)
-        completedWords.unshift(historyItem);
-
-        // Keep only the last 100 entries to prevent excessive storage
-        if (completedWords.length > 100) {
-            completedWords = completedWords.slice(0, 100);
-        }
-
-        saveHistoryToStorage();
-    }
+    completedWords.push(historyItem);
+    historyIndex.set(historyItem.kannada, historyItem);
+    saveHistoryRecord(historyItem);
 }
 
 /**
@@ -539,8 +1071,10 @@ function updateHistoryDisplay() {
         return;
     }
 
-    // Create history items
-    completedWords.forEach((item, index) => {
+    // Create history items, most recent first
+    const fragment = document.createDocumentFragment();
+    for (let i = completedWords.length - 1; i >= 0; i--) {
+        const item = completedWords[i];
         const historyItem = document.createElement("div");
         historyItem.className = "history-item";
         historyItem.innerHTML = `
@@ -548,8 +1082,9 @@ function updateHistoryDisplay() {
             <div class="history-transliteration">${item.transliteration}</div>
             <div class="history-meaning">${item.meaning}</div>
         `;
-        historyList.appendChild(historyItem);
-    });
+        fragment.appendChild(historyItem);
+    }
+    historyList.appendChild(fragment);
 }
 
 /**
@@ -562,7 +1097,15 @@ function clearHistory() {
         )
     ) {
         completedWords = [];
-        saveHistoryToStorage();
+        historyIndex = new Map();
+        if (historyDB) {
+            historyDB
+                .transaction(CONFIG.HISTORY_STORE, "readwrite")
+                .objectStore(CONFIG.HISTORY_STORE)
+                .clear();
+        } else {
+            saveHistoryToStorage();
+        }
         updateHistoryDisplay();
     }
 }
@@ -571,3 +1114,11 @@ function clearHistory() {
 document.addEventListener("DOMContentLoaded", function () {
     initializeHistory();
 });
+
+// Save batched fallback history before the page goes away
+document.addEventListener("visibilitychange", function () {
+    if (document.visibilityState === "hidden") {
+        flushHistorySave();
+    }
+});
+window.addEventListener("pagehide", flushHistorySave);
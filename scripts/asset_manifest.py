@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Content-hashed copies of the client data files and their version manifest.
+
+Every file the web client fetches from data/ is copied to data/hashed/
+under a name containing a hash of its content, and data/assets.json maps
+the plain names to the hashed ones:
+
+    {"version": 1, "hash": "...",
+     "assets": {"dictionary.compact.json":
+                "hashed/dictionary.compact.3f2a1c9e04b7.json", ...},
+     "shell": {"index.html": "...", "assets/js/script.js": "...", ...}}
+
+Hashed files never change, so the client and its service worker (sw.js)
+cache them forever and only download a file again when its hash changes.
+The top-level ``hash`` covers the data and the app shell files; the
+service worker keys its cache on it, so run this script (or the
+dictionary build, which calls it) after changing index.html, the CSS or
+the JavaScript as well.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from dictionary_io import atomic_write
+from precompress import GZIP_SUFFIX
+
+ASSET_MANIFEST_VERSION = 1
+ASSET_MANIFEST_NAME = "assets.json"
+HASHED_DIR = "hashed"
+
+# Files under data/ that the client fetches. The plain dictionary.json is
+# only a fallback for a missing compact dictionary, so it is not hashed
+# and the service worker does not precache it.
+CLIENT_ASSETS = (
+    "dictionary.compact.json",
+    "dictionary.index.json",
+    "dictionary.variants.json",
+    "shards/*.json",
+)
+
+# App shell files, relative to the repository root
+SHELL_FILES = ("index.html", "assets/css/style.css", "assets/js/script.js")
+
+HASH_SIZE = 6
+
+_CHUNK_SIZE = 1 << 16
+
+
+def file_digest(path):
+    """Return a short hex digest of a file's content."""
+    digest = hashlib.blake2b(digest_size=HASH_SIZE)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hashed_name(name, digest):
+    """Insert a digest before the extension: a/b.json -> a/b.<digest>.json"""
+    root, ext = os.path.splitext(name)
+    return f"{root}.{digest}{ext}"
+
+
+def client_asset_names(data_dir, patterns=CLIENT_ASSETS):
+    """Return the existing client assets as paths relative to data_dir."""
+    names = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(os.path.join(data_dir, pattern))):
+            names.append(os.path.relpath(path, data_dir).replace(os.sep, "/"))
+    return names
+
+
+def _copy_atomic(source, target):
+    """Copy a file, replacing the target only once it is complete."""
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(source, "r", encoding="utf-8") as src:
+        with atomic_write(target) as dst:
+            shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+
+
+def write_asset_manifest(data_dir, names=None, base_dir=None):
+    """
+    Copy the client assets to hashed names and write data/assets.json.
+
+    Hashed copies that are no longer referenced are removed. Returns the
+    manifest.
+    """
+    if names is None:
+        names = client_asset_names(data_dir)
+    if base_dir is None:
+        base_dir = os.path.dirname(os.path.abspath(data_dir))
+
+    hashed_dir = os.path.join(data_dir, HASHED_DIR)
+    assets = {}
+    for name in names:
+        source = os.path.join(data_dir, name)
+        target_name = hashed_name(
+            f"{HASHED_DIR}/{name}", file_digest(source)
+        )
+        target = os.path.join(data_dir, target_name)
+        # Content-addressed: an existing file already has this content
+        if not os.path.exists(target):
+            _copy_atomic(source, target)
+        assets[name] = target_name
+
+    shell = {
+        name: file_digest(os.path.join(base_dir, name))
+        for name in SHELL_FILES
+        if os.path.exists(os.path.join(base_dir, name))
+    }
+
+    version = hashlib.blake2b(
+        json.dumps([assets, shell], sort_keys=True).encode("utf-8"),
+        digest_size=HASH_SIZE,
+    ).hexdigest()
+    manifest = {
+        "version": ASSET_MANIFEST_VERSION,
+        "hash": version,
+        "assets": assets,
+        "shell": shell,
+    }
+    with atomic_write(os.path.join(data_dir, ASSET_MANIFEST_NAME)) as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+
+    # Drop hashed copies and their gzip copies left over from earlier builds
+    referenced = {os.path.join(data_dir, name) for name in assets.values()}
+    for directory, _, files in os.walk(hashed_dir):
+        for file_name in files:
+            path = os.path.join(directory, file_name)
+            source = path.removesuffix(GZIP_SUFFIX)
+            if source not in referenced:
+                os.remove(path)
+
+    return manifest
+
+
+def main():
+    """Write hashed client assets and the manifest for data/."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description="Write content-hashed client assets and their manifest."
+    )
+    parser.add_argument(
+        "data_dir",
+        nargs="?",
+        default=os.path.join(base_dir, "data"),
+        help="directory holding the client data files",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    with profiling.stage("hash"):
+        manifest = write_asset_manifest(args.data_dir)
+
+    print(
+        f"Asset manifest saved to: "
+        f"{os.path.join(args.data_dir, ASSET_MANIFEST_NAME)}"
+    )
+    print(f"Version {manifest['hash']}, {len(manifest['assets'])} assets")
+    profiling.print_summary()
+
+
+if __name__ == "__main__":
+    main()
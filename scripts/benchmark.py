@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the transliteration and dictionary scripts.
+
+Generates realistic synthetic Kannada words from the rule tables and
+times the hot functions at several corpus sizes, reporting throughput,
+per-call latency percentiles and peak memory as JSON so runs can be
+compared across commits. Peak memory is traced in the benchmark process
+only; ``peak_memory_scope`` is "parent" for benchmarks that also do work
+in process-pool workers, whose memory is not included:
+
+    python benchmark.py --output before.json
+    python benchmark.py --compare before.json
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from correct_transliteration import (
+    BASE_CONSONANTS,
+    KANNADA_ANUSVARA,
+    KANNADA_VIRAMA,
+    VOWEL_MARKS,
+    VOWELS,
+    analyze_many,
+    segment_kannada_word,
+    transliterate_kannada_advanced,
+)
+from dictionary_io import iter_dictionary, write_dictionary
+from dictionary_store import DictionaryStore
+from fix_dictionary_segmentation import build_dictionary
+
+DEFAULT_SIZES = (1_000, 100_000, 1_000_000)
+LATENCY_PERCENTILES = (50, 90, 99)
+
+
+def generate_words(count, seed=0, max_syllables=4):
+    """
+    Yield synthetic Kannada words built from the rule tables.
+
+    Words are sequences of consonant or cluster syllables with optional
+    vowel marks and anusvara, an occasional leading standalone vowel and
+    an occasional final consonant with virama.
+    """
+    rng = random.Random(seed)
+    consonants = sorted(BASE_CONSONANTS)
+    vowels = sorted(VOWELS)
+    marks = sorted(VOWEL_MARKS)
+
+    for _ in range(count):
+        parts = []
+        if rng.random() < 0.15:
+            parts.append(rng.choice(vowels))
+        for _ in range(rng.randint(1, max_syllables)):
+            if rng.random() < 0.2:
+                # Two or three consonants joined by viramas
+                cluster = rng.choices(consonants, k=rng.choice((2, 2, 3)))
+                parts.append(KANNADA_VIRAMA.join(cluster))
+            else:
+                parts.append(rng.choice(consonants))
+            if rng.random() < 0.6:
+                parts.append(rng.choice(marks))
+            if rng.random() < 0.08:
+                parts.append(KANNADA_ANUSVARA)
+        if rng.random() < 0.1:
+            parts.append(rng.choice(consonants) + KANNADA_VIRAMA)
+        yield "".join(parts)
+
+
+def percentile(sorted_values, pct):
+    """Return the nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = round(pct / 100 * len(sorted_values)) - 1
+    return sorted_values[max(0, min(len(sorted_values) - 1, rank))]
+
+
+def measure_peak_memory(func):
+    """Run func under tracemalloc and return its peak allocation in bytes."""
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def bench_per_call(name, func, inputs):
+    """Time func on each input and summarize throughput and latency."""
+    latencies = []
+    perf_counter_ns = time.perf_counter_ns
+    start = perf_counter_ns()
+    for item in inputs:
+        call_start = perf_counter_ns()
+        func(item)
+        latencies.append(perf_counter_ns() - call_start)
+    elapsed = (perf_counter_ns() - start) / 1e9
+
+    def run_all():
+        for item in inputs:
+            func(item)
+
+    latencies.sort()
+    return {
+        "benchmark": name,
+        "words": len(inputs),
+        "seconds": elapsed,
+        "words_per_second": len(inputs) / elapsed if elapsed else 0.0,
+        "latency_us": {
+            **{
+                f"p{pct}": percentile(latencies, pct) / 1e3
+                for pct in LATENCY_PERCENTILES
+            },
+            "max": latencies[-1] / 1e3 if latencies else 0.0,
+        },
+        "peak_memory_bytes": measure_peak_memory(run_all),
+    }
+
+
+def bench_end_to_end(words):
+    """
+    Time the full dictionary rebuild that fix_dictionary_segmentation.py
+    runs, including the checker, the client sinks, the asset hashing and
+    the precompression, on a synthetic dictionary.
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, "input.jsonl")
+        data_dir = os.path.join(temp_dir, "data")
+        os.mkdir(data_dir)
+        output_path = os.path.join(data_dir, "dictionary.json")
+        write_dictionary(
+            (
+                {"kn": word, "tr": "", "en": "", "segments": []}
+                for word in words
+            ),
+            input_path,
+        )
+
+        def run():
+            # Ignore the previous run's manifest so every entry is rebuilt
+            build_dictionary(
+                input_path, output_path, full=True, progress=False
+            )
+
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        peak = measure_peak_memory(run)
+
+    return {
+        "benchmark": "fix_dictionary_segmentation",
+        "words": len(words),
+        "seconds": elapsed,
+        "words_per_second": len(words) / elapsed if elapsed else 0.0,
+        "latency_us": None,
+        "peak_memory_bytes": peak,
+        "peak_memory_scope": "parent",
+    }
+
+
+def bench_dictionary_load(words):
+    """
+    Time loading a segmented synthetic dictionary into a list of dicts and
+    into a DictionaryStore, and compare their memory.
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "dictionary.jsonl")
+        write_dictionary(
+            (
+                {"kn": word, "tr": tr, "en": "", "segments": segments}
+                for word, (segments, tr) in zip(words, analyze_many(words))
+            ),
+            path,
+        )
+
+        for name, load in (
+            ("load_dictionary_dicts", lambda: list(iter_dictionary(path))),
+            ("load_dictionary_store", lambda: DictionaryStore.load(path)),
+        ):
+            start = time.perf_counter()
+            load()
+            elapsed = time.perf_counter() - start
+            results.append(
+                {
+                    "benchmark": name,
+                    "words": len(words),
+                    "seconds": elapsed,
+                    "words_per_second": (
+                        len(words) / elapsed if elapsed else 0.0
+                    ),
+                    "latency_us": None,
+                    "peak_memory_bytes": measure_peak_memory(load),
+                }
+            )
+    return results
+
+
+def run_benchmarks(sizes, seed=0):
+    """Run every benchmark at every size and return the result records."""
+    results = []
+    for size in sizes:
+        words = list(generate_words(size, seed))
+
+        print(f"Benchmarking {size} words...", file=sys.stderr)
+        results.append(
+            bench_per_call(
+                "transliterate_kannada_advanced",
+                transliterate_kannada_advanced,
+                words,
+            )
+        )
+        results.append(
+            bench_per_call("segment_kannada_word", segment_kannada_word, words)
+        )
+        results.append(bench_end_to_end(words))
+        results.extend(bench_dictionary_load(words))
+    return results
+
+
+def git_revision():
+    """Return the current git commit hash, or None outside a checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare_reports(old, new):
+    """Print the throughput change of each benchmark against a baseline."""
+    baseline = {
+        (result["benchmark"], result["words"]): result
+        for result in old["results"]
+    }
+    print(
+        f"{'benchmark':<32} {'words':>9} {'before':>12} {'after':>12} "
+        f"{'change':>8}"
+    )
+    for result in new["results"]:
+        key = (result["benchmark"], result["words"])
+        if key not in baseline:
+            continue
+        before = baseline[key]["words_per_second"]
+        after = result["words_per_second"]
+        change = (after / before - 1) * 100 if before else 0.0
+        print(
+            f"{key[0]:<32} {key[1]:>9} {before:>12.0f} {after:>12.0f} "
+            f"{change:>+7.1f}%"
+        )
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark transliteration and dictionary rebuilds."
+    )
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=list(DEFAULT_SIZES),
+        help="number of synthetic words per run",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="generator seed")
+    parser.add_argument("--output", help="write the JSON report to a file")
+    parser.add_argument(
+        "--compare", help="baseline JSON report to compare throughput against"
+    )
+    args = parser.parse_args()
+
+    report = {
+        "commit": git_revision(),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": run_benchmarks(args.sizes, args.seed),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            compare_reports(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
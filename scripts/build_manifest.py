@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Build manifest for incremental dictionary rebuilds.
+
+The manifest records a content hash for every entry the rebuild wrote,
+covering the transliteration fields of every scheme it emitted, and a
+copy of the transliteration rule tables it used. On the next run an
+entry is reused as-is when its hash is known and none of the rule-table
+clusters it contains have changed since.
+"""
+
+import hashlib
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import correct_transliteration
+from dictionary_io import atomic_write
+
+MANIFEST_VERSION = 1
+
+# Rule tables whose contents determine segmentation output
+RULE_TABLE_NAMES = (
+    "BASE_CONSONANTS",
+    "VOWELS",
+    "VOWEL_MARKS",
+    "CLUSTER_MODIFIERS",
+    "CONJUNCTS",
+)
+
+
+def manifest_path_for(dict_path):
+    """Get the manifest path stored alongside a dictionary file."""
+    return dict_path + ".manifest.json"
+
+
+def current_rule_tables(schemes=()):
+    """
+    Return a snapshot of the rule tables in correct_transliteration,
+    including the tables of any extra transliteration schemes emitted.
+    """
+    tables = {
+        name: dict(getattr(correct_transliteration, name))
+        for name in RULE_TABLE_NAMES
+    }
+    tables["KANNADA_VIRAMA"] = {correct_transliteration.KANNADA_VIRAMA: ""}
+    for scheme in schemes:
+        scheme = correct_transliteration.get_scheme(scheme)
+        tables[f"scheme:{scheme.name}"] = scheme.rule_table()
+    return tables
+
+
+def rule_fingerprint(tables):
+    """Hash the rule tables into a short fingerprint."""
+    payload = json.dumps(tables, ensure_ascii=False, sort_keys=True)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def changed_clusters(old_tables, new_tables):
+    """Return the clusters whose rule was added, removed or changed."""
+    clusters = set()
+    for name in set(old_tables) | set(new_tables):
+        old = old_tables.get(name, {})
+        new = new_tables.get(name, {})
+        for cluster in set(old) | set(new):
+            if old.get(cluster) != new.get(cluster):
+                clusters.add(cluster)
+    return clusters
+
+
+def transliteration_fields(schemes=()):
+    """Return the ``tr`` field plus the field of each extra scheme."""
+    fields = ["tr"]
+    for scheme in schemes:
+        field = correct_transliteration.scheme_field(scheme)
+        if field not in fields:
+            fields.append(field)
+    return tuple(fields)
+
+
+def entry_hash(entry, fields=("tr",)):
+    """
+    Hash the fields of an entry that the rebuild produces: its kn and the
+    given transliteration fields of the entry and of every segment.
+    """
+    parts = [entry["kn"]]
+    parts.extend(entry.get(field, "") for field in fields)
+    for segment in entry.get("segments", ()):
+        parts.append(segment["kn"])
+        parts.extend(segment.get(field, "") for field in fields)
+    payload = "\x1f".join(parts).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def load_manifest(path):
+    """
+    Load a manifest, returning None if it is missing or was written by a
+    different manifest format or segmenter version.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if (
+        manifest.get("version") != MANIFEST_VERSION
+        or manifest.get("segmenter_version")
+        != correct_transliteration.SEGMENTER_VERSION
+    ):
+        return None
+    manifest["entries"] = set(manifest["entries"])
+    return manifest
+
+
+def save_manifest(path, tables, hashes):
+    """Atomically write a manifest for the given rule tables and hashes."""
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "segmenter_version": correct_transliteration.SEGMENTER_VERSION,
+        "fingerprint": rule_fingerprint(tables),
+        "rules": tables,
+        "entries": sorted(hashes),
+    }
+    with atomic_write(path) as f:
+        json.dump(manifest, f, ensure_ascii=False)
+
+
+class IncrementalPlan:
+    """
+    Decides which entries can be reused from a previous build. ``schemes``
+    names the extra transliteration schemes the build emits.
+    """
+
+    def __init__(self, manifest, tables, schemes=()):
+        self.tables = tables
+        self.fields = transliteration_fields(schemes)
+        self.known_hashes = manifest["entries"] if manifest else set()
+        self.affected_clusters = ()
+        if manifest and manifest["fingerprint"] != rule_fingerprint(tables):
+            self.affected_clusters = tuple(
+                changed_clusters(manifest["rules"], tables)
+            )
+        self.written_hashes = set()
+        self.reused = 0
+        self.rebuilt = 0
+
+    def check(self, entry):
+        """
+        Return ``(digest, reusable)`` for an input entry, where reusable is
+        True if the entry is unchanged since the last build.
+        """
+        if "segments" not in entry:
+            return None, False
+        digest = entry_hash(entry, self.fields)
+        if digest not in self.known_hashes:
+            return digest, False
+        kannada = entry["kn"]
+        reusable = not any(
+            cluster in kannada for cluster in self.affected_clusters
+        )
+        return digest, reusable
+
+    def record(self, entry, digest=None):
+        """
+        Remember an entry written by this build. ``digest`` is passed for
+        reused entries whose hash is already known.
+        """
+        if digest is None:
+            self.written_hashes.add(entry_hash(entry, self.fields))
+            self.rebuilt += 1
+        else:
+            self.written_hashes.add(digest)
+            self.reused += 1
+
+    def save(self, path):
+        """Write the manifest describing this build."""
+        save_manifest(path, self.tables, self.written_hashes)
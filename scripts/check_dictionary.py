@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Consistency checker for dictionary files.
+
+Streams a dictionary (JSON array or JSONL) through parallel chunks and
+verifies every entry:
+
+    segments_kn   the segment kn values join to the entry kn
+    segments_tr   the segment tr values join to the entry tr
+    roundtrip     each segment kn transliterates back to its tr
+    range         every character of kn is in the Kannada block or a
+                  word separator (space, ZWNJ, ZWJ)
+
+Violations are printed as a diff while the file is being read, so very
+large files report problems long before the check finishes:
+
+    @@ 12 ನಮಸ್ಕಾರ segments_tr
+    -namaskaaara
+    +namaskaara
+
+The exit status is 1 when any violation was found. The dictionary
+rebuild runs the checks in REBUILD_CHECKS on every entry through
+DictionaryChecker and fails before replacing any file.
+"""
+
+import argparse
+import collections
+import functools
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from correct_transliteration import (
+    KANNADA_RANGE,
+    map_chunks,
+    transliterate_kannada_advanced,
+)
+from dictionary_io import iter_dictionary
+
+CHECKS = ("segments_kn", "segments_tr", "roundtrip", "range")
+
+# Checks that can fail on entries the rebuild has just segmented. The
+# roundtrip check re-runs the engine that produced the segments, so it is
+# only useful on files from elsewhere.
+REBUILD_CHECKS = ("segments_kn", "segments_tr", "range")
+
+# Characters allowed between the words of multi-word entries
+WORD_SEPARATORS = frozenset(" \u200c\u200d")
+
+
+def check_entry(entry, checks=CHECKS):
+    """
+    Return the violations of one entry as ``(check, expected, actual)``
+    tuples; an empty list means the entry is consistent.
+    """
+    violations = []
+    kn = entry["kn"]
+    segments = entry["segments"]
+
+    if "segments_kn" in checks:
+        joined = "".join(segment["kn"] for segment in segments)
+        if joined != kn:
+            violations.append(("segments_kn", kn, joined))
+
+    if "segments_tr" in checks:
+        joined = "".join(segment["tr"] for segment in segments)
+        if joined != entry["tr"]:
+            violations.append(("segments_tr", entry["tr"], joined))
+
+    if "roundtrip" in checks:
+        for position, segment in enumerate(segments):
+            roundtrip = transliterate_kannada_advanced(segment["kn"])
+            if roundtrip != segment["tr"]:
+                violations.append(
+                    (
+                        f"roundtrip[{position}] {segment['kn']}",
+                        segment["tr"],
+                        roundtrip,
+                    )
+                )
+
+    if "range" in checks:
+        outside = [
+            char
+            for char in kn
+            if ord(char) not in KANNADA_RANGE and char not in WORD_SEPARATORS
+        ]
+        if outside:
+            violations.append(
+                (
+                    "range",
+                    "",
+                    " ".join(f"U+{ord(char):04X}" for char in outside),
+                )
+            )
+
+    return violations
+
+
+def _check_chunk(checks, entries):
+    """Check a chunk of entries in a worker."""
+    return [check_entry(entry, checks) for entry in entries]
+
+
+def check_dictionary(
+    entries, checks=CHECKS, chunksize=1000, executor=None, max_workers=None
+):
+    """
+    Check entries in parallel chunks and yield ``(index, entry,
+    violations)`` for every inconsistent entry, in input order.
+    """
+    for name in checks:
+        if name not in CHECKS:
+            raise ValueError(f"Unknown check: {name!r}")
+    checks = tuple(checks)
+
+    # Only the fields the checks read are sent to the workers
+    entries = (
+        {"kn": entry["kn"], "tr": entry["tr"], "segments": entry["segments"]}
+        for entry in entries
+    )
+    # Entries handed to the workers but not reported on yet; bounded by the
+    # chunk window of map_chunks
+    pending = collections.deque()
+
+    def remember():
+        for entry in entries:
+            pending.append(entry)
+            yield entry
+
+    results = map_chunks(
+        functools.partial(_check_chunk, checks),
+        remember(),
+        chunksize,
+        executor,
+        max_workers,
+    )
+    for index, violations in enumerate(results):
+        entry = pending.popleft()
+        if violations:
+            yield index, entry, violations
+
+
+def format_violation(index, entry, violation):
+    """Format one violation as a diff hunk."""
+    check, expected, actual = violation
+    lines = [f"@@ {index} {entry['kn']} {check}"]
+    if expected:
+        lines.append(f"-{expected}")
+    if actual:
+        lines.append(f"+{actual}")
+    return "\n".join(lines)
+
+
+class DictionaryCheckError(ValueError):
+    """Raised when a rebuilt dictionary has inconsistent entries."""
+
+
+class DictionaryChecker:
+    """
+    Check entries one at a time as they are produced.
+
+    Call ``add`` for each entry; violations are printed as they are found
+    and ``verify`` raises DictionaryCheckError if there were any. Runs the
+    REBUILD_CHECKS by default.
+    """
+
+    def __init__(self, checks=REBUILD_CHECKS):
+        self.checks = tuple(checks)
+        self.count = 0
+        self.bad_entries = 0
+
+    def add(self, entry):
+        """Check one dictionary entry."""
+        violations = check_entry(entry, self.checks)
+        if violations:
+            self.bad_entries += 1
+            for violation in violations:
+                print(format_violation(self.count, entry, violation))
+        self.count += 1
+
+    def verify(self):
+        """Raise DictionaryCheckError if any entry was inconsistent."""
+        if self.bad_entries:
+            raise DictionaryCheckError(
+                f"{self.bad_entries} of {self.count} entries are inconsistent"
+            )
+
+
+def main():
+    """Check data/dictionary.json (or the given file) for consistency."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description="Check dictionary entries for consistency."
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default=os.path.join(base_dir, "data", "dictionary.json"),
+        help="dictionary file to check",
+    )
+    parser.add_argument(
+        "--checks",
+        nargs="+",
+        choices=CHECKS,
+        default=list(CHECKS),
+        help="checks to run (default: all)",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=1000,
+        help="entries per parallel chunk",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=("process", "thread"),
+        help="worker pool type (default: process, thread on free-threaded)",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="number of parallel workers"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings and tokenizer branch counts",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    counts = dict.fromkeys(args.checks, 0)
+    bad_entries = 0
+    entries = profiling.timed_iter("load", iter_dictionary(args.input))
+    results = check_dictionary(
+        entries, args.checks, args.chunksize, args.executor, args.workers
+    )
+    for index, entry, violations in profiling.timed_iter("check", results):
+        bad_entries += 1
+        for violation in violations:
+            counts[violation[0].split("[")[0]] += 1
+            print(format_violation(index, entry, violation))
+
+    summary = ", ".join(f"{name}: {count}" for name, count in counts.items())
+    print(f"{bad_entries} inconsistent entries ({summary})", file=sys.stderr)
+    profiling.print_summary()
+    return 1 if bad_entries else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
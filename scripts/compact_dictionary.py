@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Compact interned dictionary format for the web client.
+
+Every distinct segment (a kn/tr pair) is stored once in a flat string
+table, and each entry refers to its segments by index:
+
+    {"version": 1,
+     "entries": [[kn, tr, en, seg_index, seg_index, ...], ...],
+     "segments": [seg0_kn, seg0_tr, seg1_kn, seg1_tr, ...]}
+
+The file is written without whitespace. assets/js/script.js decodes it
+back into the regular {"kn", "tr", "en", "segments"} entries.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from dictionary_io import atomic_write, iter_dictionary
+
+COMPACT_VERSION = 1
+
+_SEPARATORS = (",", ":")
+
+
+def compact_path_for(dict_path):
+    """Get the compact file path that belongs to a dictionary file."""
+    root, _ = os.path.splitext(dict_path)
+    return root + ".compact.json"
+
+
+class CompactDictionaryWriter:
+    """
+    Stream entries into a compact dictionary file.
+
+    Use as a context manager and call ``add`` for each entry; the segment
+    table is appended when the block exits and the file is then replaced
+    atomically.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._segment_ids = {}
+        self._segments = []
+        self._context = None
+        self._file = None
+
+    def __enter__(self):
+        self._context = atomic_write(self.path)
+        self._file = self._context.__enter__()
+        self._file.write(f'{{"version":{COMPACT_VERSION},"entries":[')
+        return self
+
+    def _intern(self, segment):
+        """Return the table index of a segment, adding it if new."""
+        key = (segment["kn"], segment["tr"])
+        index = self._segment_ids.get(key)
+        if index is None:
+            index = len(self._segment_ids)
+            self._segment_ids[key] = index
+            self._segments.extend(key)
+        return index
+
+    def add(self, entry):
+        """Append one dictionary entry."""
+        row = [entry["kn"], entry["tr"], entry["en"]]
+        row.extend([self._intern(segment) for segment in entry["segments"]])
+
+        if self.count:
+            self._file.write(",")
+        self._file.write(
+            json.dumps(row, ensure_ascii=False, separators=_SEPARATORS)
+        )
+        self.count += 1
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self._file.write('],"segments":')
+            self._file.write(
+                json.dumps(
+                    self._segments, ensure_ascii=False, separators=_SEPARATORS
+                )
+            )
+            self._file.write("}")
+        return self._context.__exit__(exc_type, exc, traceback)
+
+
+def write_compact_dictionary(entries, path):
+    """Write entries to a compact dictionary file and return the count."""
+    with CompactDictionaryWriter(path) as writer:
+        for entry in entries:
+            writer.add(entry)
+    return writer.count
+
+
+def decode_compact_dictionary(data):
+    """Expand parsed compact data back into regular dictionary entries."""
+    table = data["segments"]
+    segments = [
+        {"kn": table[i], "tr": table[i + 1]} for i in range(0, len(table), 2)
+    ]
+    return [
+        {
+            "kn": row[0],
+            "tr": row[1],
+            "en": row[2],
+            "segments": [dict(segments[index]) for index in row[3:]],
+        }
+        for row in data["entries"]
+    ]
+
+
+def main():
+    """Convert data/dictionary.json (or the given file) to compact form."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description="Convert a dictionary to the compact client format."
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default=os.path.join(base_dir, "data", "dictionary.json"),
+        help="dictionary file to convert",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    dict_path = args.input
+    compact_path = compact_path_for(dict_path)
+
+    entries = profiling.timed_iter("load", iter_dictionary(dict_path))
+    with profiling.stage("serialize"):
+        total = write_compact_dictionary(entries, compact_path)
+
+    original_size = os.path.getsize(dict_path)
+    compact_size = os.path.getsize(compact_path)
+    print(f"Compact dictionary saved to: {compact_path}")
+    print(f"Total entries: {total}")
+    print(f"Size: {original_size} -> {compact_size} bytes")
+    profiling.print_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Build a frequency-ranked dictionary from local Kannada text corpora.
+
+Text files are split into chunks and the byte ranges of the chunks are
+handed to a process pool through map_corpus_chunks, which keeps a
+bounded window of chunks in flight (see corpus_reader.py). Each worker
+reads its chunk from a memory map of the file, extracts Kannada word
+tokens (runs of characters in KANNADA_RANGE that start with a letter) and
+counts them in a Counter, which the parent merges as chunks complete. A
+worker that dies fails the run with BrokenProcessPool instead of leaving
+it waiting. The most frequent words are then selected with a heap
+instead of sorting the whole vocabulary, segmented, and written most
+frequent first:
+
+    python corpus_dictionary.py corpus/ --top 2000 -o data/frequent.json
+
+English meanings are left empty for translation.
+"""
+
+import argparse
+import collections
+import heapq
+import os
+import re
+import sys
+import unicodedata
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from correct_transliteration import (
+    BASE_CONSONANTS,
+    KANNADA_RANGE,
+    VOWELS,
+    analyze_many,
+)
+from corpus_reader import DEFAULT_CHUNK_SIZE, map_corpus_chunks
+from dictionary_io import write_dictionary
+
+DEFAULT_TOP = 1000
+CORPUS_SUFFIXES = (".txt",)
+
+_KANNADA_BLOCK = f"{chr(KANNADA_RANGE.start)}-{chr(KANNADA_RANGE.stop - 1)}"
+
+# A whole run of Kannada-block characters that starts with a letter, so
+# digits and runs beginning with a dangling sign are skipped
+_KANNADA_WORD = re.compile(
+    f"(?<![{_KANNADA_BLOCK}])"
+    f"[{''.join(sorted(BASE_CONSONANTS.keys() | VOWELS.keys()))}]"
+    f"[{_KANNADA_BLOCK}]*"
+)
+
+
+def iter_corpus_files(paths, suffixes=CORPUS_SUFFIXES):
+    """Yield the text files named by paths, searching directories."""
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, _, files in sorted(os.walk(path)):
+                for name in sorted(files):
+                    if name.endswith(suffixes):
+                        yield os.path.join(directory, name)
+        else:
+            yield path
+
+
+def kannada_words(text):
+    """Return the NFC-normalized Kannada word tokens of a text."""
+    if not unicodedata.is_normalized("NFC", text):
+        text = unicodedata.normalize("NFC", text)
+    return _KANNADA_WORD.findall(text)
+
+
+def _count_chunk(text):
+    """Count the words of one chunk in a worker."""
+    return collections.Counter(kannada_words(text))
+
+
+def count_corpus_words(
+    paths, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, executor=None
+):
+    """
+    Count Kannada words across text files and return a merged Counter.
+
+    Each worker reads only the chunk it is counting and map_corpus_chunks
+    bounds the chunks in flight, so memory use does not depend on the
+    corpus size. ``executor`` is passed to map_corpus_chunks.
+    """
+    counts = collections.Counter()
+    for chunk_counts in map_corpus_chunks(
+        _count_chunk, iter_corpus_files(paths), chunk_size, executor, workers
+    ):
+        counts.update(chunk_counts)
+    return counts
+
+
+def top_words(counts, n, min_count=1):
+    """
+    Return the ``n`` most frequent ``(word, count)`` pairs, most frequent
+    first. Selection uses a heap of size n; ties are broken by word so the
+    result does not depend on counting order.
+    """
+    candidates = (
+        (count, word) for word, count in counts.items() if count >= min_count
+    )
+    ranked = heapq.nlargest(n, candidates)
+    ranked.sort(key=lambda item: (-item[0], item[1]))
+    return [(word, count) for count, word in ranked]
+
+
+def iter_frequency_entries(ranked):
+    """Yield dictionary entries for ranked ``(word, count)`` pairs."""
+    analyses = analyze_many(word for word, _ in ranked)
+    for (word, _), (segments, transliteration) in zip(ranked, analyses):
+        yield {
+            "kn": word,
+            "tr": transliteration,
+            "en": "",
+            "segments": segments,
+        }
+
+
+def main():
+    """Build a frequency-ranked dictionary from corpus files."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description="Build a frequency-ranked dictionary from text corpora."
+    )
+    parser.add_argument(
+        "paths", nargs="+", help="text files or directories of .txt files"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=os.path.join(base_dir, "data", "frequency_dictionary.json"),
+        help="output path; a .jsonl suffix writes one entry per line",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help="number of most frequent words to keep",
+    )
+    parser.add_argument(
+        "--min-count",
+        type=int,
+        default=1,
+        help="ignore words seen fewer times than this",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="number of counting processes"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    with profiling.stage("count"):
+        counts = count_corpus_words(args.paths, args.workers)
+    with profiling.stage("rank"):
+        ranked = top_words(counts, args.top, args.min_count)
+
+    entries = profiling.timed_iter("segment", iter_frequency_entries(ranked))
+    with profiling.stage("serialize"):
+        total = write_dictionary(entries, args.output)
+
+    print(f"Distinct words: {len(counts)}")
+    print(f"Frequency dictionary saved to: {args.output}")
+    print(f"Total entries: {total}")
+    for word, count in ranked[:5]:
+        print(f"  {word}: {count}")
+    profiling.print_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped, chunked reader for large UTF-8 corpus files.
+
+A file is split into byte ranges of roughly ``chunk_size`` that always end
+on a safe boundary: just after a whitespace byte when there is one nearby,
+otherwise before a character that starts a new cluster. A chunk therefore
+never splits a UTF-8 sequence or a consonant+virama+consonant cluster.
+
+Chunks are sliced out of the mapping through a memoryview and decoded
+straight from it, without an intermediate bytes copy. Only the ranges
+are handed to worker processes, each of which maps the file itself, so
+peak memory depends on the chunk size and the number of chunks in
+flight, not on the file size:
+
+    for counts in map_corpus_chunks(count_words, ["big.txt"]):
+        total.update(counts)
+"""
+
+import argparse
+import functools
+import mmap
+import os
+import re
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from correct_transliteration import (
+    CHAR_ANUSVARA,
+    CHAR_MATRA,
+    CHAR_VIRAMA,
+    CHAR_VISARGA,
+    KANNADA_VIRAMA,
+    char_class,
+    map_chunks,
+)
+
+DEFAULT_CHUNK_SIZE = 8 << 20
+
+# How far past the nominal end of a chunk to look for whitespace before
+# falling back to a cluster boundary
+MAX_BOUNDARY_SCAN = 1 << 16
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+_WHITESPACE = re.compile(rb"[ \t\n\r\f\v]")
+
+# Classes of characters that continue the cluster before them
+_CONTINUING_CLASSES = (CHAR_MATRA, CHAR_VIRAMA, CHAR_ANUSVARA, CHAR_VISARGA)
+_JOINERS = ("\u200c", "\u200d")
+
+
+def _is_continuation(byte):
+    """Return True for a UTF-8 continuation byte."""
+    return 0x80 <= byte < 0xC0
+
+
+def _char_at(buffer, pos):
+    """Decode the character whose UTF-8 sequence starts at pos."""
+    lead = buffer[pos]
+    if lead < 0x80:
+        length = 1
+    elif lead < 0xE0:
+        length = 2
+    elif lead < 0xF0:
+        length = 3
+    else:
+        length = 4
+    return buffer[pos : pos + length].decode("utf-8", errors="replace")
+
+
+def _char_before(buffer, pos):
+    """Decode the character that ends just before pos."""
+    start = pos - 1
+    while start > 0 and _is_continuation(buffer[start]):
+        start -= 1
+    return _char_at(buffer, start)
+
+
+def _cluster_boundary(buffer, pos, size):
+    """
+    Return the first position at or after pos where a new cluster starts:
+    a character boundary that is not followed by a combining sign or joiner
+    and not preceded by a virama.
+    """
+    while pos < size:
+        while pos < size and _is_continuation(buffer[pos]):
+            pos += 1
+        if pos >= size or pos == 0:
+            return pos
+        char = _char_at(buffer, pos)
+        if (
+            char_class(char) not in _CONTINUING_CLASSES
+            and char not in _JOINERS
+            and _char_before(buffer, pos) != KANNADA_VIRAMA
+        ):
+            return pos
+        pos += 1
+    return size
+
+
+def safe_boundary(buffer, pos, size, max_scan=MAX_BOUNDARY_SCAN):
+    """Return the first safe chunk end at or after pos."""
+    if pos >= size:
+        return size
+    match = _WHITESPACE.search(buffer, pos, min(size, pos + max_scan))
+    if match is not None:
+        return match.end()
+    return _cluster_boundary(buffer, pos, size)
+
+
+def _iter_ranges(buffer, size, chunk_size):
+    """Yield the safe ``(start, end)`` ranges of a mapped buffer."""
+    start = len(_UTF8_BOM) if buffer[: len(_UTF8_BOM)] == _UTF8_BOM else 0
+    while start < size:
+        end = safe_boundary(buffer, start + chunk_size, size)
+        yield start, end
+        start = end
+
+
+def _open_mapping(f):
+    """Map an open file read-only; returns None for an empty file."""
+    if os.fstat(f.fileno()).st_size == 0:
+        return None
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def iter_chunk_ranges(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the ``(start, end)`` byte ranges of a file's chunks."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    with open(path, "rb") as f:
+        mapping = _open_mapping(f)
+        if mapping is None:
+            return
+        with mapping:
+            yield from _iter_ranges(mapping, len(mapping), chunk_size)
+
+
+def _decode(mapping, start, end):
+    """Decode a range of a mapping through a memoryview slice."""
+    with memoryview(mapping) as view:
+        with view[start:end] as chunk:
+            return str(chunk, "utf-8", errors="replace")
+
+
+def read_range(path, start, end):
+    """Decode one byte range of a file."""
+    with open(path, "rb") as f:
+        mapping = _open_mapping(f)
+        if mapping is None:
+            return ""
+        with mapping:
+            return _decode(mapping, start, end)
+
+
+def iter_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield a file's text chunk by chunk from a single mapping."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    with open(path, "rb") as f:
+        mapping = _open_mapping(f)
+        if mapping is None:
+            return
+        with mapping:
+            for start, end in _iter_ranges(mapping, len(mapping), chunk_size):
+                yield _decode(mapping, start, end)
+
+
+def _apply_to_ranges(func, ranges):
+    """Apply func to the text of each ``(path, start, end)`` range."""
+    return [func(read_range(*file_range)) for file_range in ranges]
+
+
+def map_corpus_chunks(
+    func,
+    paths,
+    chunk_size=DEFAULT_CHUNK_SIZE,
+    executor=None,
+    max_workers=None,
+):
+    """
+    Apply ``func`` to every chunk of the given files in parallel and yield
+    the results in file and chunk order.
+
+    ``func`` takes the chunk text and must be a module-level function when
+    a process pool is used. ``executor`` and ``max_workers`` are passed to
+    ``map_chunks``.
+    """
+    ranges = (
+        (path, start, end)
+        for path in paths
+        for start, end in iter_chunk_ranges(path, chunk_size)
+    )
+    return map_chunks(
+        functools.partial(_apply_to_ranges, func),
+        ranges,
+        1,
+        executor,
+        max_workers,
+    )
+
+
+def main():
+    """Split a corpus file into chunks and report their sizes."""
+    parser = argparse.ArgumentParser(
+        description="Split a UTF-8 corpus file into safe chunks."
+    )
+    parser.add_argument("path", help="corpus file to split")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="approximate chunk size in bytes",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    lengths = map_corpus_chunks(
+        len, [args.path], args.chunk_size, max_workers=args.workers
+    )
+    with profiling.stage("read"):
+        lengths = list(lengths)
+
+    print(f"{args.path}: {os.path.getsize(args.path)} bytes")
+    print(f"Chunks: {len(lengths)}, characters: {sum(lengths)}")
+    profiling.print_summary()
+
+
+if __name__ == "__main__":
+    main()
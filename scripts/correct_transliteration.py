@@ -9,8 +9,28 @@ This script provides accurate transliteration for Kannada characters, handling:
 4. Proper segmentation logic
 """
 
+import collections
+import concurrent.futures
+import functools
+import itertools
+import os
+import re
+import sys
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# Bump whenever segmentation output changes for unchanged rule tables, so
+# incremental rebuilds know to discard their previous results
+SEGMENTER_VERSION = 4
+
 # Unicode points for Kannada script
 KANNADA_VIRAMA = "\u0ccd"  # ್
+KANNADA_ANUSVARA = "\u0c82"  # ಂ
+KANNADA_VISARGA = "\u0c83"  # ಃ
 KANNADA_RANGE = range(0x0C80, 0x0CFF)
 
 # Base consonants with inherent 'a'
@@ -85,64 +105,138 @@ VOWEL_MARKS = {
     "ೌ": "au",  # au
 }
 
-# Common consonant conjuncts
+# Signs that attach to the end of the cluster before them
+CLUSTER_MODIFIERS = {
+    KANNADA_ANUSVARA: "n",  # ಂ
+    KANNADA_VISARGA: "h",  # ಃ
+}
+
+# Irregular conjuncts whose sound is not the sum of their parts; all other
+# consonant clusters are composed from BASE_CONSONANTS
 CONJUNCTS = {
-    "ಕ್ಕ": "kka",
-    "ಕ್ಷ": "ksha",
-    "ಗ್ಗ": "gga",
     "ಙ್ಗ": "nga",
-    "ಚ್ಚ": "chcha",
-    "ಜ್ಜ": "jja",
     "ಜ್ಞ": "jna",
     "ಞ್ಜ": "nja",
-    "ಟ್ಟ": "tta",
-    "ಡ್ಡ": "dda",
-    "ಣ್ಣ": "nna",
-    "ತ್ತ": "tta",
-    "ದ್ದ": "dda",
     "ಧ್ಧ": "ddha",
-    "ನ್ನ": "nna",
-    "ಪ್ಪ": "ppa",
-    "ಬ್ಬ": "bba",
-    "ಮ್ಮ": "mma",
-    "ಯ್ಯ": "yya",
-    "ರ್ರ": "rra",
-    "ಲ್ಲ": "lla",
-    "ವ್ವ": "vva",
-    "ಶ್ಶ": "shsha",
-    "ಷ್ಷ": "shsha",
-    "ಸ್ಸ": "ssa",
-    "ಹ್ಹ": "hha",
-    "ಳ್ಳ": "lla",
-    # Cross-consonant conjuncts
-    "ಕ್ತ": "kta",
-    "ಕ್ರ": "kra",
-    "ಗ್ರ": "gra",
-    "ಚ್ರ": "chra",
-    "ಜ್ರ": "jra",
-    "ತ್ರ": "tra",
-    "ದ್ರ": "dra",
-    "ನ್ರ": "nra",
-    "ಪ್ರ": "pra",
-    "ಬ್ರ": "bra",
-    "ಮ್ರ": "mra",
-    "ಶ್ರ": "shra",
-    "ಸ್ಪ": "spa",
-    "ಸ್ತ": "sta",
-    "ಸ್ಕ": "ska",
-    "ಸ್ಥ": "stha",
-    "ಸ್ವ": "sva",
-    "ಸ್ಮ": "sma",
-    "ಸ್ನ": "sna",
-    "ಸ್ಯ": "sya",
-    "ಹ್ಮ": "hma",
-    "ಹ್ನ": "hna",
-    "ಹ್ರ": "hra",
-    "ಹ್ಯ": "hya",
-    "ಹ್ವ": "hva",
 }
 
 
+class LRUCache:
+    """Bounded least-recently-used cache with hit, miss and eviction counts."""
+
+    _MISSING = object()
+
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value for key, marking it as recently used."""
+        with self._lock:
+            value = self._data.get(key, self._MISSING)
+            if value is self._MISSING:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return the cache counters as a dict."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+# Opt-in memoization; None means caching is disabled
+_word_cache = None
+
+
+def enable_segmentation_cache(max_words=65536, max_clusters=None):
+    """
+    Turn on memoization of word analyses.
+
+    Cluster sounds are always memoized per transliteration scheme;
+    ``max_clusters`` resizes those memos, which empties them.
+
+    Caches are per process. Process workers started by ``segment_many``
+    and friends get a copy of the parent's cache when they are forked and
+    start with caching disabled under the spawn and forkserver start
+    methods; either way their hits are not reported back. Calling this
+    again replaces the cache and resets its statistics.
+    """
+    global _word_cache
+    if max_clusters is not None:
+        _resize_token_memos(max_clusters)
+    _word_cache = LRUCache(max_words)
+
+
+def disable_segmentation_cache():
+    """
+    Turn off memoization of word analyses and drop cached results. The
+    cluster memos are emptied and return to their default size.
+    """
+    global _word_cache
+    _word_cache = None
+    _resize_token_memos(_TOKEN_MEMO_SIZE)
+
+
+def _resize_token_memos(maxsize):
+    """Give every registered scheme an empty token memo of ``maxsize``."""
+    global _token_memo_size
+    if maxsize < 1:
+        raise ValueError("maxsize must be at least 1")
+    _token_memo_size = maxsize
+    for scheme in SCHEMES.values():
+        scheme.resize_token_memo(maxsize)
+
+
+def segmentation_cache_stats():
+    """
+    Return hit, miss and eviction counts for the word cache and for the
+    cluster memos of all registered schemes combined.
+    """
+    clusters = [scheme.token_memo_stats() for scheme in SCHEMES.values()]
+    cluster = {
+        name: sum(stats[name] for stats in clusters)
+        for name in ("hits", "misses", "evictions", "size", "maxsize")
+    }
+    lookups = cluster["hits"] + cluster["misses"]
+    cluster["hit_rate"] = cluster["hits"] / lookups if lookups else 0.0
+    return {
+        "word": _word_cache.stats() if _word_cache is not None else None,
+        "cluster": cluster,
+    }
+
+
 def get_consonant_without_vowel(consonant):
     """Get the consonant sound without the inherent 'a' vowel."""
     # First check if it's a conjunct
@@ -159,63 +253,482 @@ def get_consonant_without_vowel(consonant):
     return base_sound
 
 
-def transliterate_kannada_advanced(text):
-    """Advanced transliteration that handles all Kannada script features correctly."""
-    if not text:
-        return ""
+# Tokenizer branch counters; None when profiling is disabled
+_branch_counts = None
+_branch_counts_pid = None
+
+
+def enable_branch_counters():
+    """Start counting which tokenizer branch handled each cluster."""
+    global _branch_counts, _branch_counts_pid
+    _branch_counts = collections.Counter()
+    _branch_counts_pid = os.getpid()
+
+
+def disable_branch_counters():
+    """Stop counting tokenizer branches and drop the counts."""
+    global _branch_counts, _branch_counts_pid
+    _branch_counts = None
+    _branch_counts_pid = None
+
+
+def branch_counts():
+    """Return the tokenizer branch counts collected so far."""
+    return dict(_branch_counts) if _branch_counts is not None else {}
+
+
+# Character classes used by the tokenizer and the bulk classifier
+CHAR_OTHER = 0
+CHAR_CONSONANT = 1
+CHAR_VOWEL = 2
+CHAR_MATRA = 3
+CHAR_VIRAMA = 4
+CHAR_ANUSVARA = 5
+CHAR_VISARGA = 6
+
+
+def _build_char_class_table():
+    """Build the dense class table indexed by ``ord(char) - 0x0C80``."""
+    table = [CHAR_OTHER] * len(KANNADA_RANGE)
+    for chars, char_class in (
+        (BASE_CONSONANTS, CHAR_CONSONANT),
+        (VOWELS, CHAR_VOWEL),
+        (VOWEL_MARKS, CHAR_MATRA),
+        (KANNADA_VIRAMA, CHAR_VIRAMA),
+        (KANNADA_ANUSVARA, CHAR_ANUSVARA),
+        (KANNADA_VISARGA, CHAR_VISARGA),
+    ):
+        for char in chars:
+            table[ord(char) - KANNADA_RANGE.start] = char_class
+    return tuple(table)
+
+
+_CHAR_CLASS_TABLE = _build_char_class_table()
+_KANNADA_RUN = re.compile(
+    f"[{chr(KANNADA_RANGE.start)}-{chr(KANNADA_RANGE.stop - 1)}]+"
+)
+
+
+def char_class(char):
+    """Return the CHAR_* class of a single character."""
+    code = ord(char) - KANNADA_RANGE.start
+    if 0 <= code < len(_CHAR_CLASS_TABLE):
+        return _CHAR_CLASS_TABLE[code]
+    return CHAR_OTHER
+
+
+def classify_codepoints(text):
+    """
+    Classify every character of text at once.
+
+    Returns a NumPy ``uint8`` array of CHAR_* classes when NumPy is
+    installed, otherwise a ``bytes`` object with the same values.
+    """
+    if np is None:
+        return bytes(char_class(char) for char in text)
+
+    codes = np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    # Code points below the block wrap around and fail the bounds check
+    offsets = codes - np.uint32(KANNADA_RANGE.start)
+    inside = offsets < len(_CHAR_CLASS_TABLE)
+    classes = np.zeros(len(codes), dtype=np.uint8)
+    classes[inside] = np.asarray(_CHAR_CLASS_TABLE, dtype=np.uint8)[
+        offsets[inside]
+    ]
+    return classes
+
+
+def iter_kannada_runs(text):
+    """
+    Yield ``(start, end)`` spans of consecutive Kannada-block characters.
+
+    Non-Kannada text between runs is skipped in bulk by a compiled regular
+    expression rather than one character at a time. (This measured faster
+    than a NumPy mask over the code points, which must first re-encode the
+    text.)
+    """
+    for match in _KANNADA_RUN.finditer(text):
+        yield match.span()
+
+
+# Sentinel key marking a complete cluster inside a trie node
+_TRIE_VALUE = None
+
+
+def _build_cluster_trie(table):
+    """Compile a lookup table into a nested-dict trie keyed by character."""
+    trie = {}
+    for key, value in table.items():
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node[_TRIE_VALUE] = value
+    return trie
+
+
+# Default bound on the token sounds memoized per scheme
+_TOKEN_MEMO_SIZE = 1 << 16
+_token_memo_size = _TOKEN_MEMO_SIZE
+
+
+class TransliterationScheme:
+    """
+    A romanization compiled for the tokenizer.
+
+    ``consonants`` maps each consonant to its sound with the inherent
+    vowel and ``conjuncts`` lists irregular conjuncts whose sound is not
+    the sum of their parts. The sounds of recently seen tokens are kept
+    in a bounded LRU memo, so a token is composed once per scheme rather
+    than once per word.
+    """
+
+    def __init__(
+        self,
+        name,
+        consonants,
+        vowels,
+        vowel_marks,
+        modifiers,
+        conjuncts=None,
+        inherent_vowel="a",
+    ):
+        self.name = name
+        self.consonants = dict(consonants)
+        self.vowels = dict(vowels)
+        self.vowel_marks = dict(vowel_marks)
+        self.modifiers = dict(modifiers)
+        self.conjuncts = dict(conjuncts or {})
+        self.inherent_vowel = inherent_vowel
+        self.bare_consonants = {
+            consonant: self.strip_inherent_vowel(sound)
+            for consonant, sound in self.consonants.items()
+        }
+        self._conjunct_trie = _build_cluster_trie(
+            {
+                conjunct: self.strip_inherent_vowel(sound)
+                for conjunct, sound in self.conjuncts.items()
+            }
+        )
+        self.resize_token_memo(_token_memo_size)
+
+    def resize_token_memo(self, maxsize):
+        """Replace the token memo with an empty one of ``maxsize``."""
+        self._token_memo = functools.lru_cache(maxsize=maxsize)(
+            self.token_sound
+        )
+
+    def token_memo_stats(self):
+        """Return the token memo counters in the form of LRUCache.stats."""
+        info = self._token_memo.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            "hits": info.hits,
+            "misses": info.misses,
+            # Every miss stores its sound, so those not kept were evicted
+            "evictions": info.misses - info.currsize,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+            "hit_rate": info.hits / lookups if lookups else 0.0,
+        }
+
+    def strip_inherent_vowel(self, sound):
+        """Remove the inherent vowel from the end of a sound."""
+        if sound.endswith(self.inherent_vowel):
+            return sound[: -len(self.inherent_vowel)]
+        return sound
+
+    def rule_table(self):
+        """Return every letter of the scheme with its sound."""
+        return {
+            **self.consonants,
+            **self.vowels,
+            **self.vowel_marks,
+            **self.modifiers,
+            **self.conjuncts,
+        }
+
+    def compose_cluster(self, cluster):
+        """
+        Compose the sound, without the inherent vowel, of a consonant
+        cluster: consonants joined by viramas. Irregular conjuncts are
+        matched longest first and every other consonant adds its bare
+        sound.
+        """
+        parts = []
+        end = len(cluster)
+        i = 0
+        while i < end:
+            node = self._conjunct_trie
+            match_end = -1
+            j = i
+            while j < end:
+                node = node.get(cluster[j])
+                if node is None:
+                    break
+                j += 1
+                if _TRIE_VALUE in node:
+                    match_end = j
+                    sound = node[_TRIE_VALUE]
+            if match_end == -1:
+                sound = self.bare_consonants[cluster[i]]
+                match_end = i + 1
+            parts.append(sound)
+            # Skip the virama joining this part to the next
+            i = match_end + 1
+        return "".join(parts)
+
+    def token_sound(self, token):
+        """
+        Transliterate one token of ``tokenize_kannada``: a cluster or vowel
+        with an optional anusvara or visarga, a virama after a
+        non-consonant, or a single character kept on its own.
+        """
+        base = token
+        modifier = ""
+        if len(token) > 1 and token[-1] in self.modifiers:
+            base = token[:-1]
+            modifier = self.modifiers[token[-1]]
+
+        first = base[0]
+        if first in self.consonants:
+            last = base[-1]
+            if last == KANNADA_VIRAMA:
+                sound = self.compose_cluster(base[:-1])
+            elif last in self.vowel_marks:
+                sound = (
+                    self.compose_cluster(base[:-1]) + self.vowel_marks[last]
+                )
+            else:
+                sound = self.compose_cluster(base) + self.inherent_vowel
+        elif len(base) > 1:
+            # Virama after a non-consonant
+            sound = self.strip_inherent_vowel(
+                self.consonants.get(first, first)
+            )
+        elif first in self.vowels:
+            sound = self.vowels[first]
+        else:
+            # Orphaned vowel mark or a character outside the scheme
+            sound = self.vowel_marks.get(first, first)
+        return sound + modifier
+
+
+def _letters(keys, sounds):
+    """Pair letters with a whitespace-separated list of their sounds."""
+    sounds = sounds.split()
+    if len(sounds) != len(keys):
+        raise ValueError("Every letter needs exactly one sound")
+    return dict(zip(keys, sounds))
+
+
+# Learner-friendly scheme used for the dictionary's tr fields
+CASUAL = TransliterationScheme(
+    "casual",
+    BASE_CONSONANTS,
+    VOWELS,
+    VOWEL_MARKS,
+    CLUSTER_MODIFIERS,
+    CONJUNCTS,
+)
+
+# ISO 15919: one distinct letter per Kannada letter
+ISO_15919 = TransliterationScheme(
+    "iso15919",
+    _letters(
+        tuple(BASE_CONSONANTS),
+        "ka kha ga gha ṅa ca cha ja jha ña ṭa ṭha ḍa ḍha ṇa ta tha da dha "
+        "na pa pha ba bha ma ya ra la va śa ṣa sa ha ḷa ḻa",
+    ),
+    _letters(tuple(VOWELS), "a ā i ī u ū r̥ e ē ai o ō au"),
+    _letters(tuple(VOWEL_MARKS), "ā i ī u ū r̥ e ē ai o ō au"),
+    {KANNADA_ANUSVARA: "ṁ", KANNADA_VISARGA: "ḥ"},
+)
+
+# IAST, with ISO 15919's macrons to tell short and long e and o apart
+IAST = TransliterationScheme(
+    "iast",
+    ISO_15919.consonants,
+    _letters(tuple(VOWELS), "a ā i ī u ū ṛ e ē ai o ō au"),
+    _letters(tuple(VOWEL_MARKS), "ā i ī u ū ṛ e ē ai o ō au"),
+    {KANNADA_ANUSVARA: "ṃ", KANNADA_VISARGA: "ḥ"},
+)
+
+# Harvard-Kyoto (ASCII only); ೞ has no standard letter and is written Za
+HARVARD_KYOTO = TransliterationScheme(
+    "hk",
+    _letters(
+        tuple(BASE_CONSONANTS),
+        "ka kha ga gha Ga ca cha ja jha Ja Ta Tha Da Dha Na ta tha da dha "
+        "na pa pha ba bha ma ya ra la va za Sa sa ha La Za",
+    ),
+    _letters(tuple(VOWELS), "a A i I u U R e E ai o O au"),
+    _letters(tuple(VOWEL_MARKS), "A i I u U R e E ai o O au"),
+    {KANNADA_ANUSVARA: "M", KANNADA_VISARGA: "H"},
+)
+
+# Registered schemes by name
+SCHEMES = {
+    scheme.name: scheme
+    for scheme in (CASUAL, ISO_15919, IAST, HARVARD_KYOTO)
+}
+
+
+def register_scheme(scheme):
+    """Make a scheme available by name, replacing any with the same name."""
+    SCHEMES[scheme.name] = scheme
+    return scheme
 
-    result = []
+
+def get_scheme(scheme):
+    """Return a registered scheme by name; schemes are returned as-is."""
+    if isinstance(scheme, TransliterationScheme):
+        return scheme
+    try:
+        return SCHEMES[scheme]
+    except KeyError:
+        raise ValueError(f"Unknown scheme: {scheme!r}") from None
+
+
+def scheme_field(scheme):
+    """Name of the dictionary field holding a scheme's transliteration."""
+    name = get_scheme(scheme).name
+    return "tr" if name == CASUAL.name else f"tr_{name}"
+
+
+def tokenize_kannada(text, scheme=CASUAL):
+    """
+    Split text into cluster tokens in a single left-to-right scan.
+
+    Each token is a tuple ``(start, end, tr)`` where ``text[start:end]`` is
+    the cluster and ``tr`` is its transliteration in ``scheme``, both as a
+    learning segment and as its part of the full-word transliteration.
+
+    A cluster is a consonant chain of any length (consonants joined by
+    viramas) with an optional vowel mark or final virama; its sound is
+    composed from the parts. An anusvara or visarga is part of the
+    cluster it follows.
+    """
+    tokens = []
+    length = len(text)
+    counts = _branch_counts
+    classes = _CHAR_CLASS_TABLE
+    base = KANNADA_RANGE.start
+    size = len(classes)
+    token_sound = scheme._token_memo
+    orphan_sounds = scheme.vowel_marks
     i = 0
 
-    while i < len(text):
+    while i < length:
         char = text[i]
+        code = ord(char) - base
+        char_class = classes[code] if 0 <= code < size else CHAR_OTHER
 
-        # Check for 3-character conjuncts first
-        if i + 2 < len(text):
-            three_char = text[i : i + 3]
-            if three_char in CONJUNCTS:
-                result.append(CONJUNCTS[three_char])
-                i += 3
-                continue
+        if char_class == CHAR_CONSONANT:
+            # Consonant cluster: consonant (+ virama + consonant)*
+            j = i + 1
+            while (
+                j + 1 < length
+                and text[j] == KANNADA_VIRAMA
+                and text[j + 1] in BASE_CONSONANTS
+            ):
+                j += 2
 
-        # Check for 2-character conjuncts
-        if i + 1 < len(text):
-            two_char = text[i : i + 2]
-            if two_char in CONJUNCTS:
-                result.append(CONJUNCTS[two_char])
-                i += 2
-                continue
+            next_char = text[j] if j < length else ""
+            if next_char == KANNADA_VIRAMA:
+                # Cluster + virama (halant)
+                branch = "virama"
+                end = j + 1
+            elif next_char in VOWEL_MARKS:
+                # Cluster + vowel mark
+                branch = "consonant_matra"
+                end = j + 1
+            else:
+                # Cluster with the inherent 'a'
+                branch = "single_consonant"
+                end = j
+            if counts is not None:
+                counts[branch if j == i + 1 else f"conjunct_{j - i}char"] += 1
+        else:
+            next_class = CHAR_OTHER
+            if i + 1 < length:
+                code = ord(text[i + 1]) - base
+                if 0 <= code < size:
+                    next_class = classes[code]
 
-            # Check for consonant + virama (halant)
-            if i + 1 < len(text) and text[i + 1] == KANNADA_VIRAMA:
-                consonant_sound = get_consonant_without_vowel(char)
-                result.append(consonant_sound)
-                i += 2
+            if next_class == CHAR_VIRAMA:
+                # Virama after a non-consonant
+                if counts is not None:
+                    counts["virama"] += 1
+                end = i + 2
+            elif char_class == CHAR_VOWEL:
+                if counts is not None:
+                    counts["single_vowel"] += 1
+                end = i + 1
+            else:
+                # Non-Kannada character or orphaned sign; kept on its own
+                if counts is not None:
+                    counts["unknown"] += 1
+                tokens.append((i, i + 1, orphan_sounds.get(char, char)))
+                i += 1
                 continue
 
-            # Check for consonant + vowel mark
-            if char in BASE_CONSONANTS and text[i + 1] in VOWEL_MARKS:
-                consonant_base = get_consonant_without_vowel(char)
-                vowel_sound = VOWEL_MARKS[text[i + 1]]
-                result.append(consonant_base + vowel_sound)
-                i += 2
-                continue
+        # Anusvara or visarga closes the cluster it follows
+        if end < length and text[end] in CLUSTER_MODIFIERS:
+            end += 1
 
-        # Single character handling
-        if char in VOWELS:
-            result.append(VOWELS[char])
-        elif char in BASE_CONSONANTS:
-            result.append(BASE_CONSONANTS[char])
-        elif char in VOWEL_MARKS:
-            # This shouldn't happen in proper text, but handle it
-            result.append(VOWEL_MARKS[char])
-        else:
-            # Non-Kannada character, keep as is
-            result.append(char)
+        tokens.append((i, end, token_sound(text[i:end])))
+        i = end
+
+    return tokens
+
+
+def tokenize_kannada_schemes(text, schemes):
+    """
+    Tokenize text once and transliterate every token in several schemes.
+
+    Each token is a tuple ``(start, end, sounds)`` where ``sounds`` holds
+    the token's transliteration in each scheme, in the order given. The
+    scan runs for the first scheme only; the others transliterate the
+    tokens it found.
+    """
+    first, *others = schemes
+    token_sounds = [scheme._token_memo for scheme in others]
+    tokens = []
+    for start, end, tr in tokenize_kannada(text, first):
+        sounds = [tr]
+        if token_sounds:
+            token = text[start:end]
+            sounds.extend([token_sound(token) for token_sound in token_sounds])
+        tokens.append((start, end, sounds))
+    return tokens
+
+
+def _analyze_uncached(word):
+    """Return immutable ``(segment pairs, transliteration)`` for a word."""
+    tokens = tokenize_kannada(word)
+    pairs = tuple([(word[start:end], tr) for start, end, tr in tokens])
+    return pairs, "".join([token[2] for token in tokens])
+
+
+def _analyze_cached(word, cache):
+    """Look up or compute the immutable analysis of a word."""
+    analysis = cache.get(word)
+    if analysis is None:
+        analysis = _analyze_uncached(word)
+        cache.put(word, analysis)
+    return analysis
 
-        i += 1
 
-    return "".join(result)
+def transliterate_kannada_advanced(text):
+    """Advanced transliteration that handles all Kannada script features correctly."""
+    if not text:
+        return ""
+
+    cache = _word_cache
+    if cache is not None:
+        return _analyze_cached(text, cache)[1]
+
+    return "".join([token[2] for token in tokenize_kannada(text)])
 
 
 def segment_kannada_word(word):
@@ -223,81 +736,244 @@ def segment_kannada_word(word):
     if not word:
         return []
 
+    cache = _word_cache
+    if cache is not None:
+        # Fresh dicts each call so callers cannot corrupt the cache
+        pairs = _analyze_cached(word, cache)[0]
+        return [{"kn": kn, "tr": tr} for kn, tr in pairs]
+
+    return [
+        {"kn": word[start:end], "tr": tr}
+        for start, end, tr in tokenize_kannada(word)
+    ]
+
+
+def analyze_kannada_word(word):
+    """
+    Segment and transliterate a word from a single tokenizer pass.
+
+    Returns a ``(segments, transliteration)`` tuple equal to calling
+    ``segment_kannada_word`` and ``transliterate_kannada_advanced``.
+    """
+    if not word:
+        return [], ""
+
+    cache = _word_cache
+    if cache is not None:
+        pairs, transliteration = _analyze_cached(word, cache)
+        return [{"kn": kn, "tr": tr} for kn, tr in pairs], transliteration
+
+    tokens = tokenize_kannada(word)
+    segments = [
+        {"kn": word[start:end], "tr": tr}
+        for start, end, tr in tokens
+    ]
+    return segments, "".join([token[2] for token in tokens])
+
+
+def analyze_schemes(word, schemes):
+    """
+    Segment a word and transliterate it in several schemes from a single
+    tokenizer pass.
+
+    ``schemes`` are scheme names or objects; the casual scheme is always
+    included. Returns ``(segments, transliterations)``: each segment dict
+    holds ``kn`` plus one field per scheme as named by ``scheme_field``
+    (``tr``, ``tr_iso15919``, ...), and ``transliterations`` maps the same
+    fields to the whole-word transliterations.
+    """
+    resolved = [CASUAL]
+    for scheme in schemes:
+        scheme = get_scheme(scheme)
+        if scheme not in resolved:
+            resolved.append(scheme)
+    fields = [scheme_field(scheme) for scheme in resolved]
+
     segments = []
-    i = 0
+    parts = [[] for _ in resolved]
+    for start, end, sounds in tokenize_kannada_schemes(word, resolved):
+        segment = {"kn": word[start:end]}
+        for field, part, tr in zip(fields, parts, sounds):
+            segment[field] = tr
+            part.append(tr)
+        segments.append(segment)
+    return segments, {
+        field: "".join(part) for field, part in zip(fields, parts)
+    }
 
-    while i < len(word):
-        char = word[i]
-
-        # Check for 3-character conjuncts first
-        if i + 2 < len(word):
-            three_char = word[i : i + 3]
-            if three_char in CONJUNCTS:
-                # Check if there's a vowel mark after the conjunct
-                if i + 3 < len(word) and word[i + 3] in VOWEL_MARKS:
-                    four_char = word[i : i + 4]
-                    conjunct_base = get_consonant_without_vowel(three_char)
-                    vowel_sound = VOWEL_MARKS[word[i + 3]]
-                    segments.append(
-                        {"kn": four_char, "tr": conjunct_base + vowel_sound}
-                    )
-                    i += 4
-                    continue
-                else:
-                    segments.append(
-                        {"kn": three_char, "tr": CONJUNCTS[three_char]}
-                    )
-                    i += 3
-                    continue
-
-        # Check for 2-character combinations
-        if i + 1 < len(word):
-            two_char = word[i : i + 2]
-            if two_char in CONJUNCTS:
-                # Check if there's a vowel mark after the conjunct
-                if i + 2 < len(word) and word[i + 2] in VOWEL_MARKS:
-                    three_char = word[i : i + 3]
-                    conjunct_base = get_consonant_without_vowel(two_char)
-                    vowel_sound = VOWEL_MARKS[word[i + 2]]
-                    segments.append(
-                        {"kn": three_char, "tr": conjunct_base + vowel_sound}
-                    )
-                    i += 3
-                    continue
-                else:
-                    segments.append({"kn": two_char, "tr": CONJUNCTS[two_char]})
-                    i += 2
-                    continue
-
-            # Consonant + virama (halant)
-            if i + 1 < len(word) and word[i + 1] == KANNADA_VIRAMA:
-                consonant_sound = get_consonant_without_vowel(char)
-                segments.append({"kn": two_char, "tr": consonant_sound})
-                i += 2
-                continue
 
-            # Consonant + vowel mark
-            if char in BASE_CONSONANTS and word[i + 1] in VOWEL_MARKS:
-                consonant_base = get_consonant_without_vowel(char)
-                vowel_sound = VOWEL_MARKS[word[i + 1]]
-                segments.append(
-                    {"kn": two_char, "tr": consonant_base + vowel_sound}
-                )
-                i += 2
-                continue
+def _segment_chunk(words):
+    """Segment one chunk of words inside a worker."""
+    return [segment_kannada_word(word) for word in words]
+
+
+def _transliterate_chunk(words):
+    """Transliterate one chunk of words inside a worker."""
+    return [transliterate_kannada_advanced(word) for word in words]
+
+
+def _analyze_chunk(words):
+    """Segment and transliterate one chunk of words inside a worker."""
+    return [analyze_kannada_word(word) for word in words]
+
+
+def _analyze_schemes_chunk(schemes, words):
+    """Analyze one chunk of words in several schemes inside a worker."""
+    return [analyze_schemes(word, schemes) for word in words]
+
+
+def _counted_chunk(chunk_func, words):
+    """
+    Run a chunk in a worker process with fresh branch counters and return
+    ``(results, counts)`` for the parent to merge.
+    """
+    global _branch_counts, _branch_counts_pid
+    if _branch_counts_pid == os.getpid():
+        # Thread workers share the parent's counters directly
+        return chunk_func(words), None
+
+    _branch_counts = collections.Counter()
+    _branch_counts_pid = os.getpid()
+    try:
+        return chunk_func(words), _branch_counts
+    finally:
+        _branch_counts = None
+        _branch_counts_pid = None
+
+
+def _is_free_threaded():
+    """Return True when running on a Python build without the GIL."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _make_executor(executor, max_workers):
+    """Create the executor named by ``executor`` ("process" or "thread")."""
+    if executor is None:
+        executor = "thread" if _is_free_threaded() else "process"
+    if executor == "process":
+        return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+    if executor == "thread":
+        return concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+    raise ValueError(f"Unknown executor: {executor!r}")
+
+
+def map_chunks(
+    chunk_func, words, chunksize=1000, executor=None, max_workers=None
+):
+    """
+    Apply ``chunk_func`` to consecutive chunks of ``words`` and return an
+    iterator over the per-word results in input order.
+
+    ``chunk_func`` takes a list and returns one result per item; it must be
+    a module-level function when a process pool is used. This is the
+    engine behind ``segment_many`` and friends and can drive other
+    per-entry work the same way.
+    """
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    return _iter_chunk_results(
+        chunk_func, iter(words), chunksize, executor, max_workers
+    )
 
-        # Single character
-        if char in VOWELS:
-            segments.append({"kn": char, "tr": VOWELS[char]})
-        elif char in BASE_CONSONANTS:
-            segments.append({"kn": char, "tr": BASE_CONSONANTS[char]})
-        else:
-            # Non-Kannada character or orphaned vowel mark
-            segments.append({"kn": char, "tr": char})
 
-        i += 1
+def _iter_chunk_results(chunk_func, words, chunksize, executor, max_workers):
+    """
+    Generator behind ``map_chunks``. Only a bounded window of chunks is in
+    flight at a time, so arbitrarily long iterables can be streamed.
+    """
+    first_chunk = list(itertools.islice(words, chunksize))
+    second_chunk = list(itertools.islice(words, chunksize))
 
-    return segments
+    # A single chunk is not worth starting a pool for
+    if not second_chunk:
+        yield from chunk_func(first_chunk)
+        return
+
+    chunks = itertools.chain(
+        (first_chunk, second_chunk),
+        iter(lambda: list(itertools.islice(words, chunksize)), []),
+    )
+
+    owns_executor = not isinstance(executor, concurrent.futures.Executor)
+    pool = _make_executor(executor, max_workers) if owns_executor else executor
+    window = 2 * (max_workers or os.cpu_count() or 1)
+
+    # Workers in other processes report their branch counts back
+    counting = _branch_counts is not None
+
+    def collect(future):
+        if not counting:
+            return future.result()
+        results, counts = future.result()
+        if counts and _branch_counts is not None:
+            _branch_counts.update(counts)
+        return results
+
+    try:
+        pending = collections.deque()
+        for chunk in chunks:
+            if counting:
+                future = pool.submit(_counted_chunk, chunk_func, chunk)
+            else:
+                future = pool.submit(chunk_func, chunk)
+            pending.append(future)
+            if len(pending) >= window:
+                yield from collect(pending.popleft())
+        for future in pending:
+            yield from collect(future)
+    finally:
+        if owns_executor:
+            pool.shutdown(cancel_futures=True)
+
+
+def segment_many(words, chunksize=1000, executor=None, max_workers=None):
+    """
+    Segment many words in parallel chunks, yielding results in input order.
+
+    ``executor`` is ``"process"``, ``"thread"`` or an existing
+    ``concurrent.futures.Executor``; by default a thread pool is used on
+    free-threaded Python and a process pool otherwise.
+    """
+    return map_chunks(_segment_chunk, words, chunksize, executor, max_workers)
+
+
+def transliterate_many(words, chunksize=1000, executor=None, max_workers=None):
+    """
+    Transliterate many words in parallel chunks, yielding results in input
+    order. Takes the same options as ``segment_many``.
+    """
+    return map_chunks(
+        _transliterate_chunk, words, chunksize, executor, max_workers
+    )
+
+
+def analyze_many(words, chunksize=1000, executor=None, max_workers=None):
+    """
+    Yield ``(segments, transliteration)`` tuples for many words in input
+    order. Takes the same options as ``segment_many``.
+    """
+    return map_chunks(_analyze_chunk, words, chunksize, executor, max_workers)
+
+
+def analyze_schemes_many(
+    words, schemes, chunksize=1000, executor=None, max_workers=None
+):
+    """
+    Yield ``analyze_schemes`` results for many words in input order.
+
+    ``schemes`` are passed to the workers by name, so schemes registered
+    at runtime are only available to thread workers and forked processes.
+    Takes the same options as ``segment_many``.
+    """
+    names = tuple(get_scheme(scheme).name for scheme in schemes)
+    return map_chunks(
+        functools.partial(_analyze_schemes_chunk, names),
+        words,
+        chunksize,
+        executor,
+        max_workers,
+    )
 
 
 def test_transliteration():
@@ -310,6 +986,12 @@ def test_transliteration():
         ("ಧನ್ಯವಾದ", "dhanyavada"),  # Dhanyavada
         ("ಸ್ವಾಗತ", "svagata"),  # Svagata
         ("ಪ್ರಸ್ತುತ", "prastuta"),  # Prastuta
+        ("ಕೆಂಪು", "kenpu"),  # Anusvara after a vowel mark
+        ("ಸಂಜೆ", "sanje"),  # Anusvara after a bare consonant
+        ("ದುಃಖ", "duhkha"),  # Visarga
+        ("ಸ್ತ್ರೀ", "strii"),  # Three-consonant cluster
+        ("ಲಕ್ಷ್ಮಿ", "lakshmi"),  # Cluster containing ksha
+        ("ಮಹಾರಾಷ್ಟ್ರ", "mahaaraashtra"),  # Final three-consonant cluster
     ]
 
     print("Testing transliteration:")
@@ -327,5 +1009,33 @@ def test_transliteration():
         print()
 
 
+def main():
+    """Run the transliteration checks, optionally with branch counters."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Check transliteration of known problematic cases."
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print tokenizer branch counts",
+    )
+    args = parser.parse_args()
+
+    if args.profile:
+        # profiling instruments the imported module rather than __main__,
+        # so run the checks through that copy
+        import correct_transliteration
+        import profiling
+
+        profiling.enable_profiling()
+        with profiling.stage("segment"):
+            correct_transliteration.test_transliteration()
+        profiling.print_summary()
+    else:
+        test_transliteration()
+
+
 if __name__ == "__main__":
-    test_transliteration()
+    main()
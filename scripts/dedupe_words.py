@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Normalize and deduplicate dictionary entries.
+
+Words are compared after NFC normalization, so visually identical
+strings from different sources collapse into one entry. The first
+occurrence of a word is kept in place and the English meanings of later
+duplicates are merged into it ("answer" + "north" -> "answer/north").
+
+Files are deduplicated in two passes: the first merges the meanings of
+every duplicated word, keeping only words and meanings in memory, and the
+second streams the entries out as they arrive. Entries that can only be
+read once are deduplicated in a single pass with every distinct entry
+held in a dict. With a spill directory they are instead partitioned into
+bucket files by hash, each bucket is deduplicated on its own and the
+results are merged back into input order, so only one bucket has to fit
+in memory at a time.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+import tempfile
+import unicodedata
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from dictionary_io import iter_dictionary, write_dictionary
+
+DEFAULT_SPILL_BUCKETS = 64
+
+MEANING_SEPARATOR = "/"
+
+_SEPARATORS = (",", ":")
+
+
+def normalize_kn(text):
+    """Return the NFC form of a Kannada string."""
+    return unicodedata.normalize("NFC", text)
+
+
+def merge_meanings(first, second):
+    """Combine two English meanings, skipping parts already present."""
+    parts = [part for part in first.split(MEANING_SEPARATOR) if part]
+    for part in second.split(MEANING_SEPARATOR):
+        if part and part not in parts:
+            parts.append(part)
+    return MEANING_SEPARATOR.join(parts)
+
+
+def _normalized(entry):
+    """Return a copy of an entry with its kn in NFC form."""
+    kn = normalize_kn(entry["kn"])
+    if kn == entry["kn"]:
+        return entry
+    return {**entry, "kn": kn}
+
+
+def _merge_into(existing, entry):
+    """Merge the meaning of a duplicate into the entry kept for it."""
+    en = merge_meanings(existing["en"], entry["en"])
+    if en != existing["en"]:
+        existing = {**existing, "en": en}
+    return existing
+
+
+def duplicate_meanings(entries):
+    """
+    Return ``{kn: merged meaning}`` for every word that occurs more than
+    once, comparing NFC-normalized words.
+    """
+    meanings = {}
+    duplicates = set()
+    for entry in entries:
+        kn = normalize_kn(entry["kn"])
+        en = meanings.get(kn)
+        if en is None:
+            meanings[kn] = entry["en"]
+        else:
+            meanings[kn] = merge_meanings(en, entry["en"])
+            duplicates.add(kn)
+    return {kn: meanings[kn] for kn in duplicates}
+
+
+def _dedupe_streaming(entries, duplicates):
+    """
+    Deduplicate with the merged meanings known up front, so entries are
+    yielded as they arrive and only duplicated words are remembered.
+    """
+    emitted = set()
+    for entry in entries:
+        entry = _normalized(entry)
+        en = duplicates.get(entry["kn"])
+        if en is None:
+            yield entry
+        elif entry["kn"] not in emitted:
+            emitted.add(entry["kn"])
+            yield entry if en == entry["en"] else {**entry, "en": en}
+
+
+def _dedupe_in_memory(entries):
+    """Deduplicate with all distinct entries held in a dict."""
+    kept = {}
+    for entry in entries:
+        entry = _normalized(entry)
+        existing = kept.get(entry["kn"])
+        kept[entry["kn"]] = (
+            entry if existing is None else _merge_into(existing, entry)
+        )
+    yield from kept.values()
+
+
+def _iter_lines(path):
+    """Yield the parsed JSON lines of a spill file."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _dedupe_spilled(entries, spill_dir, buckets):
+    """Deduplicate by partitioning the entries into bucket files."""
+    with tempfile.TemporaryDirectory(dir=spill_dir) as temp_dir:
+        paths = [
+            os.path.join(temp_dir, f"bucket-{i}.jsonl") for i in range(buckets)
+        ]
+
+        # Partition: every copy of a word lands in the same bucket
+        files = [open(path, "w", encoding="utf-8") for path in paths]
+        try:
+            for sequence, entry in enumerate(entries):
+                entry = _normalized(entry)
+                bucket = hash(entry["kn"]) % buckets
+                files[bucket].write(
+                    json.dumps(
+                        [sequence, entry],
+                        ensure_ascii=False,
+                        separators=_SEPARATORS,
+                    )
+                    + "\n"
+                )
+        finally:
+            for f in files:
+                f.close()
+
+        # Deduplicate each bucket; its first occurrences stay in input order
+        for path in paths:
+            kept = {}
+            for sequence, entry in _iter_lines(path):
+                existing = kept.get(entry["kn"])
+                if existing is None:
+                    kept[entry["kn"]] = [sequence, entry]
+                else:
+                    existing[1] = _merge_into(existing[1], entry)
+            with open(path, "w", encoding="utf-8") as f:
+                for row in sorted(kept.values(), key=lambda row: row[0]):
+                    f.write(
+                        json.dumps(
+                            row, ensure_ascii=False, separators=_SEPARATORS
+                        )
+                        + "\n"
+                    )
+
+        # Merge the buckets back into input order
+        merged = heapq.merge(
+            *(_iter_lines(path) for path in paths), key=lambda row: row[0]
+        )
+        for _, entry in merged:
+            yield entry
+
+
+def dedupe_entries(
+    entries,
+    spill_dir=None,
+    buckets=DEFAULT_SPILL_BUCKETS,
+    duplicates=None,
+):
+    """
+    Yield entries with NFC-normalized kn and duplicates merged, in order of
+    first occurrence.
+
+    ``duplicates`` is the result of duplicate_meanings for the same
+    entries; with it, entries stream through without being buffered.
+    Otherwise, with ``spill_dir``, intermediate data is written to a
+    temporary directory inside it instead of being kept in memory.
+    """
+    if duplicates is not None:
+        return _dedupe_streaming(entries, duplicates)
+    if spill_dir is None:
+        return _dedupe_in_memory(entries)
+    if buckets < 1:
+        raise ValueError("buckets must be at least 1")
+    return _dedupe_spilled(entries, spill_dir, buckets)
+
+
+def main():
+    """Deduplicate data/dictionary.json (or the given file) in place."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description="Normalize and deduplicate dictionary entries."
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default=os.path.join(base_dir, "data", "dictionary.json"),
+        help="dictionary file to deduplicate",
+    )
+    parser.add_argument(
+        "-o", "--output", help="output path (default: overwrite the input)"
+    )
+    parser.add_argument(
+        "--spill-dir",
+        help="keep intermediate data in this directory instead of memory",
+    )
+    parser.add_argument(
+        "--buckets",
+        type=int,
+        default=DEFAULT_SPILL_BUCKETS,
+        help="number of spill files used with --spill-dir",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    output_path = args.output or args.input
+    counts = {"read": 0}
+
+    def counted(entries):
+        for entry in entries:
+            counts["read"] += 1
+            yield entry
+
+    duplicates = None
+    if args.spill_dir is None:
+        with profiling.stage("dedupe"):
+            duplicates = duplicate_meanings(iter_dictionary(args.input))
+
+    entries = profiling.timed_iter("load", iter_dictionary(args.input))
+    unique = profiling.timed_iter(
+        "dedupe",
+        dedupe_entries(
+            counted(entries), args.spill_dir, args.buckets, duplicates
+        ),
+    )
+    with profiling.stage("serialize"):
+        total = write_dictionary(unique, output_path)
+
+    print(f"Deduplicated dictionary saved to: {output_path}")
+    print(f"Entries: {counts['read']} -> {total}")
+    profiling.print_summary()
+
+
+if __name__ == "__main__":
+    main()
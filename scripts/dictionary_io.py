@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Streaming reader and writer for dictionary files.
+
+Dictionaries are stored either as a pretty-printed JSON array (the format
+of data/dictionary.json) or as JSONL with one entry per line. Entries are
+read and written one at a time so memory use does not grow with the size
+of the dictionary, and files are replaced atomically once fully written.
+"""
+
+import contextlib
+import json
+import os
+import tempfile
+
+READ_CHUNK_SIZE = 1 << 16
+
+
+def is_jsonl_path(path):
+    """Return True if the path names a JSONL file."""
+    return path.endswith(".jsonl")
+
+
+def _iter_json_array(f):
+    """Incrementally decode the elements of a top-level JSON array."""
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        chunk = f.read(READ_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos].isspace():
+                pos += 1
+            if pos < len(buffer) or eof:
+                return
+            fill()
+
+    skip_whitespace()
+    if pos >= len(buffer) or buffer[pos] != "[":
+        raise ValueError("Dictionary file must contain a JSON array")
+    pos += 1
+
+    expect_value = True
+    while True:
+        skip_whitespace()
+        if pos >= len(buffer):
+            raise ValueError("Unexpected end of dictionary file")
+
+        if buffer[pos] == "]":
+            return
+        if not expect_value:
+            if buffer[pos] != ",":
+                raise ValueError(
+                    f"Expected ',' in dictionary file near: "
+                    f"{buffer[pos:pos + 20]!r}"
+                )
+            pos += 1
+            expect_value = True
+            continue
+
+        try:
+            value, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            fill()
+            continue
+
+        # A value touching the end of the buffer may be truncated
+        if end == len(buffer) and not eof:
+            fill()
+            continue
+
+        yield value
+        pos = end
+        expect_value = False
+
+
+def iter_dictionary(path):
+    """
+    Yield dictionary entries from a JSON array or JSONL file one at a time.
+
+    The format is detected from the first non-whitespace character, so
+    either format is accepted regardless of the file extension.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+
+        if first == "[":
+            yield from _iter_json_array(f)
+            return
+
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _indent_entry(entry):
+    """Serialize an entry as json.dump(..., indent=2) nests it in a list."""
+    text = json.dumps(entry, ensure_ascii=False, indent=2)
+    return "  " + text.replace("\n", "\n  ")
+
+
+@contextlib.contextmanager
+def atomic_write(path, binary=False):
+    """
+    Open a temporary file next to ``path`` for writing and atomically
+    replace ``path`` with it if the block completes without error. The
+    file is opened as UTF-8 text unless ``binary`` is true.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(
+        dir=directory, prefix=".", suffix=".tmp"
+    )
+
+    try:
+        if binary:
+            f = os.fdopen(fd, "wb")
+        else:
+            f = os.fdopen(fd, "w", encoding="utf-8")
+        with f:
+            yield f
+        # mkstemp creates private files; keep the published file readable
+        mode = os.stat(path).st_mode if os.path.exists(path) else 0o644
+        os.chmod(temp_path, mode & 0o777)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def write_dictionary(entries, path, jsonl=None):
+    """
+    Write entries incrementally and atomically replace ``path``.
+
+    Writes JSONL when ``jsonl`` is true (by default, when the path ends in
+    ``.jsonl``), otherwise a JSON array byte-identical to ``json.dump``
+    with ``indent=2``. Returns the number of entries written.
+    """
+    if jsonl is None:
+        jsonl = is_jsonl_path(path)
+
+    count = 0
+
+    with atomic_write(path) as f:
+        if jsonl:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False))
+                f.write("\n")
+                count += 1
+        else:
+            for entry in entries:
+                f.write(",\n" if count else "[\n")
+                f.write(_indent_entry(entry))
+                count += 1
+            f.write("\n]" if count else "[]")
+
+    return count
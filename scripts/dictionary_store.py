@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Compact in-memory store for dictionary entries.
+
+A list of entry dicts spends most of its memory on the dicts themselves:
+every entry holds a dict, a segment list and one dict per segment, and
+equal segments are separate objects. DictionaryStore keeps the entries in
+columns instead:
+
+* one column per top-level field (``kn``, ``tr``, ``en``, ``tr_<scheme>``),
+  holding the UTF-8 bytes of all its values in one buffer with an array
+  of offsets, so a value costs its bytes plus four instead of a str object
+* every distinct segment, stored once as a tuple of its items
+* one flat array of segment ids, with each entry owning the range
+  ``offsets[i]:offsets[i + 1]`` of it
+
+Entries are rebuilt as regular dicts when read, with their keys in the
+original order, so iterating the store yields the same entries that were
+added and write_dictionary can save it back unchanged:
+
+    python dictionary_store.py --lookup ನಮಸ್ಕಾರ
+"""
+
+import argparse
+import json
+import os
+import sys
+from array import array
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from dictionary_io import iter_dictionary, write_dictionary
+
+SEGMENTS_FIELD = "segments"
+
+# Unsigned ints of at least 32 bits on every supported platform
+_INDEX_TYPECODE = "I"
+
+
+class _StringColumn:
+    """
+    Values of one field, packed as UTF-8 into a single buffer. Values that
+    are not strings are rare and kept as objects on the side.
+    """
+
+    __slots__ = ("data", "offsets", "others")
+
+    def __init__(self, count=0):
+        self.data = bytearray()
+        self.offsets = array(_INDEX_TYPECODE, [0] * (count + 1))
+        self.others = {}
+
+    def append(self, value):
+        """Append a value; entries without the field append ``""``."""
+        if isinstance(value, str):
+            self.data += value.encode("utf-8")
+        else:
+            self.others[len(self.offsets) - 1] = value
+        self.offsets.append(len(self.data))
+
+    def encoded(self, index):
+        """Return the UTF-8 bytes of a string value."""
+        return self.data[self.offsets[index] : self.offsets[index + 1]]
+
+    def __getitem__(self, index):
+        if self.others and index in self.others:
+            return self.others[index]
+        return self.encoded(index).decode("utf-8")
+
+
+class DictionaryStore:
+    """Column-oriented dictionary entries with interned segments."""
+
+    def __init__(self):
+        self._columns = {}
+        self._layouts = []
+        self._layout_ids = {}
+        self._entry_layouts = array(_INDEX_TYPECODE)
+        self._segments = []
+        self._segment_ids = {}
+        self._segment_refs = array(_INDEX_TYPECODE)
+        self._segment_offsets = array(_INDEX_TYPECODE, [0])
+        # Entry ids sorted by kn, built on the first lookup
+        self._kn_order = None
+
+    @classmethod
+    def from_entries(cls, entries):
+        """Build a store from dictionary entries."""
+        store = cls()
+        store.extend(entries)
+        return store
+
+    @classmethod
+    def load(cls, path):
+        """Load a JSON array or JSONL dictionary file."""
+        return cls.from_entries(iter_dictionary(path))
+
+    def save(self, path, jsonl=None):
+        """Write the entries with write_dictionary and return the count."""
+        return write_dictionary(iter(self), path, jsonl)
+
+    def __len__(self):
+        return len(self._entry_layouts)
+
+    @property
+    def segment_count(self):
+        """Number of distinct segments in the store."""
+        return len(self._segments)
+
+    def _layout_id(self, layout):
+        """Return the id of an entry's key order, adding it if new."""
+        layout_id = self._layout_ids.get(layout)
+        if layout_id is None:
+            layout_id = len(self._layouts)
+            self._layout_ids[layout] = layout_id
+            self._layouts.append(layout)
+            for name in layout:
+                if name != SEGMENTS_FIELD and name not in self._columns:
+                    self._columns[name] = _StringColumn(len(self))
+        return layout_id
+
+    def _intern(self, segment):
+        """Return the id of a segment, adding it if new."""
+        key = tuple(segment.items())
+        segment_id = self._segment_ids.get(key)
+        if segment_id is None:
+            segment_id = len(self._segments)
+            self._segment_ids[key] = segment_id
+            self._segments.append(key)
+        return segment_id
+
+    def add(self, entry):
+        """Append one dictionary entry."""
+        self._entry_layouts.append(self._layout_id(tuple(entry)))
+        for name, column in self._columns.items():
+            column.append(entry.get(name, ""))
+        segments = entry.get(SEGMENTS_FIELD, ())
+        self._segment_refs.extend([self._intern(s) for s in segments])
+        self._segment_offsets.append(len(self._segment_refs))
+        self._kn_order = None
+
+    def extend(self, entries):
+        """Append dictionary entries."""
+        for entry in entries:
+            self.add(entry)
+
+    def segments(self, index):
+        """Return the segments of an entry as ``{"kn", "tr"}`` dicts."""
+        segments = self._segments
+        return [
+            dict(segments[segment_id])
+            for segment_id in self._segment_refs[
+                self._segment_offsets[index] : self._segment_offsets[index + 1]
+            ]
+        ]
+
+    def _entry(self, index):
+        """Rebuild the entry at a valid index."""
+        entry = {}
+        for name in self._layouts[self._entry_layouts[index]]:
+            if name == SEGMENTS_FIELD:
+                entry[name] = self.segments(index)
+            else:
+                entry[name] = self._columns[name][index]
+        return entry
+
+    def __getitem__(self, index):
+        """Return an entry as a dict in the dictionary's JSON schema."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("DictionaryStore index out of range")
+        return self._entry(index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self._entry(index)
+
+    def index_of(self, kn):
+        """
+        Return the index of the first entry with the given ``kn``, or None.
+        """
+        words = self._columns.get("kn")
+        if words is None or not kn or not isinstance(kn, str):
+            return None
+        # UTF-8 bytes sort in code point order, so the encoded values can
+        # be compared without decoding them
+        if self._kn_order is None:
+            self._kn_order = array(
+                _INDEX_TYPECODE, sorted(range(len(self)), key=words.encoded)
+            )
+
+        # Binary search for the leftmost match; the sort is stable, so it
+        # is the entry that was added first
+        target = kn.encode("utf-8")
+        order = self._kn_order
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if words.encoded(order[middle]) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(order) and words[order[low]] == kn:
+            return order[low]
+        return None
+
+    def lookup(self, kn):
+        """Return the first entry with the given ``kn``, or None."""
+        index = self.index_of(kn)
+        return None if index is None else self[index]
+
+
+def main():
+    """Load a dictionary into a DictionaryStore and look up words."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description="Load a dictionary into the compact in-memory store."
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default=os.path.join(base_dir, "data", "dictionary.json"),
+        help="dictionary file to load",
+    )
+    parser.add_argument(
+        "--lookup",
+        nargs="+",
+        default=(),
+        help="print the entries for these words",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    with profiling.stage("load"):
+        store = DictionaryStore.load(args.input)
+    print(
+        f"Loaded {len(store)} entries with {store.segment_count} distinct "
+        f"segments from: {args.input}"
+    )
+
+    with profiling.stage("lookup"):
+        for kn in args.lookup:
+            entry = store.lookup(kn)
+            if entry is None:
+                print(f"{kn}: not found")
+            else:
+                print(json.dumps(entry, ensure_ascii=False))
+
+    profiling.print_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Differential fuzzing of segmentation and transliteration engines.
+
+Runs a reference and a candidate engine side by side on random and
+edge-case strings and reports every input on which their output differs,
+so a faster engine can land without silently changing the dictionary.
+An engine is any module defining ``segment_kannada_word`` and
+``transliterate_kannada_advanced``, given as the path of a .py file or as
+a git revision of correct_transliteration.py:
+
+    python differential_fuzz.py                       # HEAD vs working tree
+    python differential_fuzz.py --candidate fast_engine.py --cases 5000000
+
+Cases are generated in batches from the seed, so a run is reproducible
+for any number of workers. Each batch is timed on both engines in the
+same worker, mismatches are shrunk to minimal reproducers by deleting
+characters while the engines still disagree, and the relative speed of
+the engines is reported at the end.
+"""
+
+import argparse
+import functools
+import importlib.util
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from correct_transliteration import (
+    BASE_CONSONANTS,
+    CLUSTER_MODIFIERS,
+    KANNADA_RANGE,
+    KANNADA_VIRAMA,
+    VOWEL_MARKS,
+    VOWELS,
+    map_chunks,
+)
+
+DEFAULT_CASES = 1_000_000
+DEFAULT_BATCH_SIZE = 10_000
+DEFAULT_REPORTS = 10
+
+ENGINE_MODULE = "correct_transliteration.py"
+
+_CONSONANTS = sorted(BASE_CONSONANTS)
+_VOWELS = sorted(VOWELS)
+_MARKS = sorted(VOWEL_MARKS)
+_MODIFIERS = sorted(CLUSTER_MODIFIERS)
+_JOINERS = ("\u200c", "\u200d")
+_LATIN = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+_SEPARATORS = (" ", " ", " ", "\n", "\t", "-", ".", ",", "?")
+
+# Hand-picked inputs that are checked before the random ones
+EDGE_CASES = (
+    "",
+    " ",
+    "ಾ",
+    KANNADA_VIRAMA,
+    "ಂ",
+    "ಃ",
+    "ಕ್",
+    "ಕ್ ",
+    "ಕ್್",
+    "್ಕ",
+    "ಾಕ",
+    "ಕಾಾ",
+    "ಕಂಃ",
+    "ಅ್",
+    "ಅಂ",
+    "ಕ್\u200cಷ",
+    "ಕ್\u200dಷ",
+    "ಕ್ಷ್ಮ್ಯ",
+    "ಸ್ತ್ರೀ",
+    "ಪೋಸ್ಟ್ ಆಫೀಸ್",
+    "ಬಸ್ stop",
+    "abc",
+    "೧೨೩",
+    "ಕ಼",
+)
+
+# Engines loaded in this process, by file path
+_engines = {}
+
+
+def _random_kannada_char(rng):
+    """Return any code point of the Kannada block, assigned or not."""
+    return chr(rng.randrange(KANNADA_RANGE.start, KANNADA_RANGE.stop))
+
+
+def _random_syllable(rng):
+    """Return a well-formed cluster, vowel or dead consonant."""
+    if rng.random() < 0.15:
+        syllable = rng.choice(_VOWELS)
+    else:
+        links = 1 + (rng.random() < 0.25) + (rng.random() < 0.05)
+        syllable = KANNADA_VIRAMA.join(rng.choices(_CONSONANTS, k=links))
+        roll = rng.random()
+        if roll < 0.55:
+            syllable += rng.choice(_MARKS)
+        elif roll < 0.65:
+            syllable += KANNADA_VIRAMA
+    if rng.random() < 0.08:
+        syllable += rng.choice(_MODIFIERS)
+    return syllable
+
+
+def _random_word(rng):
+    """Return a word of well-formed syllables."""
+    return "".join(
+        _random_syllable(rng) for _ in range(rng.randint(1, 5))
+    )
+
+
+def _mutate(rng, text):
+    """Insert one malformed piece: an orphan sign, joiner or stray char."""
+    roll = rng.random()
+    if roll < 0.3:
+        piece = rng.choice(_MARKS + _MODIFIERS)
+    elif roll < 0.5:
+        piece = KANNADA_VIRAMA
+    elif roll < 0.6:
+        piece = rng.choice(_JOINERS)
+    elif roll < 0.8:
+        piece = rng.choice(_LATIN)
+    else:
+        piece = _random_kannada_char(rng)
+    position = rng.randint(0, len(text))
+    return text[:position] + piece + text[position:]
+
+
+def _random_phrase(rng):
+    """Return words, some Latin, joined by spaces or punctuation."""
+    words = []
+    for _ in range(rng.randint(2, 4)):
+        if rng.random() < 0.2:
+            words.append("".join(rng.choices(_LATIN, k=rng.randint(1, 6))))
+        else:
+            words.append(_random_word(rng))
+    text = words[0]
+    for word in words[1:]:
+        text += rng.choice(_SEPARATORS) + word
+    return text
+
+
+def _random_noise(rng):
+    """Return a short string of arbitrary Kannada, Latin and spaces."""
+    chars = []
+    for _ in range(rng.randint(0, 12)):
+        roll = rng.random()
+        if roll < 0.75:
+            chars.append(_random_kannada_char(rng))
+        elif roll < 0.9:
+            chars.append(rng.choice(_LATIN))
+        else:
+            chars.append(rng.choice(_SEPARATORS))
+    return "".join(chars)
+
+
+def generate_cases(seed, batch, count):
+    """Return the ``count`` fuzz cases of one batch, reproducibly."""
+    rng = random.Random(f"{seed}:{batch}")
+    cases = list(EDGE_CASES) if batch == 0 else []
+    while len(cases) < count:
+        roll = rng.random()
+        if roll < 0.35:
+            case = _random_word(rng)
+        elif roll < 0.55:
+            case = _mutate(rng, _random_word(rng))
+        elif roll < 0.7:
+            case = _random_phrase(rng)
+        elif roll < 0.8:
+            case = _mutate(rng, _random_phrase(rng))
+        else:
+            case = _random_noise(rng)
+        cases.append(case)
+    return cases[:count]
+
+
+def load_engine(path):
+    """Import an engine module from a file, once per process."""
+    engine = _engines.get(path)
+    if engine is None:
+        name = f"_fuzz_engine_{len(_engines)}"
+        spec = importlib.util.spec_from_file_location(name, path)
+        engine = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(engine)
+        _engines[path] = engine
+    return engine
+
+
+def engine_output(engine, text):
+    """Return everything an engine produces for one input."""
+    return (
+        engine.segment_kannada_word(text),
+        engine.transliterate_kannada_advanced(text),
+    )
+
+
+def _time_engine(engine, cases):
+    """Run an engine over the cases; returns ``(outputs, seconds)``."""
+    start = time.perf_counter()
+    outputs = [engine_output(engine, case) for case in cases]
+    return outputs, time.perf_counter() - start
+
+
+def _run_batches(reference_path, candidate_path, seed, batch_size, batches):
+    """
+    Fuzz whole batches inside a worker. Returns one
+    ``(cases, mismatches, reference seconds, candidate seconds)`` tuple
+    per batch.
+    """
+    reference = load_engine(reference_path)
+    candidate = load_engine(candidate_path)
+    results = []
+    for batch in batches:
+        cases = generate_cases(seed, batch, batch_size)
+        # Alternate which engine runs first so neither gains from warm-up
+        if batch % 2:
+            actual, candidate_seconds = _time_engine(candidate, cases)
+            expected, reference_seconds = _time_engine(reference, cases)
+        else:
+            expected, reference_seconds = _time_engine(reference, cases)
+            actual, candidate_seconds = _time_engine(candidate, cases)
+        mismatches = [
+            case
+            for case, want, got in zip(cases, expected, actual)
+            if want != got
+        ]
+        results.append(
+            (len(cases), mismatches, reference_seconds, candidate_seconds)
+        )
+    return results
+
+
+def shrink(text, differs):
+    """
+    Delete ever smaller runs of characters from text while ``differs``
+    still holds for the result, and return the smallest input found.
+    """
+    size = len(text) // 2 or 1
+    while text and size >= 1:
+        position = 0
+        shrunk = False
+        while position < len(text):
+            smaller = text[:position] + text[position + size :]
+            if differs(smaller):
+                text = smaller
+                shrunk = True
+            else:
+                position += size
+        if not shrunk:
+            size //= 2
+    return text
+
+
+def _resolve_engine(spec, temp_dir):
+    """Return a file path for an engine given as a path or git revision."""
+    if spec.endswith(".py"):
+        return os.path.abspath(spec)
+    scripts_dir = os.path.dirname(os.path.abspath(__file__))
+    source = subprocess.run(
+        ["git", "show", f"{spec}:./{ENGINE_MODULE}"],
+        cwd=scripts_dir,
+        capture_output=True,
+        check=True,
+    ).stdout
+    path = os.path.join(temp_dir, f"{spec.replace('/', '_')}.py")
+    with open(path, "wb") as f:
+        f.write(source)
+    return path
+
+
+def fuzz(
+    reference_path,
+    candidate_path,
+    cases=DEFAULT_CASES,
+    seed=0,
+    batch_size=DEFAULT_BATCH_SIZE,
+    executor=None,
+    max_workers=None,
+):
+    """
+    Compare two engines on ``cases`` generated inputs.
+
+    Returns a dict with the number of cases, the distinct mismatching
+    inputs in the order found and the total time spent in each engine.
+    """
+    batches = -(-cases // batch_size)
+    run = functools.partial(
+        _run_batches, reference_path, candidate_path, seed, batch_size
+    )
+    report = {
+        "cases": 0,
+        "mismatches": [],
+        "reference_seconds": 0.0,
+        "candidate_seconds": 0.0,
+    }
+    seen = set()
+    for count, mismatches, reference_seconds, candidate_seconds in map_chunks(
+        run, range(batches), 1, executor, max_workers
+    ):
+        report["cases"] += count
+        report["reference_seconds"] += reference_seconds
+        report["candidate_seconds"] += candidate_seconds
+        for case in mismatches:
+            if case not in seen:
+                seen.add(case)
+                report["mismatches"].append(case)
+    return report
+
+
+def format_mismatch(text, reference, candidate):
+    """Describe one reproducer with both engines' output."""
+    codepoints = " ".join(f"U+{ord(char):04X}" for char in text)
+    return "\n".join(
+        [
+            f"@@ {text!r} ({codepoints})",
+            f"-{engine_output(reference, text)!r}",
+            f"+{engine_output(candidate, text)!r}",
+        ]
+    )
+
+
+def main():
+    """Fuzz a candidate engine against the reference engine."""
+    parser = argparse.ArgumentParser(
+        description="Compare two transliteration engines on fuzzed input."
+    )
+    parser.add_argument(
+        "--reference",
+        default="HEAD",
+        help="reference engine: a .py file or a git revision "
+        "(default: HEAD)",
+    )
+    parser.add_argument(
+        "--candidate",
+        default=os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), ENGINE_MODULE
+        ),
+        help="candidate engine: a .py file or a git revision "
+        "(default: the working tree)",
+    )
+    parser.add_argument(
+        "--cases",
+        type=int,
+        default=DEFAULT_CASES,
+        help="number of inputs to generate",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="generator seed")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="inputs per worker task",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=("process", "thread"),
+        help="worker pool type (default: process)",
+    )
+    parser.add_argument(
+        "--workers", type=int, help="number of worker processes"
+    )
+    parser.add_argument(
+        "--reports",
+        type=int,
+        default=DEFAULT_REPORTS,
+        help="number of mismatches to shrink and print",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        reference_path = _resolve_engine(args.reference, temp_dir)
+        candidate_path = _resolve_engine(args.candidate, temp_dir)
+
+        with profiling.stage("fuzz"):
+            report = fuzz(
+                reference_path,
+                candidate_path,
+                args.cases,
+                args.seed,
+                args.batch_size,
+                args.executor,
+                args.workers,
+            )
+
+        reference = load_engine(reference_path)
+        candidate = load_engine(candidate_path)
+
+        def differs(text):
+            return engine_output(reference, text) != engine_output(
+                candidate, text
+            )
+
+        with profiling.stage("shrink"):
+            reproducers = []
+            for case in report["mismatches"]:
+                if len(reproducers) >= args.reports:
+                    break
+                reproducer = shrink(case, differs)
+                if reproducer not in reproducers:
+                    reproducers.append(reproducer)
+        for reproducer in reproducers:
+            print(format_mismatch(reproducer, reference, candidate))
+
+    speedup = (
+        report["reference_seconds"] / report["candidate_seconds"]
+        if report["candidate_seconds"]
+        else 0.0
+    )
+    print(
+        f"Cases: {report['cases']}, mismatches: {len(report['mismatches'])}",
+        file=sys.stderr,
+    )
+    print(
+        f"Reference {report['reference_seconds']:.3f}s, "
+        f"candidate {report['candidate_seconds']:.3f}s "
+        f"({speedup:.2f}x)",
+        file=sys.stderr,
+    )
+    profiling.print_summary()
+    sys.exit(1 if report["mismatches"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,25 +3,111 @@
 Generate a corrected dictionary with proper segmentation.
 """
 
-import json
+import argparse
+import contextlib
+import itertools
 import os
 import sys
 
 # Add the correct_transliteration module to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from asset_manifest import client_asset_names, write_asset_manifest
+from build_manifest import (
+    IncrementalPlan,
+    current_rule_tables,
+    load_manifest,
+    manifest_path_for,
+)
+from check_dictionary import DictionaryCheckError, DictionaryChecker
+from compact_dictionary import CompactDictionaryWriter, compact_path_for
 from correct_transliteration import (
-    segment_kannada_word,
-    transliterate_kannada_advanced,
+    SCHEMES,
+    analyze_many,
+    analyze_schemes_many,
+    scheme_field,
+)
+from dedupe_words import dedupe_entries, duplicate_meanings
+from dictionary_io import iter_dictionary, write_dictionary
+from precompress import precompress_tree
+from prefix_index import PrefixIndexWriter, index_path_for
+from shard_dictionary import DEFAULT_SHARD_SIZE, ShardedDictionaryWriter
+from transliteration_variants import (
+    MAX_VARIANTS,
+    VariantsWriter,
+    variants_path_for,
 )
 
 
+def get_dictionary_path():
+    """Get the path of the dictionary file."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "data", "dictionary.json")
+
+
 def load_current_dictionary():
     """Load the current dictionary."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    dict_path = os.path.join(base_dir, "data", "dictionary.json")
+    return list(iter_dictionary(get_dictionary_path()))
 
-    with open(dict_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+
+def iter_fixed_entries(entries, plan=None, schemes=()):
+    """
+    Yield entries with corrected segmentation as a streaming pipeline.
+
+    With an ``IncrementalPlan``, entries unchanged since the last build are
+    passed through without being re-segmented. Each named scheme in
+    ``schemes`` adds a ``tr_<scheme>`` field to the entry and to each of
+    its segments, produced by the same tokenizer pass.
+    """
+    fields = [scheme_field(scheme) for scheme in schemes]
+    fields = [field for field in fields if field != "tr"]
+
+    if plan is None:
+        checked = ((entry, None, False) for entry in entries)
+    else:
+        checked = ((entry, *plan.check(entry)) for entry in entries)
+    if fields:
+        # Entries written without one of the fields cannot be reused
+        checked = (
+            (
+                entry,
+                digest,
+                reusable and all(field in entry for field in fields),
+            )
+            for entry, digest, reusable in checked
+        )
+
+    checked, pending = itertools.tee(checked)
+    words = (entry["kn"] for entry, _, reusable in pending if not reusable)
+    if fields:
+        analyses = analyze_schemes_many(words, schemes)
+    else:
+        analyses = analyze_many(words)
+    analyses = profiling.timed_iter("segment", analyses)
+
+    for entry, digest, reusable in checked:
+        if reusable:
+            correct_segments = entry["segments"]
+            transliterations = {
+                field: entry[field] for field in ["tr", *fields]
+            }
+        elif fields:
+            correct_segments, transliterations = next(analyses)
+            digest = None
+        else:
+            correct_segments, correct_transliteration = next(analyses)
+            transliterations = {"tr": correct_transliteration}
+            digest = None
+
+        fixed_entry = {
+            "kn": entry["kn"],
+            **transliterations,
+            "en": entry["en"],
+            "segments": correct_segments,
+        }
+        if plan is not None:
+            plan.record(fixed_entry, digest)
+        yield fixed_entry
 
 
 def fix_dictionary_segmentation():
@@ -33,26 +119,10 @@ def fix_dictionary_segmentation():
 
     fixed_dictionary = []
 
-    for i, entry in enumerate(dictionary):
+    for i, fixed_entry in enumerate(iter_fixed_entries(dictionary)):
         if i % 50 == 0:
             print(f"Processing entry {i + 1}/{len(dictionary)}...")
 
-        kannada_word = entry["kn"]
-
-        # Get correct segmentation
-        correct_segments = segment_kannada_word(kannada_word)
-
-        # Get correct transliteration
-        correct_transliteration = transliterate_kannada_advanced(kannada_word)
-
-        # Create fixed entry
-        fixed_entry = {
-            "kn": kannada_word,
-            "tr": correct_transliteration,
-            "en": entry["en"],
-            "segments": correct_segments,
-        }
-
         fixed_dictionary.append(fixed_entry)
 
     return fixed_dictionary
@@ -60,34 +130,251 @@ def fix_dictionary_segmentation():
 
 def save_fixed_dictionary(dictionary):
     """Save the fixed dictionary."""
-    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    dict_path = os.path.join(base_dir, "data", "dictionary.json")
-
-    with open(dict_path, "w", encoding="utf-8") as f:
-        json.dump(dictionary, f, ensure_ascii=False, indent=2)
+    dict_path = get_dictionary_path()
+    write_dictionary(dictionary, dict_path)
 
     print(f"Fixed dictionary saved to: {dict_path}")
 
 
+def stream_fix_dictionary(
+    input_path,
+    output_path,
+    samples,
+    plan=None,
+    sinks=(),
+    progress=True,
+    spill_dir=None,
+    schemes=(),
+    checker=None,
+):
+    """
+    Fix the dictionary as a streaming pipeline.
+
+    Entries are read one at a time, NFC-normalized and deduplicated,
+    re-segmented and written incrementally; the output file is replaced
+    atomically at the end. A first pass over the input merges the meanings
+    of duplicated words, or with ``spill_dir``, deduplication goes through
+    temporary files instead. ``schemes`` names extra
+    transliteration schemes to emit for every entry and segment. Every
+    fixed entry is also passed to the ``add`` method of each sink. The
+    first entries are collected into ``samples`` for reporting. With a
+    DictionaryChecker as ``checker``, an inconsistent entry makes the
+    rebuild fail before the output is replaced. Returns the entry count.
+    """
+
+    def report(entries):
+        for i, entry in enumerate(entries):
+            if progress and i % 50 == 0:
+                print(f"Processing entry {i + 1}...")
+            if len(samples) < 3:
+                samples.append(entry)
+            for sink in sinks:
+                sink.add(entry)
+            if checker is not None:
+                checker.add(entry)
+            yield entry
+        # Raised while write_dictionary is still open, so nothing is
+        # replaced and the sinks see the error too
+        if checker is not None:
+            checker.verify()
+
+    duplicates = None
+    if spill_dir is None:
+        with profiling.stage("dedupe"):
+            duplicates = duplicate_meanings(iter_dictionary(input_path))
+
+    entries = profiling.timed_iter("load", iter_dictionary(input_path))
+    entries = profiling.timed_iter(
+        "dedupe",
+        dedupe_entries(entries, spill_dir, duplicates=duplicates),
+    )
+    fixed_entries = iter_fixed_entries(entries, plan, schemes)
+    with profiling.stage("serialize"):
+        return write_dictionary(report(fixed_entries), output_path)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        "output",
+        nargs="?",
+        default=get_dictionary_path(),
+        help="output path; a .jsonl suffix writes one entry per line",
+    )
+    parser.add_argument(
+        "--shard-size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help="maximum number of entries per client shard",
+    )
+    parser.add_argument(
+        "--by-category",
+        action="store_true",
+        help="group client shards by word category",
+    )
+    parser.add_argument(
+        "--spill-dir",
+        help="deduplicate through temporary files in this directory",
+    )
+    parser.add_argument(
+        "--schemes",
+        nargs="+",
+        default=[],
+        choices=sorted(SCHEMES),
+        help="also emit tr_<scheme> fields in these transliteration schemes",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="ignore the build manifest and re-segment every entry",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings and tokenizer branch counts",
+    )
+    return parser.parse_args()
+
+
+def build_dictionary(
+    input_path,
+    output_path,
+    shard_size=DEFAULT_SHARD_SIZE,
+    by_category=False,
+    spill_dir=None,
+    schemes=(),
+    full=False,
+    progress=True,
+):
+    """
+    Run the whole rebuild: fix the dictionary through the checker and the
+    client sinks, save the build manifest, hash the client assets and
+    precompress the data directory.
+
+    Returns a dict with the entry count, the sample entries, the paths
+    written, the asset manifest hash, the reused and rebuilt counts and the
+    number of segments whose variants were truncated. Raises
+    DictionaryCheckError before any file is replaced if an entry fails the
+    checks.
+    """
+    manifest_path = manifest_path_for(output_path)
+    manifest = None if full else load_manifest(manifest_path)
+    plan = IncrementalPlan(manifest, current_rule_tables(schemes), schemes)
+    if progress and plan.affected_clusters:
+        print(
+            f"Rule tables changed for {len(plan.affected_clusters)} "
+            "clusters; rebuilding entries that contain them"
+        )
+
+    samples = []
+    data_dir = os.path.dirname(output_path)
+    paths = {
+        "dictionary": output_path,
+        "compact": compact_path_for(output_path),
+        "shards": os.path.join(data_dir, "shards"),
+        "index": index_path_for(output_path),
+        "variants": variants_path_for(output_path),
+    }
+    with contextlib.ExitStack() as stack:
+        variants = stack.enter_context(VariantsWriter(paths["variants"]))
+        sinks = [
+            stack.enter_context(CompactDictionaryWriter(paths["compact"])),
+            stack.enter_context(
+                ShardedDictionaryWriter(
+                    paths["shards"], shard_size, by_category
+                )
+            ),
+            stack.enter_context(PrefixIndexWriter(paths["index"])),
+            variants,
+        ]
+        total = stream_fix_dictionary(
+            input_path,
+            output_path,
+            samples,
+            plan,
+            sinks,
+            progress=progress,
+            spill_dir=spill_dir,
+            schemes=schemes,
+            checker=DictionaryChecker(),
+        )
+    with profiling.stage("manifest"):
+        plan.save(manifest_path)
+    with profiling.stage("hash"):
+        assets = write_asset_manifest(
+            data_dir,
+            client_asset_names(
+                data_dir,
+                [
+                    os.path.basename(paths[name])
+                    for name in ("compact", "index", "variants")
+                ]
+                + ["shards/*.json"],
+            ),
+        )
+    with profiling.stage("compress"):
+        precompress_tree(
+            os.path.dirname(data_dir), (os.path.basename(data_dir),)
+        )
+    return {
+        "total": total,
+        "samples": samples,
+        "paths": paths,
+        "assets_hash": assets["hash"],
+        "reused": plan.reused,
+        "rebuilt": plan.rebuilt,
+        "truncated_variants": variants.truncated,
+    }
+
+
 def main():
     """Main function."""
+    args = parse_args()
+    if args.profile:
+        profiling.enable_profiling()
     print("Fixing dictionary segmentation...")
 
     try:
-        fixed_dictionary = fix_dictionary_segmentation()
-        save_fixed_dictionary(fixed_dictionary)
+        build = build_dictionary(
+            get_dictionary_path(),
+            args.output,
+            args.shard_size,
+            args.by_category,
+            spill_dir=args.spill_dir,
+            schemes=args.schemes,
+            full=args.full,
+        )
+        paths = build["paths"]
+        print(f"Fixed dictionary saved to: {paths['dictionary']}")
+        print(f"Compact dictionary saved to: {paths['compact']}")
+        print(f"Client shards saved to: {paths['shards']}")
+        print(f"Prefix index saved to: {paths['index']}")
+        print(f"Accepted variants saved to: {paths['variants']}")
+        if build["truncated_variants"]:
+            print(
+                f"Kept the {MAX_VARIANTS} closest variants of "
+                f"{build['truncated_variants']} segments"
+            )
+        print(f"Asset manifest version: {build['assets_hash']}")
+        print(f"Reused {build['reused']} entries, rebuilt {build['rebuilt']}")
 
         print("\nSample fixed entries:")
-        for i, entry in enumerate(fixed_dictionary[:3]):
+        for i, entry in enumerate(build["samples"]):
             print(f"\n{i + 1}. {entry['kn']} -> {entry['tr']} ({entry['en']})")
             print("   Segments:")
             for seg in entry["segments"]:
                 print(f"     {seg['kn']} -> {seg['tr']}")
 
         print(
-            f"\nDictionary fixed successfully! Total entries: {len(fixed_dictionary)}"
+            "\nDictionary fixed successfully! Total entries: "
+            f"{build['total']}"
         )
+        profiling.print_summary()
 
+    except DictionaryCheckError as e:
+        print(f"Dictionary check failed: {e}")
+        sys.exit(1)
     except Exception as e:
         print(f"Error fixing dictionary: {e}")
         raise
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Precompressed gzip copies of the files the web client downloads.
+
+Every text file of the app shell and data/ gets a ``<name>.gz`` sibling
+compressed at the highest level, so serve.py can answer gzip requests
+without compressing anything per request. Copies are only rewritten when
+their source is newer, and files that gzip does not make smaller get no
+copy. The output is deterministic (no timestamp in the gzip header):
+
+    python precompress.py
+"""
+
+import argparse
+import gzip
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from dictionary_io import atomic_write
+
+GZIP_SUFFIX = ".gz"
+GZIP_LEVEL = 9
+
+# Files and directories to precompress, relative to the repository root
+PRECOMPRESS_PATHS = ("index.html", "sw.js", "assets", "data")
+
+COMPRESSIBLE_SUFFIXES = (".html", ".css", ".js", ".json", ".svg", ".txt")
+
+
+def gzip_path_for(path):
+    """Get the path of the precompressed copy of a file."""
+    return path + GZIP_SUFFIX
+
+
+def iter_compressible(root, paths=PRECOMPRESS_PATHS):
+    """Yield the compressible files under the given paths of root."""
+    for name in paths:
+        path = os.path.join(root, name)
+        if os.path.isfile(path):
+            if path.endswith(COMPRESSIBLE_SUFFIXES):
+                yield path
+            continue
+        for directory, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            for file_name in sorted(files):
+                if not file_name.startswith(".") and file_name.endswith(
+                    COMPRESSIBLE_SUFFIXES
+                ):
+                    yield os.path.join(directory, file_name)
+
+
+def is_fresh(path):
+    """Return True if a file's gzip copy exists and is not older."""
+    try:
+        return (
+            os.stat(gzip_path_for(path)).st_mtime_ns
+            >= os.stat(path).st_mtime_ns
+        )
+    except FileNotFoundError:
+        return False
+
+
+def precompress_file(path, level=GZIP_LEVEL):
+    """
+    Write the gzip copy of one file. Returns True if a copy was written and
+    False if compression would not make the file smaller.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    compressed = gzip.compress(data, compresslevel=level, mtime=0)
+    target = gzip_path_for(path)
+    if len(compressed) >= len(data):
+        if os.path.exists(target):
+            os.remove(target)
+        return False
+    with atomic_write(target, binary=True) as f:
+        f.write(compressed)
+    return True
+
+
+def precompress_tree(root, paths=PRECOMPRESS_PATHS, force=False):
+    """
+    Precompress every compressible file under root that has no fresh copy
+    and remove copies whose source is gone. Returns the number of copies
+    written.
+    """
+    written = 0
+    sources = set()
+    for path in iter_compressible(root, paths):
+        sources.add(path)
+        if (force or not is_fresh(path)) and precompress_file(path):
+            written += 1
+
+    # Drop copies of files that no longer exist, e.g. old hashed assets
+    for name in paths:
+        for directory, _, files in os.walk(os.path.join(root, name)):
+            for file_name in files:
+                if file_name.endswith(GZIP_SUFFIX):
+                    path = os.path.join(directory, file_name)
+                    if path[: -len(GZIP_SUFFIX)] not in sources:
+                        os.remove(path)
+    return written
+
+
+def main():
+    """Precompress the app shell and data files."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description="Write gzip copies of the web client's files."
+    )
+    parser.add_argument(
+        "root",
+        nargs="?",
+        default=base_dir,
+        help="site root holding index.html",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="recompress files whose copy is up to date",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    with profiling.stage("compress"):
+        written = precompress_tree(args.root, force=args.force)
+
+    print(f"Precompressed {written} files under: {args.root}")
+    profiling.print_summary()
+
+
+if __name__ == "__main__":
+    main()
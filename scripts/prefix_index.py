@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Transliteration prefix index for dictionary search and autocomplete.
+
+Each entry is indexed under its ``tr`` value and under the concatenation
+of its segment transliterations (when different), lowercased. The keys
+are stored as one sorted array next to the entry id they belong to, so a
+prefix query is a binary search followed by a short forward scan:
+
+    {"version": 1,
+     "entries": [[kn, tr, en], ...],
+     "keys": ["dhanyavaada", "dhanyavada", ...],
+     "ids": [1, 1, ...]}
+
+fix_dictionary_segmentation.py writes the index on every rebuild and
+assets/js/script.js loads its content-hashed copy for client-side search.
+"""
+
+import argparse
+import bisect
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from dictionary_io import atomic_write, iter_dictionary
+
+PREFIX_INDEX_VERSION = 1
+
+_SEPARATORS = (",", ":")
+
+
+def index_path_for(dict_path):
+    """Get the prefix index path that belongs to a dictionary file."""
+    root, _ = os.path.splitext(dict_path)
+    return root + ".index.json"
+
+
+def normalize_query(text):
+    """Normalize a transliteration for indexing and lookup."""
+    return text.strip().lower()
+
+
+def index_keys(entry):
+    """Return the distinct normalized keys an entry is indexed under."""
+    keys = [normalize_query(entry["tr"])]
+    joined = normalize_query(
+        "".join(segment["tr"] for segment in entry["segments"])
+    )
+    if joined != keys[0]:
+        keys.append(joined)
+    return [key for key in keys if key]
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over entry transliterations."""
+
+    def __init__(self, entries, keys, ids):
+        self.entries = entries
+        self.keys = keys
+        self.ids = ids
+
+    @classmethod
+    def from_entries(cls, entries):
+        """Build an index from dictionary entries."""
+        builder = PrefixIndexBuilder()
+        for entry in entries:
+            builder.add(entry)
+        return builder.build()
+
+    @classmethod
+    def load(cls, path):
+        """Load an index written by ``save``."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != PREFIX_INDEX_VERSION:
+            raise ValueError(f"Unsupported prefix index version in {path}")
+        return cls(data["entries"], data["keys"], data["ids"])
+
+    def save(self, path):
+        """Atomically write the index as compact JSON."""
+        data = {
+            "version": PREFIX_INDEX_VERSION,
+            "entries": self.entries,
+            "keys": self.keys,
+            "ids": self.ids,
+        }
+        with atomic_write(path) as f:
+            json.dump(data, f, ensure_ascii=False, separators=_SEPARATORS)
+
+    def search(self, prefix, limit=10):
+        """
+        Return up to ``limit`` entries whose transliteration starts with
+        ``prefix``, in key order and without duplicates.
+        """
+        prefix = normalize_query(prefix)
+        if not prefix:
+            return []
+
+        results = []
+        seen = set()
+        position = bisect.bisect_left(self.keys, prefix)
+        while (
+            position < len(self.keys)
+            and len(results) < limit
+            and self.keys[position].startswith(prefix)
+        ):
+            entry_id = self.ids[position]
+            if entry_id not in seen:
+                seen.add(entry_id)
+                kn, tr, en = self.entries[entry_id]
+                results.append({"kn": kn, "tr": tr, "en": en})
+            position += 1
+        return results
+
+
+class PrefixIndexBuilder:
+    """Accumulate index rows and keys one entry at a time."""
+
+    def __init__(self):
+        self._rows = []
+        self._pairs = []
+
+    def add(self, entry):
+        """Index one dictionary entry."""
+        entry_id = len(self._rows)
+        self._rows.append([entry["kn"], entry["tr"], entry["en"]])
+        self._pairs.extend((key, entry_id) for key in index_keys(entry))
+
+    def build(self):
+        """Sort the collected keys into a PrefixIndex."""
+        self._pairs.sort()
+        return PrefixIndex(
+            self._rows,
+            [key for key, _ in self._pairs],
+            [entry_id for _, entry_id in self._pairs],
+        )
+
+
+class PrefixIndexWriter(PrefixIndexBuilder):
+    """
+    Streaming sink that writes the prefix index of the entries it sees.
+
+    Only the index rows and keys are kept in memory; the index is sorted
+    and written atomically when the block exits.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            self.build().save(self.path)
+        return False
+
+
+def main():
+    """Build the prefix index for data/dictionary.json or query it."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description="Build or query the transliteration prefix index."
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default=os.path.join(base_dir, "data", "dictionary.json"),
+        help="dictionary file to index",
+    )
+    parser.add_argument(
+        "--query", help="print entries matching this prefix instead"
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    index_path = index_path_for(args.input)
+
+    if args.query is not None:
+        with profiling.stage("load"):
+            index = PrefixIndex.load(index_path)
+        with profiling.stage("search"):
+            results = index.search(args.query)
+        for entry in results:
+            print(f"{entry['kn']} -> {entry['tr']} ({entry['en']})")
+    else:
+        entries = profiling.timed_iter("load", iter_dictionary(args.input))
+        with profiling.stage("serialize"):
+            with PrefixIndexWriter(index_path) as writer:
+                for entry in entries:
+                    writer.add(entry)
+        print(f"Prefix index saved to: {index_path}")
+
+    profiling.print_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Lightweight instrumentation for the dictionary scripts.
+
+Records exclusive wall time per pipeline stage (load, dedupe, segment,
+transliterate, serialize) and reports the tokenizer branch counters from
+correct_transliteration. Everything is disabled by default and then costs
+a single None check per call site; the scripts turn it on with their
+``--profile`` flag.
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import correct_transliteration
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+class Profiler:
+    """Accumulates exclusive wall time per stage."""
+
+    def __init__(self):
+        self.seconds = {}
+        self.calls = {}
+        self._stack = []
+        self._started = time.perf_counter()
+
+    def _enter(self, name):
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit(self):
+        name, start, child_seconds = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        self.seconds[name] = (
+            self.seconds.get(name, 0.0) + elapsed - child_seconds
+        )
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self._stack:
+            self._stack[-1][2] += elapsed
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time a block, excluding time spent in nested stages."""
+        self._enter(name)
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def timed_iter(self, name, iterable):
+        """Yield from iterable, charging the time of each step to a stage."""
+        iterator = iter(iterable)
+        while True:
+            self._enter(name)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit()
+            yield item
+
+    def summary(self):
+        """Return a printable summary of stage times and branch counters."""
+        total = time.perf_counter() - self._started
+        lines = [f"Profile (total {total:.3f}s)", "  Stages:"]
+        for name, seconds in sorted(
+            self.seconds.items(), key=lambda item: -item[1]
+        ):
+            share = seconds / total * 100 if total else 0.0
+            lines.append(
+                f"    {name:<16} {seconds:>9.3f}s {share:>5.1f}% "
+                f"({self.calls[name]} calls)"
+            )
+
+        counts = correct_transliteration.branch_counts()
+        tokens = sum(counts.values())
+        lines.append(f"  Tokenizer branches ({tokens} tokens):")
+        for branch, count in sorted(counts.items(), key=lambda item: -item[1]):
+            share = count / tokens * 100 if tokens else 0.0
+            lines.append(f"    {branch:<16} {count:>10} {share:>5.1f}%")
+        return "\n".join(lines)
+
+
+# The active profiler; None when profiling is disabled
+_profiler = None
+
+
+def enable_profiling():
+    """Start collecting stage timings and tokenizer branch counters."""
+    global _profiler
+    _profiler = Profiler()
+    correct_transliteration.enable_branch_counters()
+    return _profiler
+
+
+def disable_profiling():
+    """Stop collecting and discard all measurements."""
+    global _profiler
+    _profiler = None
+    correct_transliteration.disable_branch_counters()
+
+
+def stage(name):
+    """Context manager timing a stage; a no-op when profiling is off."""
+    if _profiler is None:
+        return _NULL_STAGE
+    return _profiler.stage(name)
+
+
+def timed_iter(name, iterable):
+    """Charge iteration time to a stage; returns iterable unchanged if off."""
+    if _profiler is None:
+        return iterable
+    return _profiler.timed_iter(name, iterable)
+
+
+def print_summary(file=sys.stderr):
+    """Print the profile summary if profiling is enabled."""
+    if _profiler is not None:
+        print(_profiler.summary(), file=file)
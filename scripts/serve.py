@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Static file server for the web client on a local network.
+
+Serves the repository root like ``python -m http.server`` but is built
+for a classroom of devices loading the app at once:
+
+* requests run on a thread each, with a deep listen backlog for bursts
+* clients that accept gzip get the ``.gz`` copies written by
+  precompress.py, so nothing is compressed per request
+* every response carries a strong ETag and a matching If-None-Match is
+  answered with 304 Not Modified
+* content-hashed files under data/hashed/ are cached for a year; all
+  other files must be revalidated, which costs a 304 when unchanged
+
+Responses are kept in memory and re-read only when a file changes:
+
+    python serve.py --port 8000
+"""
+
+import argparse
+import functools
+import hashlib
+import http
+import http.server
+import io
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from asset_manifest import HASHED_DIR
+from precompress import gzip_path_for, precompress_tree
+
+DEFAULT_PORT = 8000
+LISTEN_BACKLOG = 1024
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Files larger than this are not kept in memory
+MAX_CACHED_SIZE = 16 << 20
+
+ETAG_SIZE = 16
+
+
+class FileCache:
+    """
+    File contents and ETags in memory, keyed by path and checked against
+    the file's size and modification time on every lookup.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        """
+        Return ``(body, etag, mtime)`` for a file, or None if it does not
+        exist. Files above MAX_CACHED_SIZE are read on every call.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        key = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(path)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+
+        with open(path, "rb") as f:
+            body = f.read()
+        digest = hashlib.blake2b(body, digest_size=ETAG_SIZE).hexdigest()
+        value = (body, f'"{digest}"', stat.st_mtime)
+        if stat.st_size <= MAX_CACHED_SIZE:
+            with self._lock:
+                self._entries[path] = (key, value)
+        return value
+
+
+def accepts_gzip(header):
+    """
+    Return True if an Accept-Encoding header allows gzip. An explicit
+    ``gzip`` entry takes precedence over ``*`` wherever it appears.
+    """
+    qualities = {}
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if coding not in ("gzip", "*"):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def etag_matches(header, etag):
+    """Return True if an If-None-Match header names the given ETag."""
+    if header is None:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in header.split(","))
+
+
+class StaticRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Serve files with gzip copies, ETags and cache headers."""
+
+    protocol_version = "HTTP/1.1"
+
+    def cache_control(self, path):
+        """Return the Cache-Control header for a file."""
+        relative = os.path.relpath(path, self.directory).replace(os.sep, "/")
+        if relative.startswith(f"data/{HASHED_DIR}/"):
+            return IMMUTABLE_CACHE_CONTROL
+        return REVALIDATE_CACHE_CONTROL
+
+    def send_head(self):
+        """Send the headers for a GET or HEAD and return the body."""
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            index = os.path.join(path, "index.html")
+            if not path.endswith("/") or not os.path.isfile(index):
+                # Let the base class redirect or list the directory
+                return super().send_head()
+            path = index
+        elif path.endswith("/") or not os.path.isfile(path):
+            return super().send_head()
+
+        files = self.server.files
+        gzip_path = gzip_path_for(path)
+        has_gzip = os.path.isfile(gzip_path)
+        served = None
+        if has_gzip and accepts_gzip(self.headers.get("Accept-Encoding")):
+            served = files.get(gzip_path)
+            # A copy older than its source is ignored until rebuilt
+            if served is not None and served[2] < os.stat(path).st_mtime:
+                served = None
+        encoding = "gzip" if served is not None else None
+        if served is None:
+            served = files.get(path)
+            if served is None:
+                self.send_error(http.HTTPStatus.NOT_FOUND, "File not found")
+                return None
+        body, etag, mtime = served
+
+        if etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(http.HTTPStatus.NOT_MODIFIED)
+            self.send_validators(path, etag, mtime, has_gzip)
+            self.end_headers()
+            return None
+
+        self.send_response(http.HTTPStatus.OK)
+        self.send_header("Content-Type", self.guess_type(path))
+        self.send_header("Content-Length", str(len(body)))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.send_validators(path, etag, mtime, has_gzip)
+        self.end_headers()
+        return io.BytesIO(body)
+
+    def send_validators(self, path, etag, mtime, has_gzip):
+        """Send the ETag and caching headers shared by 200 and 304."""
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        self.send_header("Cache-Control", self.cache_control(path))
+        if has_gzip:
+            self.send_header("Vary", "Accept-Encoding")
+
+    def log_message(self, format, *args):
+        """Log requests unless the server runs quietly."""
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class StaticServer(http.server.ThreadingHTTPServer):
+    """Threaded server holding the shared file cache."""
+
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
+    def __init__(self, address, handler, quiet=False):
+        self.files = FileCache()
+        self.quiet = quiet
+        super().__init__(address, handler)
+
+
+def main():
+    """Serve the web client."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description="Serve the web client with gzip, ETags and caching."
+    )
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_PORT, help="port to listen on"
+    )
+    parser.add_argument(
+        "--bind",
+        default="",
+        help="address to listen on (default: all interfaces)",
+    )
+    parser.add_argument(
+        "--directory",
+        default=base_dir,
+        help="site root to serve (default: the repository root)",
+    )
+    parser.add_argument(
+        "--no-precompress",
+        action="store_true",
+        help="serve existing gzip copies without refreshing them first",
+    )
+    parser.add_argument(
+        "--quiet", action="store_true", help="do not log every request"
+    )
+    args = parser.parse_args()
+
+    if not args.no_precompress:
+        written = precompress_tree(args.directory)
+        print(f"Precompressed {written} files")
+
+    handler = functools.partial(
+        StaticRequestHandler, directory=args.directory
+    )
+    with StaticServer((args.bind, args.port), handler, args.quiet) as server:
+        host, port = server.server_address[:2]
+        print(f"Serving {args.directory} at http://{host}:{port}/")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\nStopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Split the dictionary into small shards the web client can load lazily.
+
+Shards use the compact format from compact_dictionary.py and are listed in
+a manifest with their entry counts:
+
+    {"version": 1, "total": 258,
+     "shards": [{"file": "family-0.json", "category": "family",
+                 "count": 14}, ...]}
+
+The client fetches the manifest and one random shard to show the first
+word, then prefetches the remaining shards in the background.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from compact_dictionary import CompactDictionaryWriter
+from create_large_dictionary import WORD_CATEGORIES
+from dictionary_io import atomic_write, iter_dictionary
+
+SHARD_MANIFEST_VERSION = 1
+SHARD_MANIFEST_NAME = "manifest.json"
+DEFAULT_SHARD_SIZE = 100
+
+# Category used for words outside WORD_CATEGORIES, and when not grouping
+DEFAULT_CATEGORY = "words"
+
+
+def get_shard_dir():
+    """Get the default shard directory."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, "data", "shards")
+
+
+def category_lookup():
+    """Map each Kannada word in WORD_CATEGORIES to its first category."""
+    categories = {}
+    for category, words in WORD_CATEGORIES.items():
+        for kannada, _, _ in words:
+            categories.setdefault(kannada, category)
+    return categories
+
+
+class ShardedDictionaryWriter:
+    """
+    Stream entries into fixed-size shards and write their manifest.
+
+    Use as a context manager and call ``add`` for each entry. With
+    ``by_category`` each shard holds words from a single category of
+    WORD_CATEGORIES. On exit the manifest is written and shard files left
+    over from earlier builds are removed.
+    """
+
+    def __init__(
+        self, shard_dir, shard_size=DEFAULT_SHARD_SIZE, by_category=False
+    ):
+        if shard_size < 1:
+            raise ValueError("shard_size must be at least 1")
+        self.shard_dir = shard_dir
+        self.shard_size = shard_size
+        self.categories = category_lookup() if by_category else None
+        self.shards = []
+        self.total = 0
+        self._open_writers = {}
+        self._shard_counts = {}
+
+    def __enter__(self):
+        os.makedirs(self.shard_dir, exist_ok=True)
+        return self
+
+    def _close_writer(self, category, exc_info=(None, None, None)):
+        """Finish the open shard of a category and record it."""
+        writer = self._open_writers.pop(category)
+        writer.__exit__(*exc_info)
+        if exc_info[0] is None:
+            self.shards.append(
+                {
+                    "file": os.path.basename(writer.path),
+                    "category": category,
+                    "count": writer.count,
+                }
+            )
+
+    def add(self, entry):
+        """Append one dictionary entry to the shard of its category."""
+        category = DEFAULT_CATEGORY
+        if self.categories is not None:
+            category = self.categories.get(entry["kn"], DEFAULT_CATEGORY)
+
+        writer = self._open_writers.get(category)
+        if writer is None:
+            index = self._shard_counts.get(category, 0)
+            self._shard_counts[category] = index + 1
+            path = os.path.join(self.shard_dir, f"{category}-{index}.json")
+            writer = CompactDictionaryWriter(path).__enter__()
+            self._open_writers[category] = writer
+
+        writer.add(entry)
+        self.total += 1
+        if writer.count >= self.shard_size:
+            self._close_writer(category)
+
+    def __exit__(self, exc_type, exc, traceback):
+        exc_info = (exc_type, exc, traceback)
+        for category in list(self._open_writers):
+            self._close_writer(category, exc_info)
+        if exc_type is not None:
+            return False
+
+        manifest = {
+            "version": SHARD_MANIFEST_VERSION,
+            "total": self.total,
+            "shards": self.shards,
+        }
+        manifest_path = os.path.join(self.shard_dir, SHARD_MANIFEST_NAME)
+        with atomic_write(manifest_path) as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+        # Drop shards from earlier builds that are no longer referenced
+        current = {shard["file"] for shard in self.shards}
+        current.add(SHARD_MANIFEST_NAME)
+        for name in os.listdir(self.shard_dir):
+            if name.endswith(".json") and name not in current:
+                os.remove(os.path.join(self.shard_dir, name))
+        return False
+
+
+def shard_dictionary(
+    entries, shard_dir, shard_size=DEFAULT_SHARD_SIZE, by_category=False
+):
+    """Write entries into shards and return the list of shard records."""
+    with ShardedDictionaryWriter(shard_dir, shard_size, by_category) as writer:
+        for entry in entries:
+            writer.add(entry)
+    return writer.shards
+
+
+def main():
+    """Shard data/dictionary.json (or the given file) for the web client."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default=os.path.join(base_dir, "data", "dictionary.json"),
+        help="dictionary file to shard",
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=DEFAULT_SHARD_SIZE,
+        help="maximum number of entries per shard",
+    )
+    parser.add_argument(
+        "--by-category",
+        action="store_true",
+        help="group shards by the categories in WORD_CATEGORIES",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    shard_dir = get_shard_dir()
+    entries = profiling.timed_iter("load", iter_dictionary(args.input))
+    with profiling.stage("serialize"):
+        shards = shard_dictionary(
+            entries, shard_dir, args.size, args.by_category
+        )
+
+    print(f"Wrote {len(shards)} shards to: {shard_dir}")
+    for shard in shards:
+        print(f"  {shard['file']}: {shard['count']} entries")
+    profiling.print_summary()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Tests for build_manifest.py."""
+
+import json
+
+from build_manifest import (
+    IncrementalPlan,
+    changed_clusters,
+    current_rule_tables,
+    entry_hash,
+    load_manifest,
+    save_manifest,
+    transliteration_fields,
+)
+from correct_transliteration import analyze_schemes
+
+
+def built_entry(kn, schemes=()):
+    segments, transliterations = analyze_schemes(kn, schemes)
+    return {"kn": kn, **transliterations, "en": "", "segments": segments}
+
+
+def test_transliteration_fields():
+    assert transliteration_fields() == ("tr",)
+    assert transliteration_fields(["iast", "casual", "hk", "iast"]) == (
+        "tr",
+        "tr_iast",
+        "tr_hk",
+    )
+
+
+def test_entry_hash_covers_scheme_fields():
+    fields = transliteration_fields(["iast"])
+    entry = built_entry("ಸಂಸ್ಕೃತ", ["iast"])
+    digest = entry_hash(entry, fields)
+
+    changed = built_entry("ಸಂಸ್ಕೃತ", ["iast"])
+    changed["tr_iast"] = "samskrta"
+    assert entry_hash(changed, fields) != digest
+
+    changed = built_entry("ಸಂಸ್ಕೃತ", ["iast"])
+    changed["segments"][1]["tr_iast"] = "skr"
+    assert entry_hash(changed, fields) != digest
+
+    # A build without the scheme does not look at its fields
+    assert entry_hash(changed) == entry_hash(entry)
+    assert entry_hash(built_entry("ಸಂಸ್ಕೃತ"), fields) != digest
+
+
+def test_entry_hash_ignores_meaning():
+    entry = built_entry("ನಮಸ್ಕಾರ")
+    digest = entry_hash(entry)
+    entry["en"] = "hello"
+    assert entry_hash(entry) == digest
+
+
+def test_changed_clusters():
+    old = {"VOWELS": {"ಅ": "a", "ಆ": "aa"}, "CONJUNCTS": {"ಕ್ಷ": "ksha"}}
+    new = {"VOWELS": {"ಅ": "a", "ಆ": "A", "ಇ": "i"}}
+    assert changed_clusters(old, new) == {"ಆ", "ಇ", "ಕ್ಷ"}
+
+
+def test_manifest_round_trip(tmp_path):
+    path = str(tmp_path / "dictionary.json.manifest.json")
+    tables = current_rule_tables(["iast"])
+    digest = entry_hash(built_entry("ನಮಸ್ಕಾರ"))
+    save_manifest(path, tables, {digest})
+
+    manifest = load_manifest(path)
+    assert manifest["entries"] == {digest}
+    assert manifest["rules"] == tables
+
+
+def test_outdated_manifest_is_ignored(tmp_path):
+    path = tmp_path / "manifest.json"
+    save_manifest(str(path), current_rule_tables(), set())
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    manifest["segmenter_version"] -= 1
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    assert load_manifest(str(path)) is None
+    assert load_manifest(str(tmp_path / "missing.json")) is None
+
+
+def test_plan_reuses_unchanged_entries(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    schemes = ["iast"]
+    tables = current_rule_tables(schemes)
+    entry = built_entry("ನಮಸ್ಕಾರ", schemes)
+
+    plan = IncrementalPlan(None, tables, schemes)
+    assert plan.check(entry)[1] is False
+    plan.record(entry)
+    plan.save(path)
+
+    plan = IncrementalPlan(load_manifest(path), tables, schemes)
+    digest, reusable = plan.check(entry)
+    assert reusable
+    assert plan.check({"kn": "ನಮಸ್ಕಾರ"}) == (None, False)
+
+    # The same entry built without its IAST fields must be rebuilt
+    assert plan.check(built_entry("ನಮಸ್ಕಾರ"))[1] is False
+
+
+def test_plan_rebuilds_entries_with_changed_rules(tmp_path):
+    path = str(tmp_path / "manifest.json")
+    tables = current_rule_tables()
+    entries = [built_entry("ನಮಸ್ಕಾರ"), built_entry("ಲಕ್ಷ್ಮಿ")]
+
+    plan = IncrementalPlan(None, tables)
+    for entry in entries:
+        plan.record(entry)
+    plan.save(path)
+
+    changed = current_rule_tables()
+    changed["CONJUNCTS"] = dict(changed["CONJUNCTS"], ಕ್ಷ="x")
+    plan = IncrementalPlan(load_manifest(path), changed)
+    assert [plan.check(entry)[1] for entry in entries] == [True, False]
@@ -0,0 +1,107 @@
+"""Tests for check_dictionary.py and the check in the dictionary rebuild."""
+
+import os
+
+import pytest
+
+from check_dictionary import (
+    CHECKS,
+    REBUILD_CHECKS,
+    DictionaryCheckError,
+    DictionaryChecker,
+    check_dictionary,
+    check_entry,
+)
+from correct_transliteration import analyze_kannada_word
+from dictionary_io import iter_dictionary, write_dictionary
+from fix_dictionary_segmentation import stream_fix_dictionary
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+
+
+def fixed_entry(kn, en=""):
+    segments, tr = analyze_kannada_word(kn)
+    return {"kn": kn, "tr": tr, "en": en, "segments": segments}
+
+
+def test_consistent_entry():
+    assert check_entry(fixed_entry("ನಮಸ್ಕಾರ")) == []
+
+
+@pytest.mark.parametrize(
+    "word",
+    [
+        "ಟೂತ್ ಬ್ರಷ್",
+        "ಕ್‌ನ",  # ಕ್ + ZWNJ + ನ
+        "ಕ್‍ನ",  # ಕ್ + ZWJ + ನ
+    ],
+)
+def test_range_allows_word_separators(word):
+    assert check_entry(fixed_entry(word), ("range",)) == []
+
+
+def test_range_rejects_other_characters():
+    assert check_entry(fixed_entry("ಕa"), ("range",)) == [
+        ("range", "", "U+0061")
+    ]
+
+
+def test_mismatched_fields():
+    entry = fixed_entry("ನಮಸ್ಕಾರ")
+    entry["tr"] = "namaskaaara"
+    entry["segments"][0] = {"kn": "ನ", "tr": "nu"}
+    checks = [violation[0] for violation in check_entry(entry)]
+    assert checks == ["segments_tr", "roundtrip[0] ನ"]
+
+
+def test_rebuild_skips_roundtrip():
+    assert set(REBUILD_CHECKS) == set(CHECKS) - {"roundtrip"}
+    entry = fixed_entry("ನಮಸ್ಕಾರ")
+    entry["segments"][0]["tr"] = "nu"
+    entry["tr"] = "numaskaara"
+    checker = DictionaryChecker()
+    checker.add(entry)
+    checker.verify()
+    assert [v[0] for v in check_entry(entry)] == ["roundtrip[0] ನ"]
+
+
+def test_shipped_dictionary_passes():
+    path = os.path.join(DATA_DIR, "dictionary.json")
+    results = check_dictionary(iter_dictionary(path), executor="thread")
+    assert list(results) == []
+
+
+def test_checker_fails_rebuild_before_replacing_output(tmp_path, capsys):
+    input_path = str(tmp_path / "input.json")
+    output_path = str(tmp_path / "output.json")
+    write_dictionary(
+        [
+            {"kn": "ನಮಸ್ಕಾರ", "tr": "", "en": "", "segments": []},
+            {"kn": "abc", "tr": "", "en": "", "segments": []},
+        ],
+        input_path,
+    )
+
+    checker = DictionaryChecker()
+    with pytest.raises(DictionaryCheckError):
+        stream_fix_dictionary(
+            input_path, output_path, [], progress=False, checker=checker
+        )
+    assert not os.path.exists(output_path)
+    assert checker.bad_entries == 1
+    assert "@@ 1 abc range" in capsys.readouterr().out
+
+
+def test_checker_passes_consistent_rebuild(tmp_path):
+    input_path = str(tmp_path / "input.json")
+    output_path = str(tmp_path / "output.json")
+    write_dictionary(
+        [{"kn": "ನಮಸ್ಕಾರ", "tr": "", "en": "", "segments": []}], input_path
+    )
+    checker = DictionaryChecker()
+    total = stream_fix_dictionary(
+        input_path, output_path, [], progress=False, checker=checker
+    )
+    assert total == 1
+    assert checker.count == 1
+    assert list(iter_dictionary(output_path)) == [fixed_entry("ನಮಸ್ಕಾರ")]
@@ -0,0 +1,105 @@
+"""Tests for compact_dictionary.py."""
+
+import json
+import os
+
+import pytest
+
+from compact_dictionary import (
+    COMPACT_VERSION,
+    CompactDictionaryWriter,
+    compact_path_for,
+    decode_compact_dictionary,
+    write_compact_dictionary,
+)
+
+ENTRIES = [
+    {
+        "kn": "ನಮಸ್ಕಾರ",
+        "tr": "namaskaara",
+        "en": "hello",
+        "segments": [
+            {"kn": "ನ", "tr": "na"},
+            {"kn": "ಮ", "tr": "ma"},
+            {"kn": "ಸ್ಕಾ", "tr": "skaa"},
+            {"kn": "ರ", "tr": "ra"},
+        ],
+    },
+    {
+        "kn": "ಮನ",
+        "tr": "mana",
+        "en": "mind, \"heart\"",
+        "segments": [{"kn": "ಮ", "tr": "ma"}, {"kn": "ನ", "tr": "na"}],
+    },
+    {"kn": "", "tr": "", "en": "", "segments": []},
+]
+
+
+def load(path):
+    """Parse a JSON file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "dictionary.compact.json")
+    assert write_compact_dictionary(iter(ENTRIES), path) == len(ENTRIES)
+    assert decode_compact_dictionary(load(path)) == ENTRIES
+
+
+def test_segments_are_interned(tmp_path):
+    path = str(tmp_path / "dictionary.compact.json")
+    write_compact_dictionary(ENTRIES, path)
+    data = load(path)
+    assert data["version"] == COMPACT_VERSION
+    # Each distinct kn/tr pair is stored once, in order of first use
+    table = ["ನ", "na", "ಮ", "ma", "ಸ್ಕಾ", "skaa", "ರ", "ra"]
+    assert data["segments"] == table
+    assert data["entries"][1] == ["ಮನ", "mana", "mind, \"heart\"", 1, 0]
+    assert data["entries"][2] == ["", "", ""]
+
+
+def test_output_has_no_whitespace(tmp_path):
+    path = tmp_path / "dictionary.compact.json"
+    write_compact_dictionary(ENTRIES, str(path))
+    text = path.read_text(encoding="utf-8")
+    assert text == json.dumps(
+        load(path), ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def test_empty_dictionary(tmp_path):
+    path = str(tmp_path / "dictionary.compact.json")
+    assert write_compact_dictionary([], path) == 0
+    assert load(path) == {
+        "version": COMPACT_VERSION,
+        "entries": [],
+        "segments": [],
+    }
+
+
+def test_decoded_segments_are_independent(tmp_path):
+    path = str(tmp_path / "dictionary.compact.json")
+    write_compact_dictionary(ENTRIES, path)
+    entries = decode_compact_dictionary(load(path))
+    entries[0]["segments"][1]["tr"] = "changed"
+    assert entries[1]["segments"][0]["tr"] == "ma"
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    path = tmp_path / "dictionary.compact.json"
+    write_compact_dictionary(ENTRIES, str(path))
+    before = path.read_bytes()
+
+    with pytest.raises(KeyError):
+        with CompactDictionaryWriter(str(path)) as writer:
+            writer.add(ENTRIES[0])
+            writer.add({"kn": "ಅ"})
+    assert path.read_bytes() == before
+    assert os.listdir(tmp_path) == ["dictionary.compact.json"]
+
+
+def test_compact_path_for():
+    assert compact_path_for("data/dictionary.json") == (
+        "data/dictionary.compact.json"
+    )
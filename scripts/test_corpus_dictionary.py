@@ -0,0 +1,104 @@
+"""Tests for corpus_dictionary.py."""
+
+import collections
+import concurrent.futures
+import os
+import threading
+
+import pytest
+
+import corpus_dictionary
+from corpus_dictionary import (
+    count_corpus_words,
+    iter_corpus_files,
+    iter_frequency_entries,
+    kannada_words,
+    top_words,
+)
+from correct_transliteration import analyze_kannada_word
+
+TEXT = "ನಮಸ್ಕಾರ ಗೆಳೆಯ. ನಮಸ್ಕಾರ, ಹೇಗಿದ್ದೀಯ? hello ೧೨೩ ನಮಸ್ಕಾರ\n" * 50
+
+
+def _exit_worker(text):
+    """Stand-in for the chunk counter that kills its worker process."""
+    os._exit(1)
+
+
+def test_kannada_words():
+    assert kannada_words("ನಮಸ್ಕಾರ, world! ಗೆಳೆಯ") == ["ನಮಸ್ಕಾರ", "ಗೆಳೆಯ"]
+    # Digits and runs that start with a dangling sign are not words
+    assert kannada_words("೧೨೩ ಾಕ ಕ೧") == ["ಕ೧"]
+    decomposed = "\u0c95\u0cc6\u0cd5"  # ಕ + ೆ + length mark
+    assert kannada_words(decomposed) == ["\u0c95\u0cc7"]
+
+
+def test_iter_corpus_files(tmp_path):
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "two.txt").write_text("")
+    (tmp_path / "one.txt").write_text("")
+    (tmp_path / "notes.md").write_text("")
+    extra = tmp_path / "extra.dat"
+    extra.write_text("")
+    assert list(iter_corpus_files([str(tmp_path), str(extra)])) == [
+        str(tmp_path / "one.txt"),
+        str(tmp_path / "b" / "two.txt"),
+        str(extra),
+    ]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_count_corpus_words(tmp_path, executor):
+    for name in ("a.txt", "b.txt"):
+        (tmp_path / name).write_text(TEXT, encoding="utf-8")
+    # Small chunks split every file many times
+    counts = count_corpus_words(
+        [str(tmp_path)], workers=2, chunk_size=64, executor=executor
+    )
+    assert counts == collections.Counter(kannada_words(TEXT * 2))
+    assert counts["ನಮಸ್ಕಾರ"] == 300
+
+
+def test_dead_worker_fails_instead_of_hanging(tmp_path, monkeypatch):
+    path = tmp_path / "corpus.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    monkeypatch.setattr(corpus_dictionary, "_count_chunk", _exit_worker)
+
+    errors = []
+
+    def count():
+        try:
+            count_corpus_words([str(path)], workers=2, chunk_size=64)
+        except Exception as error:
+            errors.append(error)
+
+    thread = threading.Thread(target=count, daemon=True)
+    thread.start()
+    thread.join(60)
+    assert not thread.is_alive()
+    assert len(errors) == 1
+    assert isinstance(errors[0], concurrent.futures.process.BrokenProcessPool)
+
+
+def test_top_words():
+    counts = collections.Counter({"ಕ": 3, "ಖ": 5, "ಗ": 3, "ಘ": 1})
+    assert top_words(counts, 3) == [("ಖ", 5), ("ಕ", 3), ("ಗ", 3)]
+    assert top_words(counts, 10, min_count=3) == [
+        ("ಖ", 5),
+        ("ಕ", 3),
+        ("ಗ", 3),
+    ]
+    assert top_words(counts, 0) == []
+
+
+def test_iter_frequency_entries():
+    ranked = [("ನಮಸ್ಕಾರ", 3), ("ಗೆಳೆಯ", 1)]
+    entries = list(iter_frequency_entries(ranked))
+    assert [entry["kn"] for entry in entries] == ["ನಮಸ್ಕಾರ", "ಗೆಳೆಯ"]
+    segments, tr = analyze_kannada_word("ನಮಸ್ಕಾರ")
+    assert entries[0] == {
+        "kn": "ನಮಸ್ಕಾರ",
+        "tr": tr,
+        "en": "",
+        "segments": segments,
+    }
@@ -0,0 +1,111 @@
+"""Tests for corpus_reader.py."""
+
+import pytest
+
+from correct_transliteration import KANNADA_VIRAMA, char_class
+from corpus_reader import (
+    _CONTINUING_CLASSES,
+    _JOINERS,
+    iter_chunk_ranges,
+    iter_chunks,
+    map_corpus_chunks,
+    read_range,
+    safe_boundary,
+)
+
+# Clusters, vowel signs, anusvara, visarga and a joiner with no whitespace,
+# so every chunk end falls back to a cluster boundary
+UNSPACED = "ಸ್ತ್ರೀಕಾರ್ಯಂದುಃಖಕ್\u200dಷಅಆ" * 40
+SPACED = "ನಮಸ್ಕಾರ ಗೆಳೆಯ,\nಹೇಗಿದ್ದೀಯ? hello\tworld " * 40
+
+
+def write(tmp_path, text, name="corpus.txt", bom=False):
+    """Write text as UTF-8 and return the path as a string."""
+    path = tmp_path / name
+    path.write_bytes((b"\xef\xbb\xbf" if bom else b"") + text.encode("utf-8"))
+    return str(path)
+
+
+def assert_starts_cluster(text, chunk):
+    """Assert that chunk starts a new cluster after the text before it."""
+    assert char_class(chunk[0]) not in _CONTINUING_CLASSES
+    assert chunk[0] not in _JOINERS
+    assert not text.endswith(KANNADA_VIRAMA)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 5, 16, 100, 1 << 20])
+def test_unspaced_chunks_end_on_cluster_boundaries(tmp_path, chunk_size):
+    path = write(tmp_path, UNSPACED)
+    chunks = list(iter_chunks(path, chunk_size))
+    assert "".join(chunks) == UNSPACED
+    assert all(chunks)
+    assert "\ufffd" not in "".join(chunks)
+    for index in range(1, len(chunks)):
+        assert_starts_cluster("".join(chunks[:index]), chunks[index])
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64])
+def test_spaced_chunks_end_after_whitespace(tmp_path, chunk_size):
+    path = write(tmp_path, SPACED)
+    chunks = list(iter_chunks(path, chunk_size))
+    assert "".join(chunks) == SPACED
+    assert all(chunk[-1].isspace() for chunk in chunks)
+
+
+def test_ranges_cover_the_file(tmp_path):
+    path = write(tmp_path, SPACED + UNSPACED)
+    ranges = list(iter_chunk_ranges(path, 50))
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == len((SPACED + UNSPACED).encode("utf-8"))
+    for (_, end), (start, _) in zip(ranges, ranges[1:]):
+        assert end == start
+    text = "".join(read_range(path, start, end) for start, end in ranges)
+    assert text == SPACED + UNSPACED
+
+
+def test_safe_boundary_scan_limit():
+    data = ("ಕ" * 10 + " " + "ಸ್ತ್ರೀ").encode("utf-8")
+    # A space within reach ends the chunk just after it
+    assert safe_boundary(data, 1, len(data)) == 31
+    # Out of reach, the next cluster start is used instead
+    assert safe_boundary(data, 1, len(data), max_scan=4) == 3
+    # Inside a virama cluster, the boundary moves past the whole cluster
+    cluster = len(("ಕ" * 10 + " ").encode("utf-8"))
+    end = safe_boundary(data, cluster + 1, len(data), max_scan=4)
+    assert end == len(data)
+    assert safe_boundary(data, len(data) + 5, len(data)) == len(data)
+
+
+def test_bom_is_skipped(tmp_path):
+    path = write(tmp_path, SPACED, bom=True)
+    assert next(iter_chunk_ranges(path, 10))[0] == 3
+    assert "".join(iter_chunks(path, 10)) == SPACED
+
+
+def test_empty_file(tmp_path):
+    path = write(tmp_path, "")
+    assert list(iter_chunk_ranges(path)) == []
+    assert list(iter_chunks(path)) == []
+    assert read_range(path, 0, 0) == ""
+
+
+def test_invalid_chunk_size(tmp_path):
+    path = write(tmp_path, SPACED)
+    with pytest.raises(ValueError):
+        list(iter_chunk_ranges(path, 0))
+    with pytest.raises(ValueError):
+        list(iter_chunks(path, -1))
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_map_corpus_chunks_keeps_order(tmp_path, executor):
+    paths = [
+        write(tmp_path, SPACED, "a.txt"),
+        write(tmp_path, "", "empty.txt"),
+        write(tmp_path, UNSPACED, "b.txt"),
+    ]
+    expected = [chunk for path in paths for chunk in iter_chunks(path, 32)]
+    results = map_corpus_chunks(
+        str, paths, 32, executor=executor, max_workers=2
+    )
+    assert list(results) == expected
@@ -0,0 +1,314 @@
+"""Tests for the tokenizer and transliteration schemes."""
+
+import concurrent.futures
+import itertools
+
+import pytest
+
+import correct_transliteration
+from correct_transliteration import (
+    BASE_CONSONANTS,
+    CASUAL,
+    CHAR_ANUSVARA,
+    CHAR_CONSONANT,
+    CHAR_MATRA,
+    CHAR_OTHER,
+    CHAR_VIRAMA,
+    CHAR_VISARGA,
+    CHAR_VOWEL,
+    IAST,
+    KANNADA_ANUSVARA,
+    KANNADA_RANGE,
+    KANNADA_VIRAMA,
+    KANNADA_VISARGA,
+    VOWEL_MARKS,
+    VOWELS,
+    analyze_kannada_word,
+    analyze_many,
+    analyze_schemes,
+    analyze_schemes_many,
+    SCHEMES,
+    branch_counts,
+    char_class,
+    classify_codepoints,
+    disable_branch_counters,
+    disable_segmentation_cache,
+    enable_branch_counters,
+    enable_segmentation_cache,
+    get_scheme,
+    iter_kannada_runs,
+    map_chunks,
+    scheme_field,
+    segment_kannada_word,
+    segment_many,
+    segmentation_cache_stats,
+    tokenize_kannada,
+    tokenize_kannada_schemes,
+    transliterate_kannada_advanced,
+    transliterate_many,
+)
+
+BATCH_WORDS = ["ನಮಸ್ಕಾರ", "ಸಂತೋಷ", "ಜ್ಞಾನ", "ದುಃಖ", "hello", ""] * 4
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("ನಮಸ್ಕಾರ", "namaskaara"),
+        ("ಧನ್ಯವಾದ", "dhanyavaada"),
+        ("ಸ್ತ್ರೀ", "strii"),
+        ("ಲಕ್ಷ್ಮಿ", "lakshmi"),
+        ("ಮಹಾರಾಷ್ಟ್ರ", "mahaaraashtra"),
+        ("ಜ್ಞಾನ", "jnaana"),
+        ("ಸಂತೋಷ", "santoosha"),
+        ("ದುಃಖ", "duhkha"),
+        ("ಕ್", "k"),
+    ],
+)
+def test_transliteration(word, expected):
+    assert transliterate_kannada_advanced(word) == expected
+
+
+@pytest.mark.parametrize(
+    "word, segments",
+    [
+        # Consonant chains of any length form one cluster
+        ("ಸ್ತ್ರೀ", ["ಸ್ತ್ರೀ"]),
+        ("ಲಕ್ಷ್ಮಿ", ["ಲ", "ಕ್ಷ್ಮಿ"]),
+        ("ಮಹಾರಾಷ್ಟ್ರ", ["ಮ", "ಹಾ", "ರಾ", "ಷ್ಟ್ರ"]),
+        # Anusvara and visarga close the cluster they follow
+        ("ಸಂತೋಷ", ["ಸಂ", "ತೋ", "ಷ"]),
+        ("ದುಃಖ", ["ದುಃ", "ಖ"]),
+        # A final virama stays with its cluster
+        ("ಟೂತ್ ಬ್ರಷ್", ["ಟೂ", "ತ್", " ", "ಬ್ರ", "ಷ್"]),
+    ],
+)
+def test_segments(word, segments):
+    assert [s["kn"] for s in segment_kannada_word(word)] == segments
+
+
+def test_segments_join_to_word_and_transliteration():
+    for word in ("ನಮಸ್ಕಾರ", "ಸ್ತ್ರೀ", "ಸಂಸ್ಕೃತ", "ದುಃಖ", "ಟೂತ್ ಬ್ರಷ್"):
+        segments, tr = analyze_kannada_word(word)
+        assert "".join(s["kn"] for s in segments) == word
+        assert "".join(s["tr"] for s in segments) == tr
+        assert segments == segment_kannada_word(word)
+        assert tr == transliterate_kannada_advanced(word)
+
+
+def test_orphaned_vowel_sign_uses_its_sound():
+    segments, tr = analyze_kannada_word("ಾಕ")
+    assert segments == [{"kn": "ಾ", "tr": "aa"}, {"kn": "ಕ", "tr": "ka"}]
+    assert tr == "aaka"
+
+
+def test_non_kannada_characters_pass_through():
+    assert tokenize_kannada("ab") == [(0, 1, "a"), (1, 2, "b")]
+    assert transliterate_kannada_advanced("ಕ1") == "ka1"
+
+
+def test_empty_input():
+    assert tokenize_kannada("") == []
+    assert segment_kannada_word("") == []
+    assert transliterate_kannada_advanced("") == ""
+
+
+def test_analyze_schemes():
+    segments, transliterations = analyze_schemes(
+        "ಸಂಸ್ಕೃತ", ["iso15919", "iast", "hk"]
+    )
+    assert transliterations == {
+        "tr": "sanskruta",
+        "tr_iso15919": "saṁskr̥ta",
+        "tr_iast": "saṃskṛta",
+        "tr_hk": "saMskRta",
+    }
+    assert segments[1] == {
+        "kn": "ಸ್ಕೃ",
+        "tr": "skru",
+        "tr_iso15919": "skr̥",
+        "tr_iast": "skṛ",
+        "tr_hk": "skR",
+    }
+    for field, tr in transliterations.items():
+        assert "".join(segment[field] for segment in segments) == tr
+
+
+def test_analyze_schemes_matches_casual_analysis():
+    for word in ("ನಮಸ್ಕಾರ", "ಲಕ್ಷ್ಮಿ", "ದುಃಖ", "ಾಕ", "abc"):
+        segments, transliterations = analyze_schemes(word, ["iast"])
+        expected_segments, expected_tr = analyze_kannada_word(word)
+        assert transliterations["tr"] == expected_tr
+        assert [{"kn": s["kn"], "tr": s["tr"]} for s in segments] == (
+            expected_segments
+        )
+
+
+def test_orphaned_vowel_sign_in_every_scheme():
+    segments, transliterations = analyze_schemes("ಾಕ", ["iast"])
+    assert segments[0] == {"kn": "ಾ", "tr": "aa", "tr_iast": "ā"}
+    assert transliterations == {"tr": "aaka", "tr_iast": "āka"}
+
+
+def expected_class(char):
+    """Classify a character by looking it up in the rule tables."""
+    if char in BASE_CONSONANTS:
+        return CHAR_CONSONANT
+    if char in VOWELS:
+        return CHAR_VOWEL
+    if char in VOWEL_MARKS:
+        return CHAR_MATRA
+    return {
+        KANNADA_VIRAMA: CHAR_VIRAMA,
+        KANNADA_ANUSVARA: CHAR_ANUSVARA,
+        KANNADA_VISARGA: CHAR_VISARGA,
+    }.get(char, CHAR_OTHER)
+
+
+CLASS_SAMPLE = "".join(map(chr, range(0x0C60, 0x0D20))) + "a ೧\u200d\U0001f600"
+
+
+def test_char_class_matches_rule_tables():
+    for char in CLASS_SAMPLE:
+        assert char_class(char) == expected_class(char), hex(ord(char))
+    assert char_class(chr(KANNADA_RANGE.start - 1)) == CHAR_OTHER
+    assert char_class(chr(KANNADA_RANGE.stop)) == CHAR_OTHER
+
+
+@pytest.mark.parametrize("numpy", [True, False])
+def test_classify_codepoints(numpy, monkeypatch):
+    if not numpy:
+        monkeypatch.setattr(correct_transliteration, "np", None)
+    elif correct_transliteration.np is None:
+        pytest.skip("NumPy is not installed")
+    expected = [expected_class(char) for char in CLASS_SAMPLE]
+    assert list(classify_codepoints(CLASS_SAMPLE)) == expected
+    assert list(classify_codepoints("")) == []
+
+
+def test_iter_kannada_runs():
+    text = "ನಮಸ್ಕಾರ, world ೧೨ ಕ\u200dಖ"
+    assert [text[start:end] for start, end in iter_kannada_runs(text)] == [
+        "ನಮಸ್ಕಾರ",
+        "೧೨",
+        "ಕ",
+        "ಖ",
+    ]
+    assert list(iter_kannada_runs("hello")) == []
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize("chunksize", [1, 5, 1000])
+def test_batch_api_keeps_order(executor, chunksize):
+    options = {"chunksize": chunksize, "executor": executor, "max_workers": 2}
+    assert list(segment_many(BATCH_WORDS, **options)) == [
+        segment_kannada_word(word) for word in BATCH_WORDS
+    ]
+    assert list(transliterate_many(iter(BATCH_WORDS), **options)) == [
+        transliterate_kannada_advanced(word) for word in BATCH_WORDS
+    ]
+    assert list(analyze_many(BATCH_WORDS, **options)) == [
+        analyze_kannada_word(word) for word in BATCH_WORDS
+    ]
+
+
+def test_batch_api_uses_given_executor():
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(segment_many(BATCH_WORDS, chunksize=3, executor=pool))
+        # The caller's executor is left running
+        assert pool.submit(len, "ಕ").result() == 1
+    assert results == [segment_kannada_word(word) for word in BATCH_WORDS]
+
+
+def test_batch_api_streams_unbounded_input():
+    # Only a bounded window of chunks is read ahead of the consumer
+    results = transliterate_many(
+        itertools.cycle(BATCH_WORDS), chunksize=4, executor="thread"
+    )
+    expected = itertools.islice(itertools.cycle(BATCH_WORDS), 50)
+    assert list(itertools.islice(results, 50)) == [
+        transliterate_kannada_advanced(word) for word in expected
+    ]
+    results.close()
+
+
+def test_batch_api_rejects_bad_options():
+    assert list(segment_many([])) == []
+    with pytest.raises(ValueError):
+        map_chunks(len, ["ಕ"], chunksize=0)
+    with pytest.raises(ValueError):
+        list(segment_many(BATCH_WORDS, chunksize=1, executor="fibers"))
+
+
+def test_analyze_schemes_many_keeps_order():
+    words = ["ನಮಸ್ಕಾರ", "ಸಂತೋಷ", "ಜ್ಞಾನ"] * 3
+    results = list(analyze_schemes_many(words, ["hk"], chunksize=2))
+    assert results == [analyze_schemes(word, ["hk"]) for word in words]
+
+
+def test_extra_schemes_share_one_scan():
+    # A word new to both schemes is still only scanned once
+    word = "ಖ್ಘ್ಙೌಃ"
+    enable_branch_counters()
+    try:
+        tokenize_kannada_schemes(word, [CASUAL])
+        single = dict(branch_counts())
+        enable_branch_counters()
+        IAST._token_memo.cache_clear()
+        tokenize_kannada_schemes(word, [CASUAL, IAST])
+        assert dict(branch_counts()) == single
+    finally:
+        disable_branch_counters()
+
+
+def test_token_memo_is_bounded_lru():
+    info = CASUAL._token_memo.cache_info()
+    assert info.maxsize is not None
+    tokenize_kannada("ನಮಸ್ಕಾರ")
+    before = CASUAL._token_memo.cache_info().hits
+    tokenize_kannada("ನಮಸ್ಕಾರ")
+    assert CASUAL._token_memo.cache_info().hits == before + 4
+
+
+def test_segmentation_cache_stats():
+    enable_segmentation_cache(max_words=2, max_clusters=2)
+    try:
+        stats = segmentation_cache_stats()
+        assert stats["cluster"]["size"] == 0
+        assert stats["cluster"]["maxsize"] == 2 * len(SCHEMES)
+
+        segment_kannada_word("ನಮನ")
+        segment_kannada_word("ನಮನ")
+        stats = segmentation_cache_stats()
+        assert (stats["word"]["hits"], stats["word"]["misses"]) == (1, 1)
+        # ನ, ಮ, then ನ again from the memo
+        cluster = stats["cluster"]
+        assert (cluster["hits"], cluster["misses"]) == (1, 2)
+        assert cluster["evictions"] == 0
+
+        segment_kannada_word("ಕ")
+        segment_kannada_word("ಖ")
+        segment_kannada_word("ಗ")
+        stats = segmentation_cache_stats()
+        assert stats["word"]["evictions"] == 2
+        assert stats["cluster"]["evictions"] == 3
+        assert stats["cluster"]["size"] == 2
+    finally:
+        disable_segmentation_cache()
+
+    stats = segmentation_cache_stats()
+    assert stats["word"] is None
+    assert stats["cluster"]["size"] == 0
+    assert stats["cluster"]["maxsize"] > 2 * len(SCHEMES)
+    with pytest.raises(ValueError):
+        enable_segmentation_cache(max_clusters=0)
+    disable_segmentation_cache()
+
+
+def test_scheme_registry():
+    assert get_scheme("iast") is IAST
+    assert get_scheme(IAST) is IAST
+    assert scheme_field("casual") == "tr"
+    assert scheme_field("hk") == "tr_hk"
+    with pytest.raises(ValueError):
+        get_scheme("klingon")
@@ -0,0 +1,97 @@
+"""Tests for dedupe_words.py."""
+
+import random
+
+import pytest
+
+from dedupe_words import (
+    dedupe_entries,
+    duplicate_meanings,
+    merge_meanings,
+    normalize_kn,
+)
+
+
+def entry(kn, en):
+    return {"kn": kn, "tr": "", "en": en, "segments": []}
+
+
+ENTRIES = [
+    entry("ಉತ್ತರ", "answer"),
+    entry("ನಮಸ್ಕಾರ", "hello"),
+    entry("ಉತ್ತರ", "north"),
+    entry("ಇಲ್ಲ", "no"),
+    entry("ಉತ್ತರ", "answer"),
+]
+
+EXPECTED = [
+    entry("ಉತ್ತರ", "answer/north"),
+    entry("ನಮಸ್ಕಾರ", "hello"),
+    entry("ಇಲ್ಲ", "no"),
+]
+
+
+def test_merge_meanings():
+    assert merge_meanings("answer", "north") == "answer/north"
+    assert merge_meanings("a/b", "b/c") == "a/b/c"
+    assert merge_meanings("a//b", "") == "a/b"
+
+
+def test_dedupe_in_memory():
+    assert list(dedupe_entries(iter(ENTRIES))) == EXPECTED
+
+
+def test_dedupe_streaming():
+    duplicates = duplicate_meanings(ENTRIES)
+    assert duplicates == {"ಉತ್ತರ": "answer/north"}
+    assert list(dedupe_entries(ENTRIES, duplicates=duplicates)) == EXPECTED
+
+
+def test_dedupe_streaming_yields_before_input_ends():
+    duplicates = duplicate_meanings(ENTRIES)
+
+    def entries():
+        yield from ENTRIES[:2]
+        raise AssertionError("read past the first entries")
+
+    unique = dedupe_entries(entries(), duplicates=duplicates)
+    assert [next(unique), next(unique)] == EXPECTED[:2]
+
+
+@pytest.mark.parametrize("buckets", [1, 3])
+def test_dedupe_spilled(tmp_path, buckets):
+    unique = dedupe_entries(ENTRIES, spill_dir=tmp_path, buckets=buckets)
+    assert list(unique) == EXPECTED
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_modes_agree():
+    rng = random.Random(0)
+    words = ["ಅ", "ಆ", "ಇ", "ಕಾ"]
+    meanings = ["a", "b", "a/b", "", "c//a"]
+    for _ in range(200):
+        entries = [
+            entry(rng.choice(words), rng.choice(meanings))
+            for _ in range(rng.randint(0, 8))
+        ]
+        expected = list(dedupe_entries(iter(entries)))
+        streamed = dedupe_entries(
+            entries, duplicates=duplicate_meanings(entries)
+        )
+        assert list(streamed) == expected
+
+
+def test_words_compared_after_nfc():
+    decomposed = "\u0c95\u0cc6\u0cd5"  # ಕ + ೆ + length mark
+    composed = normalize_kn(decomposed)
+    assert composed != decomposed
+    entries = [entry(decomposed, "a"), entry(composed, "b")]
+    expected = [entry(composed, "a/b")]
+    assert list(dedupe_entries(iter(entries))) == expected
+    duplicates = duplicate_meanings(entries)
+    assert list(dedupe_entries(entries, duplicates=duplicates)) == expected
+
+
+def test_invalid_bucket_count(tmp_path):
+    with pytest.raises(ValueError):
+        dedupe_entries(ENTRIES, spill_dir=tmp_path, buckets=0)
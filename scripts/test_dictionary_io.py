@@ -0,0 +1,146 @@
+"""Tests for dictionary_io.py."""
+
+import io
+import json
+import os
+
+import pytest
+
+import dictionary_io
+from dictionary_io import (
+    _iter_json_array,
+    atomic_write,
+    iter_dictionary,
+    write_dictionary,
+)
+
+ENTRIES = [
+    {"kn": "ನಮಸ್ಕಾರ", "tr": "namaskaara", "en": "hello", "segments": []},
+    {"kn": "ಗೆಳೆಯ", "tr": "geLeya", "en": "friend, \"pal\"", "segments": []},
+    {"kn": "ಅ", "tr": "a", "en": "[a]", "segments": [{"kn": "ಅ", "tr": "a"}]},
+]
+
+
+def parse(text, chunk_size, monkeypatch):
+    """Return the elements of a JSON array read in chunks of chunk_size."""
+    monkeypatch.setattr(dictionary_io, "READ_CHUNK_SIZE", chunk_size)
+    return list(_iter_json_array(io.StringIO(text)))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+def test_chunk_boundaries(chunk_size, monkeypatch):
+    # Every chunk size splits values, strings and separators differently
+    text = json.dumps(ENTRIES, ensure_ascii=False, indent=2)
+    assert parse(text, chunk_size, monkeypatch) == ENTRIES
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1 << 16])
+def test_numbers_split_at_chunk_end(chunk_size, monkeypatch):
+    # A number ending at the buffer end may still have more digits to come
+    assert parse("[12345, 678,9]", chunk_size, monkeypatch) == [12345, 678, 9]
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("[]", []),
+        ("  \n[ \n ]\n", []),
+        ('\t[\n\n1 ,\t"a" \n,{"b" : [ ]}\r\n]  ', [1, "a", {"b": []}]),
+        ('[1]  trailing', [1]),
+    ],
+)
+def test_whitespace_and_commas(text, expected, monkeypatch):
+    assert parse(text, 2, monkeypatch) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "   ",
+        '{"kn": "ಅ"}',
+        "[",
+        "[1,",
+        '[{"kn": "ಅ"',
+        '[{"kn": "ಅ"}',
+        '[{"kn": "ಅ"} {"kn": "ಆ"}]',
+        "[1,,2]",
+    ],
+)
+def test_malformed_input(text, monkeypatch):
+    # JSONDecodeError is a ValueError
+    for chunk_size in (1, 3, 1 << 16):
+        with pytest.raises(ValueError):
+            parse(text, chunk_size, monkeypatch)
+
+
+def test_truncated_input_yields_complete_entries_first(monkeypatch):
+    text = json.dumps(ENTRIES, ensure_ascii=False, indent=2)[:-10]
+    monkeypatch.setattr(dictionary_io, "READ_CHUNK_SIZE", 5)
+    entries = _iter_json_array(io.StringIO(text))
+    assert next(entries) == ENTRIES[0]
+    assert next(entries) == ENTRIES[1]
+    with pytest.raises(ValueError):
+        next(entries)
+
+
+@pytest.mark.parametrize("name", ["dictionary.json", "dictionary.jsonl"])
+def test_round_trip(tmp_path, name):
+    path = str(tmp_path / name)
+    assert write_dictionary(iter(ENTRIES), path) == len(ENTRIES)
+    assert list(iter_dictionary(path)) == ENTRIES
+
+
+def test_json_output_matches_json_dump(tmp_path):
+    path = tmp_path / "dictionary.json"
+    for entries in (ENTRIES, ENTRIES[:1], []):
+        write_dictionary(entries, str(path))
+        assert path.read_text(encoding="utf-8") == json.dumps(
+            entries, ensure_ascii=False, indent=2
+        )
+
+
+def test_format_is_detected_from_content(tmp_path):
+    jsonl_path = tmp_path / "dictionary.json"
+    write_dictionary(ENTRIES, str(jsonl_path), jsonl=True)
+    assert list(iter_dictionary(str(jsonl_path))) == ENTRIES
+
+    array_path = tmp_path / "dictionary.jsonl"
+    write_dictionary(ENTRIES, str(array_path), jsonl=False)
+    assert array_path.read_text(encoding="utf-8").startswith("[\n")
+    assert list(iter_dictionary(str(array_path))) == ENTRIES
+
+
+def test_jsonl_skips_blank_lines(tmp_path):
+    path = tmp_path / "dictionary.jsonl"
+    path.write_text('\n{"kn": "ಅ"}\n\n{"kn": "ಆ"}\n  \n', encoding="utf-8")
+    assert list(iter_dictionary(str(path))) == [{"kn": "ಅ"}, {"kn": "ಆ"}]
+
+
+def test_failed_write_keeps_previous_file(tmp_path):
+    path = tmp_path / "dictionary.json"
+    write_dictionary(ENTRIES, str(path))
+    before = path.read_bytes()
+
+    def entries():
+        yield ENTRIES[0]
+        raise RuntimeError("interrupted")
+
+    with pytest.raises(RuntimeError):
+        write_dictionary(entries(), str(path))
+    assert path.read_bytes() == before
+    assert os.listdir(tmp_path) == ["dictionary.json"]
+
+
+def test_atomic_write_keeps_mode(tmp_path):
+    path = tmp_path / "data.bin"
+    with atomic_write(str(path), binary=True) as f:
+        f.write(b"\x00\x01")
+    assert path.read_bytes() == b"\x00\x01"
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+    os.chmod(path, 0o600)
+    with atomic_write(str(path)) as f:
+        f.write("ಅ")
+    assert path.read_text(encoding="utf-8") == "ಅ"
+    assert os.stat(path).st_mode & 0o777 == 0o600
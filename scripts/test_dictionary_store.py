@@ -0,0 +1,117 @@
+"""Tests for dictionary_store.py."""
+
+import os
+
+import pytest
+
+from dictionary_io import iter_dictionary
+from dictionary_store import DictionaryStore
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
+DICTIONARY_PATH = os.path.join(DATA_DIR, "dictionary.json")
+
+ENTRIES = [
+    {
+        "kn": "ನಮಸ್ಕಾರ",
+        "tr": "namaskaara",
+        "en": "hello",
+        "segments": [
+            {"kn": "ನ", "tr": "na"},
+            {"kn": "ಮ", "tr": "ma"},
+            {"kn": "ಸ್ಕಾ", "tr": "skaa"},
+            {"kn": "ರ", "tr": "ra"},
+        ],
+    },
+    {
+        "kn": "ಮನ",
+        "tr": "mana",
+        "en": "mind",
+        "segments": [{"kn": "ಮ", "tr": "ma"}, {"kn": "ನ", "tr": "na"}],
+    },
+    {
+        "kn": "ಮನ",
+        "tr": "mana",
+        "en": "heart",
+        "segments": [{"kn": "ಮ", "tr": "ma"}, {"kn": "ನ", "tr": "na"}],
+    },
+]
+
+
+def test_round_trip():
+    store = DictionaryStore.from_entries(ENTRIES)
+    assert len(store) == 3
+    assert list(store) == ENTRIES
+    assert [store[i] for i in range(len(store))] == ENTRIES
+
+
+def test_segments_are_interned():
+    store = DictionaryStore.from_entries(ENTRIES)
+    assert store.segment_count == 4
+    assert store.segments(1) == ENTRIES[1]["segments"]
+
+
+def test_scheme_fields_and_unusual_layouts():
+    entries = [
+        {
+            "kn": "ಕ",
+            "tr": "ka",
+            "tr_iast": "ka",
+            "en": "",
+            "segments": [{"kn": "ಕ", "tr": "ka", "tr_iast": "ka"}],
+        },
+        # Missing fields, another key order and a segment with extra keys
+        {"en": "no word", "kn": "ಖ"},
+        {"kn": "ಗ", "tr": None, "en": 3, "segments": []},
+        {"kn": "ಘ", "segments": [{"kn": "ಘ", "tr": "gha", "note": "x"}]},
+    ]
+    store = DictionaryStore.from_entries(entries)
+    assert list(store) == entries
+    assert list(store[1]) == ["en", "kn"]
+
+
+def test_lookup():
+    store = DictionaryStore.from_entries(ENTRIES)
+    assert store.index_of("ನಮಸ್ಕಾರ") == 0
+    # Duplicates resolve to the entry added first
+    assert store.index_of("ಮನ") == 1
+    assert store.lookup("ಮನ")["en"] == "mind"
+    assert store.index_of("ಮ") is None
+    assert store.lookup("ಇಲ್ಲ") is None
+    assert store.index_of("") is None
+    assert DictionaryStore().lookup("ಮನ") is None
+
+
+def test_lookup_sees_entries_added_later():
+    store = DictionaryStore.from_entries(ENTRIES)
+    assert store.index_of("ಅ") is None
+    store.add({"kn": "ಅ", "tr": "a", "en": "", "segments": []})
+    assert store.index_of("ಅ") == 3
+
+
+def test_indexing():
+    store = DictionaryStore.from_entries(ENTRIES)
+    assert store[-1] == ENTRIES[-1]
+    assert store[-3] == ENTRIES[0]
+    with pytest.raises(IndexError):
+        store[3]
+    with pytest.raises(IndexError):
+        store[-4]
+    with pytest.raises(IndexError):
+        DictionaryStore()[0]
+
+
+def test_shipped_dictionary_saves_unchanged(tmp_path):
+    store = DictionaryStore.load(DICTIONARY_PATH)
+    assert list(store) == list(iter_dictionary(DICTIONARY_PATH))
+    assert store.segment_count < sum(len(e["segments"]) for e in store)
+
+    path = tmp_path / "dictionary.json"
+    assert store.save(str(path)) == len(store)
+    with open(DICTIONARY_PATH, "rb") as f:
+        assert path.read_bytes() == f.read()
+
+
+def test_jsonl_round_trip(tmp_path):
+    path = str(tmp_path / "dictionary.jsonl")
+    DictionaryStore.from_entries(ENTRIES).save(path)
+    assert list(DictionaryStore.load(path)) == ENTRIES
@@ -0,0 +1,88 @@
+"""Tests for differential_fuzz.py."""
+
+import os
+
+from differential_fuzz import (
+    EDGE_CASES,
+    engine_output,
+    fuzz,
+    generate_cases,
+    load_engine,
+    shrink,
+)
+
+ENGINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "correct_transliteration.py"
+)
+
+# Changes the output of every input that contains a ``ಾ``
+BROKEN_ENGINE = '''
+import sys
+sys.path.insert(0, {scripts_dir!r})
+import correct_transliteration as engine
+
+
+def segment_kannada_word(text):
+    return engine.segment_kannada_word(text)
+
+
+def transliterate_kannada_advanced(text):
+    tr = engine.transliterate_kannada_advanced(text)
+    return tr + "!" if "\\u0cbe" in text else tr
+'''
+
+
+def test_generate_cases_is_reproducible():
+    cases = generate_cases(0, 3, 200)
+    assert len(cases) == 200
+    assert cases == generate_cases(0, 3, 200)
+    assert cases != generate_cases(1, 3, 200)
+    assert cases != generate_cases(0, 4, 200)
+
+
+def test_first_batch_starts_with_edge_cases():
+    cases = generate_cases(0, 0, len(EDGE_CASES) + 5)
+    assert cases[: len(EDGE_CASES)] == list(EDGE_CASES)
+    assert len(generate_cases(0, 1, 5)) == 5
+
+
+def test_shrink_finds_minimal_input():
+    assert shrink("abcXdefXg", lambda text: text.count("X") == 2) == "XX"
+    assert shrink("ನಮಸ್ಕಾರ", lambda text: "ಾ" in text) == "ಾ"
+    assert shrink("abc", lambda text: False) == "abc"
+
+
+def test_engine_output():
+    engine = load_engine(ENGINE_PATH)
+    assert load_engine(ENGINE_PATH) is engine
+    segments, tr = engine_output(engine, "ನಮಸ್ಕಾರ")
+    assert [s["kn"] for s in segments] == ["ನ", "ಮ", "ಸ್ಕಾ", "ರ"]
+    assert tr == "namaskaara"
+
+
+def test_same_engine_has_no_mismatches():
+    report = fuzz(
+        ENGINE_PATH, ENGINE_PATH, cases=300, batch_size=100, executor="thread"
+    )
+    assert report["cases"] == 300
+    assert report["mismatches"] == []
+
+
+def test_changed_engine_is_caught(tmp_path):
+    path = tmp_path / "broken_engine.py"
+    scripts_dir = os.path.dirname(ENGINE_PATH)
+    path.write_text(BROKEN_ENGINE.format(scripts_dir=scripts_dir))
+    report = fuzz(
+        ENGINE_PATH, str(path), cases=300, batch_size=100, executor="thread"
+    )
+    assert report["mismatches"]
+    assert all("ಾ" in case for case in report["mismatches"])
+    assert len(set(report["mismatches"])) == len(report["mismatches"])
+
+    reference = load_engine(ENGINE_PATH)
+    candidate = load_engine(str(path))
+
+    def differs(text):
+        return engine_output(reference, text) != engine_output(candidate, text)
+
+    assert shrink(report["mismatches"][0], differs) == "ಾ"
@@ -0,0 +1,108 @@
+"""Tests for prefix_index.py."""
+
+import json
+
+import pytest
+
+from prefix_index import (
+    PrefixIndex,
+    PrefixIndexWriter,
+    index_keys,
+    index_path_for,
+)
+
+
+def entry(kn, tr, segment_trs, en=""):
+    segments = [{"kn": kn, "tr": tr} for tr in segment_trs]
+    return {"kn": kn, "tr": tr, "en": en, "segments": segments}
+
+
+ENTRIES = [
+    entry("ನಮಸ್ಕಾರ", "namaskaara", ["na", "ma", "skaa", "ra"], "hello"),
+    # Indexed under both "dhanyavaada" and "dhanyavada"
+    entry("ಧನ್ಯವಾದ", "dhanyavaada", ["dha", "nya", "va", "da"], "thanks"),
+    entry("ನಮ್ಮ", "namma", ["na", "mma"], "our"),
+    entry("ನದಿ", "Nadi ", ["na", "di"], "river"),
+]
+
+
+def test_index_path_for():
+    assert index_path_for("data/dictionary.json") == (
+        "data/dictionary.index.json"
+    )
+
+
+def test_index_keys():
+    assert index_keys(ENTRIES[0]) == ["namaskaara"]
+    assert index_keys(ENTRIES[1]) == ["dhanyavaada", "dhanyavada"]
+    assert index_keys(ENTRIES[3]) == ["nadi"]
+
+
+def test_search_prefix_bounds():
+    index = PrefixIndex.from_entries(ENTRIES)
+    assert [r["kn"] for r in index.search("nam")] == ["ನಮಸ್ಕಾರ", "ನಮ್ಮ"]
+    assert [r["kn"] for r in index.search("na")] == [
+        "ನದಿ",
+        "ನಮಸ್ಕಾರ",
+        "ನಮ್ಮ",
+    ]
+    assert [r["kn"] for r in index.search("namm")] == ["ನಮ್ಮ"]
+    assert index.search("namz") == []
+    assert index.search("a") == []
+    assert index.search("zzz") == []
+    assert index.search("  ") == []
+
+
+def test_search_normalizes_query():
+    index = PrefixIndex.from_entries(ENTRIES)
+    assert index.search(" NAD") == [
+        {"kn": "ನದಿ", "tr": "Nadi ", "en": "river"}
+    ]
+
+
+def test_search_returns_each_entry_once():
+    index = PrefixIndex.from_entries(ENTRIES)
+    assert index.keys.count("dhanyavaada") == 1
+    assert len(index.keys) == 5
+    assert index.search("dhanyava") == [
+        {"kn": "ಧನ್ಯವಾದ", "tr": "dhanyavaada", "en": "thanks"}
+    ]
+
+
+def test_search_limit():
+    index = PrefixIndex.from_entries(ENTRIES)
+    assert len(index.search("n", limit=2)) == 2
+    assert [r["kn"] for r in index.search("n", limit=2)] == ["ನದಿ", "ನಮಸ್ಕಾರ"]
+    assert index.search("n", limit=0) == []
+
+
+def test_writer_save_and_load(tmp_path):
+    path = str(tmp_path / "dictionary.index.json")
+    with PrefixIndexWriter(path) as writer:
+        for item in ENTRIES:
+            writer.add(item)
+
+    index = PrefixIndex.load(path)
+    expected = PrefixIndex.from_entries(ENTRIES)
+    assert index.keys == expected.keys
+    assert index.ids == expected.ids
+    assert index.search("dh") == expected.search("dh")
+
+
+def test_writer_keeps_old_index_on_error(tmp_path):
+    path = tmp_path / "dictionary.index.json"
+    with pytest.raises(RuntimeError):
+        with PrefixIndexWriter(str(path)) as writer:
+            writer.add(ENTRIES[0])
+            raise RuntimeError
+    assert not path.exists()
+
+
+def test_load_rejects_other_versions(tmp_path):
+    path = tmp_path / "dictionary.index.json"
+    PrefixIndex.from_entries(ENTRIES).save(str(path))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["version"] += 1
+    path.write_text(json.dumps(data), encoding="utf-8")
+    with pytest.raises(ValueError):
+        PrefixIndex.load(str(path))
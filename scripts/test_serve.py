@@ -0,0 +1,167 @@
+"""Tests for serve.py."""
+
+import functools
+import gzip
+import http.client
+import os
+import threading
+
+import pytest
+
+from precompress import gzip_path_for, precompress_tree
+from serve import (
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    StaticRequestHandler,
+    StaticServer,
+    accepts_gzip,
+    etag_matches,
+)
+
+BODY = b'{"kn": "\xe0\xb2\xa8\xe0\xb2\xae"}\n' * 200
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip", True),
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, GZIP;q=0.5", True),
+        ("*", True),
+        ("*;q=0, gzip", True),
+        ("gzip, *;q=0", True),
+        ("gzip;q=0, *", False),
+        ("*;q=0.5", True),
+        ("*;q=0", False),
+        ("gzip ; q=0.8", True),
+        ("gzip;q=0", False),
+        ("gzip;q=0.0, deflate", False),
+        ("gzip;q=abc", False),
+        ("deflate, br", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_accepts_gzip(header, expected):
+    assert accepts_gzip(header) is expected
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('"x", "abc"', '"abc"')
+    assert etag_matches(" * ", '"abc"')
+    assert not etag_matches('"abcd"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+@pytest.fixture
+def site(tmp_path):
+    """Serve a site root with a compressible file and a hashed copy."""
+    (tmp_path / "data" / "hashed").mkdir(parents=True)
+    (tmp_path / "data" / "dictionary.json").write_bytes(BODY)
+    (tmp_path / "data" / "hashed" / "dictionary.0123.json").write_bytes(BODY)
+    precompress_tree(str(tmp_path), paths=("data",))
+
+    handler = functools.partial(StaticRequestHandler, directory=str(tmp_path))
+    server = StaticServer(("127.0.0.1", 0), handler, quiet=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield tmp_path, server.server_address[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def get(port, path, **headers):
+    """Return ``(status, headers, body)`` for one GET request."""
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    try:
+        connection.request("GET", path, headers=headers)
+        response = connection.getresponse()
+        return response.status, response.headers, response.read()
+    finally:
+        connection.close()
+
+
+def test_gzip_negotiation(site):
+    _, port = site
+    status, headers, body = get(
+        port, "/data/dictionary.json", **{"Accept-Encoding": "gzip"}
+    )
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["Vary"] == "Accept-Encoding"
+    assert headers["Content-Type"] == "application/json"
+    assert gzip.decompress(body) == BODY
+
+    status, headers, body = get(port, "/data/dictionary.json")
+    assert status == 200
+    assert headers["Content-Encoding"] is None
+    assert headers["Vary"] == "Accept-Encoding"
+    assert body == BODY
+
+    _, headers, _ = get(
+        port, "/data/dictionary.json", **{"Accept-Encoding": "*;q=0, gzip"}
+    )
+    assert headers["Content-Encoding"] == "gzip"
+
+
+def test_stale_gzip_copy_is_ignored(site):
+    root, port = site
+    path = root / "data" / "dictionary.json"
+    gzip_stat = os.stat(gzip_path_for(str(path)))
+    path.write_bytes(BODY + b"\n")
+    os.utime(path, ns=(gzip_stat.st_atime_ns, gzip_stat.st_mtime_ns + 10**9))
+
+    status, headers, body = get(
+        port, "/data/dictionary.json", **{"Accept-Encoding": "gzip"}
+    )
+    assert status == 200
+    assert headers["Content-Encoding"] is None
+    assert body == BODY + b"\n"
+
+
+def test_etag_revalidation(site):
+    root, port = site
+    _, headers, _ = get(port, "/data/dictionary.json")
+    etag = headers["ETag"]
+    assert headers["Cache-Control"] == REVALIDATE_CACHE_CONTROL
+
+    status, headers, body = get(
+        port, "/data/dictionary.json", **{"If-None-Match": etag}
+    )
+    assert status == 304
+    assert headers["ETag"] == etag
+    assert body == b""
+
+    # The plain and gzip responses are different representations
+    _, headers, _ = get(
+        port, "/data/dictionary.json", **{"Accept-Encoding": "gzip"}
+    )
+    assert headers["ETag"] != etag
+
+    # A changed file gets a new ETag
+    path = root / "data" / "dictionary.json"
+    stat = os.stat(path)
+    path.write_bytes(b"[]\n")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    status, headers, body = get(
+        port, "/data/dictionary.json", **{"If-None-Match": etag}
+    )
+    assert status == 200
+    assert headers["ETag"] != etag
+    assert body == b"[]\n"
+
+
+def test_hashed_files_are_immutable(site):
+    _, port = site
+    status, headers, _ = get(port, "/data/hashed/dictionary.0123.json")
+    assert status == 200
+    assert headers["Cache-Control"] == IMMUTABLE_CACHE_CONTROL
+
+
+def test_missing_file(site):
+    _, port = site
+    status, _, _ = get(port, "/data/missing.json")
+    assert status == 404
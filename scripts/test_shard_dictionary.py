@@ -0,0 +1,135 @@
+"""Tests for shard_dictionary.py."""
+
+import json
+import os
+
+import pytest
+
+from compact_dictionary import decode_compact_dictionary
+from create_large_dictionary import WORD_CATEGORIES
+from shard_dictionary import (
+    DEFAULT_CATEGORY,
+    SHARD_MANIFEST_NAME,
+    SHARD_MANIFEST_VERSION,
+    ShardedDictionaryWriter,
+    category_lookup,
+    shard_dictionary,
+)
+
+
+def make_entries(words):
+    """Return dictionary entries with one segment for each word."""
+    return [
+        {
+            "kn": word,
+            "tr": f"tr{index}",
+            "en": f"en{index}",
+            "segments": [{"kn": word, "tr": f"tr{index}"}],
+        }
+        for index, word in enumerate(words)
+    ]
+
+
+def load(path):
+    """Parse a JSON file."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_shards(shard_dir):
+    """Return the manifest and the decoded entries of every shard."""
+    manifest = load(os.path.join(shard_dir, SHARD_MANIFEST_NAME))
+    entries = []
+    for shard in manifest["shards"]:
+        data = load(os.path.join(shard_dir, shard["file"]))
+        shard_entries = decode_compact_dictionary(data)
+        assert len(shard_entries) == shard["count"]
+        entries.extend(shard_entries)
+    return manifest, entries
+
+
+@pytest.mark.parametrize("shard_size, counts", [(3, [3, 3, 1]), (7, [7])])
+def test_round_trip(tmp_path, shard_size, counts):
+    entries = make_entries(f"ಪದ{index}" for index in range(7))
+    shards = shard_dictionary(iter(entries), str(tmp_path), shard_size)
+
+    manifest, decoded = read_shards(str(tmp_path))
+    assert decoded == entries
+    assert manifest["version"] == SHARD_MANIFEST_VERSION
+    assert manifest["total"] == 7
+    assert manifest["shards"] == shards
+    assert [shard["count"] for shard in shards] == counts
+    assert {shard["category"] for shard in shards} == {DEFAULT_CATEGORY}
+    assert shards[0]["file"] == f"{DEFAULT_CATEGORY}-0.json"
+
+
+def test_by_category(tmp_path):
+    first, second = list(WORD_CATEGORIES)[:2]
+    words = [kannada for kannada, _, _ in WORD_CATEGORIES[first][:3]]
+    words += [kannada for kannada, _, _ in WORD_CATEGORIES[second][:2]]
+    words.append("ಅಜ್ಞಾತಪದ")
+    lookup = category_lookup()
+    assert [lookup.get(word) for word in words[:3]] == [first] * 3
+
+    entries = make_entries(words)
+    # Interleave the categories so several shards are open at once
+    order = [0, 3, 5, 1, 4, 2]
+    shard_dictionary(
+        [entries[i] for i in order], str(tmp_path), 2, by_category=True
+    )
+
+    manifest, decoded = read_shards(str(tmp_path))
+    assert sorted(decoded, key=entries.index) == entries
+    for shard in manifest["shards"]:
+        data = load(os.path.join(str(tmp_path), shard["file"]))
+        for entry in decode_compact_dictionary(data):
+            assert lookup.get(entry["kn"], DEFAULT_CATEGORY) == (
+                shard["category"]
+            )
+        assert shard["file"].startswith(shard["category"] + "-")
+    counts = {}
+    for shard in manifest["shards"]:
+        counts[shard["category"]] = counts.get(shard["category"], 0) + 1
+    assert counts[lookup[words[0]]] == 2
+    assert counts[DEFAULT_CATEGORY] == 1
+
+
+def test_stale_shards_are_removed(tmp_path):
+    entries = make_entries(f"ಪದ{index}" for index in range(10))
+    shard_dictionary(entries, str(tmp_path), 2)
+    (tmp_path / "notes.txt").write_text("keep")
+    shard_dictionary(entries[:3], str(tmp_path), 2)
+    assert sorted(os.listdir(tmp_path)) == [
+        SHARD_MANIFEST_NAME,
+        "notes.txt",
+        f"{DEFAULT_CATEGORY}-0.json",
+        f"{DEFAULT_CATEGORY}-1.json",
+    ]
+    assert read_shards(str(tmp_path))[1] == entries[:3]
+
+
+def test_failed_build_keeps_previous_manifest(tmp_path):
+    entries = make_entries(f"ಪದ{index}" for index in range(4))
+    shard_dictionary(entries, str(tmp_path), 2)
+    before = (tmp_path / SHARD_MANIFEST_NAME).read_bytes()
+
+    with pytest.raises(KeyError):
+        with ShardedDictionaryWriter(str(tmp_path), 2) as writer:
+            writer.add(entries[0])
+            writer.add({"kn": "ಅ"})
+    assert (tmp_path / SHARD_MANIFEST_NAME).read_bytes() == before
+    assert read_shards(str(tmp_path))[1] == entries
+
+
+def test_empty_dictionary(tmp_path):
+    shard_dir = tmp_path / "shards"
+    assert shard_dictionary([], str(shard_dir)) == []
+    assert read_shards(str(shard_dir)) == (
+        {"version": SHARD_MANIFEST_VERSION, "total": 0, "shards": []},
+        [],
+    )
+
+
+def test_invalid_shard_size(tmp_path):
+    with pytest.raises(ValueError):
+        ShardedDictionaryWriter(str(tmp_path), 0)
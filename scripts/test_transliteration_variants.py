@@ -0,0 +1,127 @@
+"""Tests for transliteration_variants.py."""
+
+import functools
+import json
+
+import pytest
+
+from transliteration_variants import (
+    MAX_VARIANTS,
+    VariantsWriter,
+    compile_rules,
+    expand_variants,
+    rank_variants,
+)
+
+
+def brute_force(transliteration, table):
+    """Map every spelling, unchanged one included, to its substitutions."""
+
+    @functools.lru_cache(maxsize=None)
+    def suffix(pos):
+        if pos == len(transliteration):
+            return {"": 0}
+        results = {
+            transliteration[pos] + rest: count
+            for rest, count in suffix(pos + 1).items()
+        }
+        for spelling, alternatives in table.items():
+            if transliteration.startswith(spelling, pos):
+                for rest, count in suffix(pos + len(spelling)).items():
+                    for alternative in alternatives:
+                        variant = alternative + rest
+                        results[variant] = min(
+                            results.get(variant, count + 1), count + 1
+                        )
+        return results
+
+    return dict(suffix(0))
+
+
+def test_compile_rules():
+    table = compile_rules(["long_vowels", "casual"])
+    assert table["ii"] == {"i", "ee"}
+    assert "sh" not in table
+    with pytest.raises(ValueError):
+        compile_rules(["klingon"])
+
+
+@pytest.mark.parametrize(
+    "transliteration, rules, expected",
+    [
+        ("kaa", ["long_vowels", "iso"], ["ka", "kā"]),
+        ("shii", ["long_vowels", "sibilants"], ["shi", "si", "sii"]),
+        ("chhii", ["casual"], ["chee", "chhee", "chii"]),
+        ("ka", ["long_vowels", "casual", "sibilants", "iso"], []),
+        ("", ["long_vowels"], []),
+    ],
+)
+def test_expand_variants(transliteration, rules, expected):
+    assert expand_variants(transliteration, compile_rules(rules)) == expected
+
+
+def test_overlapping_substitutions():
+    # Either "a" of "aa" may change on its own, or both together, but a
+    # substituted spelling is not substituted again
+    table = {"aa": {"a"}, "a": {"e"}}
+    assert expand_variants("aa", table) == ["a", "ae", "ea", "ee"]
+
+
+def test_expansion_matches_brute_force():
+    table = compile_rules()
+    for transliteration in ("namaskaara", "shruuti", "chhaayaa", "kshii"):
+        expected = brute_force(transliteration, table)
+        del expected[transliteration]
+        variants, truncated = rank_variants(transliteration, table, 10**6)
+        assert variants == sorted(expected)
+        assert not truncated
+
+
+@pytest.mark.parametrize("limit", [1, 5, 40])
+def test_cap_keeps_fewest_substitutions(limit):
+    table = compile_rules()
+    transliteration = "shiivaaruuchhaa"
+    ranked = brute_force(transliteration, table)
+    del ranked[transliteration]
+    best = sorted(ranked.items(), key=lambda item: (item[1], item[0]))
+
+    variants, truncated = rank_variants(transliteration, table, limit)
+    assert truncated
+    assert variants == sorted(spelling for spelling, _ in best[:limit])
+    # No kept spelling needs more substitutions than a dropped one
+    kept = max(ranked[spelling] for spelling in variants)
+    assert all(count >= kept for _, count in best[limit:])
+
+
+def test_default_cap():
+    variants, truncated = rank_variants("aaiiuueeooaaiiuu", compile_rules())
+    assert truncated
+    assert len(variants) == MAX_VARIANTS
+    assert "aiiuueeooaaiiuu" in variants
+    assert len(expand_variants("aaiiuueeooaaiiuu", compile_rules())) == (
+        MAX_VARIANTS
+    )
+
+
+def test_writer_counts_truncated_segments(tmp_path):
+    path = tmp_path / "dictionary.variants.json"
+    entry = {
+        "kn": "",
+        "tr": "",
+        "en": "",
+        "segments": [
+            {"kn": "", "tr": "kaa"},
+            {"kn": "", "tr": "kaa"},
+            {"kn": "", "tr": "ka"},
+            {"kn": "", "tr": "aaiiuueeooaaiiuu"},
+        ],
+    }
+    with VariantsWriter(str(path), ["long_vowels", "iso"]) as writer:
+        writer.add(entry)
+    assert writer.truncated == 1
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["rules"] == ["long_vowels", "iso"]
+    assert data["variants"]["kaa"] == ["ka", "kā"]
+    assert "ka" not in data["variants"]
+    assert len(data["variants"]["aaiiuueeooaaiiuu"]) == MAX_VARIANTS
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Accepted transliteration variants for lenient answer checking.
+
+The dictionary data spells the same sounds in different ways (``ii`` and
+``ee``, ``aa`` and ``a``, ``sh`` and ``s``), so a learner typing a valid
+romanization can be marked wrong. This script expands every distinct
+segment transliteration into the full set of spellings accepted under a
+configurable set of equivalence rules and writes them for the web client:
+
+    {"version": 1, "rules": ["long_vowels", ...],
+     "variants": {"kaa": ["ka", "kā"], ...}}
+
+The client turns each list into a Set once at load time, so checking an
+answer is a single hash lookup with no rule evaluation per keystroke.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+import profiling
+from dictionary_io import atomic_write, iter_dictionary
+
+VARIANTS_VERSION = 1
+
+# Each rule maps a spelling used in the data to the spellings that may be
+# typed instead of it
+VARIANT_RULES = {
+    # Long vowels may be typed short
+    "long_vowels": {
+        "aa": ("a",),
+        "ii": ("i",),
+        "uu": ("u",),
+        "ee": ("e",),
+        "oo": ("o",),
+    },
+    # Common casual English-keyboard spellings
+    "casual": {
+        "ii": ("ee",),
+        "uu": ("oo",),
+        "chh": ("ch",),
+        "ru": ("ri",),
+    },
+    # Sibilants ಶ and ಷ may be typed as plain s
+    "sibilants": {
+        "sh": ("s",),
+    },
+    # ISO 15919 style letters with diacritics
+    "iso": {
+        "aa": ("ā",),
+        "ii": ("ī",),
+        "uu": ("ū",),
+        "ee": ("ē",),
+        "oo": ("ō",),
+        "ru": ("r̥",),
+        "ch": ("c",),
+        "sh": ("ś", "ṣ"),
+    },
+}
+
+DEFAULT_RULES = tuple(VARIANT_RULES)
+
+# Upper bound on the variants kept for a single segment; those with the
+# fewest substitutions are kept
+MAX_VARIANTS = 256
+
+_SEPARATORS = (",", ":")
+
+
+def variants_path_for(dict_path):
+    """Get the variants file path that belongs to a dictionary file."""
+    root, _ = os.path.splitext(dict_path)
+    return root + ".variants.json"
+
+
+def compile_rules(rule_names=DEFAULT_RULES):
+    """Merge the named rules into one spelling -> alternatives table."""
+    table = {}
+    for name in rule_names:
+        if name not in VARIANT_RULES:
+            raise ValueError(f"Unknown variant rule: {name!r}")
+        for spelling, alternatives in VARIANT_RULES[name].items():
+            table.setdefault(spelling, set()).update(alternatives)
+    return table
+
+
+def _closest(variants, count):
+    """Keep the ``count`` variants with the fewest substitutions."""
+    return dict(
+        heapq.nsmallest(
+            count, variants.items(), key=lambda item: (item[1], item[0])
+        )
+    )
+
+
+def rank_variants(transliteration, table, limit=MAX_VARIANTS):
+    """
+    Expand a transliteration into at most ``limit`` other spellings.
+
+    Returns ``(variants, truncated)``: the sorted spellings that need the
+    fewest substitutions, ties broken alphabetically, and whether any
+    were dropped to stay within the limit.
+
+    Substitutions can start at any position and overlap in any way, so
+    all combinations are generated by memoizing the variants of each
+    suffix, mapped to their substitution count. A suffix only needs its
+    best ``limit + 1`` variants (the extra one being the unchanged
+    suffix), since any other completion is beaten by all of them.
+    """
+    spellings = sorted(table, key=len, reverse=True)
+    keep = limit + 1
+    suffixes = [None] * len(transliteration) + [{"": 0}]
+    truncated = False
+
+    for pos in range(len(transliteration) - 1, -1, -1):
+        results = {
+            transliteration[pos] + rest: count
+            for rest, count in suffixes[pos + 1].items()
+        }
+        for spelling in spellings:
+            if transliteration.startswith(spelling, pos):
+                tails = suffixes[pos + len(spelling)]
+                for alternative in table[spelling]:
+                    for rest, count in tails.items():
+                        variant = alternative + rest
+                        previous = results.get(variant)
+                        if previous is None or previous > count + 1:
+                            results[variant] = count + 1
+        if len(results) > keep:
+            truncated = True
+            results = _closest(results, keep)
+        suffixes[pos] = results
+
+    variants = suffixes[0]
+    del variants[transliteration]
+    if len(variants) > limit:
+        truncated = True
+        variants = _closest(variants, limit)
+    return sorted(variants), truncated
+
+
+def expand_variants(transliteration, table):
+    """
+    Return every accepted spelling of a transliteration, excluding itself,
+    up to the MAX_VARIANTS with the fewest substitutions.
+    """
+    return rank_variants(transliteration, table)[0]
+
+
+class VariantsWriter:
+    """
+    Streaming sink that writes the accepted variants of every distinct
+    segment transliteration it sees.
+    """
+
+    def __init__(self, path, rule_names=DEFAULT_RULES):
+        self.path = path
+        self.rule_names = list(rule_names)
+        self._table = compile_rules(rule_names)
+        self._variants = {}
+        self.truncated = 0
+
+    def __enter__(self):
+        return self
+
+    def add(self, entry):
+        """Expand the segments of one dictionary entry."""
+        for segment in entry["segments"]:
+            transliteration = segment["tr"]
+            if transliteration not in self._variants:
+                variants, truncated = rank_variants(
+                    transliteration, self._table
+                )
+                self._variants[transliteration] = variants
+                self.truncated += truncated
+
+    def __exit__(self, exc_type, exc, traceback):
+        if exc_type is None:
+            data = {
+                "version": VARIANTS_VERSION,
+                "rules": self.rule_names,
+                "variants": {
+                    transliteration: variants
+                    for transliteration, variants in sorted(
+                        self._variants.items()
+                    )
+                    if variants
+                },
+            }
+            with atomic_write(self.path) as f:
+                json.dump(data, f, ensure_ascii=False, separators=_SEPARATORS)
+        return False
+
+
+def main():
+    """Write accepted variants for data/dictionary.json (or a given file)."""
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(
+        description="Precompute accepted transliteration variants."
+    )
+    parser.add_argument(
+        "input",
+        nargs="?",
+        default=os.path.join(base_dir, "data", "dictionary.json"),
+        help="dictionary file to expand",
+    )
+    parser.add_argument(
+        "--rules",
+        nargs="*",
+        choices=sorted(VARIANT_RULES),
+        default=list(DEFAULT_RULES),
+        help="equivalence rules to apply (default: all)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print per-stage timings",
+    )
+    args = parser.parse_args()
+    if args.profile:
+        profiling.enable_profiling()
+
+    variants_path = variants_path_for(args.input)
+    entries = profiling.timed_iter("load", iter_dictionary(args.input))
+    with profiling.stage("serialize"):
+        with VariantsWriter(variants_path, args.rules) as writer:
+            for entry in entries:
+                writer.add(entry)
+
+    print(f"Accepted variants saved to: {variants_path}")
+    print(f"Rules: {', '.join(args.rules) or 'none'}")
+    if writer.truncated:
+        print(
+            f"Kept the {MAX_VARIANTS} closest variants of "
+            f"{writer.truncated} segments"
+        )
+    profiling.print_summary()
+
+
+if __name__ == "__main__":
+    main()
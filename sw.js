@@ -0,0 +1,112 @@
+// Service worker for offline use and zero-refetch repeat visits.
+//
+// Precaches the app shell and the content-hashed data files listed in
+// data/assets.json and serves them cache-first. The asset manifest itself
+// is fetched network-first; when its hash differs from the cached
+// version, the new files are precached into a fresh cache and the old one
+// is dropped, so files are only downloaded again after a rebuild changed
+// them.
+
+const CACHE_PREFIX = "kannada-coach-";
+const ASSET_MANIFEST_URL = "data/assets.json";
+const DATA_DIR = "data/";
+const SHELL_URLS = [
+    "./",
+    "index.html",
+    "assets/css/style.css",
+    "assets/js/script.js",
+];
+
+const manifestPath = new URL(ASSET_MANIFEST_URL, self.location).pathname;
+
+/**
+ * Precache every file of a manifest version
+ * @param {Object} manifest - Parsed asset manifest
+ * @param {Response} response - Manifest response to store with the files
+ * @returns {Promise<void>}
+ */
+async function precache(manifest, response) {
+    const cacheName = CACHE_PREFIX + manifest.hash;
+    if (await caches.has(cacheName)) return;
+
+    const cache = await caches.open(cacheName);
+    const dataURLs = Object.values(manifest.assets || {}).map(
+        (file) => DATA_DIR + file
+    );
+    try {
+        // The shell URLs are not hashed, so bypass the HTTP cache for them
+        await cache.addAll(
+            SHELL_URLS.map((url) => new Request(url, { cache: "reload" }))
+        );
+        await cache.addAll(dataURLs);
+        await cache.put(ASSET_MANIFEST_URL, response);
+    } catch (error) {
+        // Never keep a partial version around
+        await caches.delete(cacheName);
+        throw error;
+    }
+
+    const names = await caches.keys();
+    const stale = names.filter(
+        (name) => name.startsWith(CACHE_PREFIX) && name !== cacheName
+    );
+    await Promise.all(stale.map((name) => caches.delete(name)));
+}
+
+/**
+ * Fetch the manifest from the network and precache its version
+ * @returns {Promise<Response>} Manifest response
+ */
+async function updateFromNetwork() {
+    const response = await fetch(ASSET_MANIFEST_URL, { cache: "no-cache" });
+    if (response.ok) {
+        const manifest = await response.clone().json();
+        await precache(manifest, response.clone());
+    }
+    return response;
+}
+
+self.addEventListener("install", (event) => {
+    event.waitUntil(updateFromNetwork().then(() => self.skipWaiting()));
+});
+
+self.addEventListener("activate", (event) => {
+    event.waitUntil(self.clients.claim());
+});
+
+self.addEventListener("fetch", (event) => {
+    const request = event.request;
+    const url = new URL(request.url);
+    if (request.method !== "GET" || url.origin !== self.location.origin) {
+        return;
+    }
+
+    if (url.pathname === manifestPath) {
+        // Network first, so a new build is noticed on the next load
+        event.respondWith(
+            fetch(request, { cache: "no-cache" })
+                .then((response) => {
+                    if (response.ok) {
+                        const parsed = response.clone();
+                        const stored = response.clone();
+                        event.waitUntil(
+                            parsed
+                                .json()
+                                .then((manifest) => precache(manifest, stored))
+                                .catch(() => {})
+                        );
+                    }
+                    return response;
+                })
+                .catch(() => caches.match(ASSET_MANIFEST_URL))
+        );
+        return;
+    }
+
+    // Cache first; the hashed data files never change
+    event.respondWith(
+        caches
+            .match(request, { ignoreSearch: true })
+            .then((cached) => cached || fetch(request))
+    );
+});